@@ -0,0 +1,381 @@
+"""Local fake of the Fineract self-service API used by the benchmarks.
+
+Serves deterministic, realistically shaped payloads for the ``/self/...`` endpoints
+the routers call, with configurable latency, jitter, error rate and payload size.
+
+    python -m benchmarks.fake_fineract --port 8081 --latency-ms 20 --jitter-ms 10
+"""
+
+import argparse
+import asyncio
+import base64
+import random
+import re
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+API_BASE_PATH = "/fineract-provider/api/v1"
+CURRENCY = {"code": "USD", "name": "US Dollar", "decimalPlaces": 2, "displaySymbol": "$"}
+ACTIVE = {"id": 300, "code": "savingsAccountStatusType.active", "value": "Active", "active": True}
+LOAN_ACTIVE = {"id": 300, "code": "loanStatusType.active", "value": "Active", "active": True}
+
+
+class FakeSettings(NamedTuple):
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    accounts_per_client: int = 3
+    transactions_per_account: int = 200
+    padding_bytes: int = 0
+    seed: int = 7
+
+
+def _day(offset: int) -> List[int]:
+    day = date(2024, 1, 1) + timedelta(days=offset)
+    return [day.year, day.month, day.day]
+
+
+class FakeFineract:
+    """Payload generators keyed by resource id, so repeated calls return identical data."""
+
+    def __init__(self, settings: FakeSettings):
+        self.settings = settings
+        self.requests = 0
+        self.errors = 0
+        self._next_resource_id = 1000
+        self._random = random.Random(settings.seed)
+
+    def _rng(self, *key: Any) -> random.Random:
+        return random.Random(":".join(map(str, (self.settings.seed,) + key)))
+
+    def _padding(self) -> str:
+        return "x" * self.settings.padding_bytes
+
+    def client(self, client_id: int) -> Dict[str, Any]:
+        return {
+            "id": client_id,
+            "accountNo": f"{client_id:09d}",
+            "displayName": f"Client {client_id}",
+            "firstname": "Client",
+            "lastname": str(client_id),
+            "officeName": "Head Office",
+            "mobileNo": "5550100",
+            "status": {"id": 300, "code": "clientStatusType.active", "value": "Active"},
+            "activationDate": _day(0),
+            "notes": self._padding(),
+        }
+
+    def account_ids(self, client_id: int) -> List[int]:
+        return [client_id * 100 + n for n in range(1, self.settings.accounts_per_client + 1)]
+
+    def savings_account(self, savings_id: int, with_transactions: bool) -> Dict[str, Any]:
+        rng = self._rng("savings", savings_id)
+        account = {
+            "id": savings_id,
+            "accountNo": f"{savings_id:09d}",
+            "clientId": savings_id // 100,
+            "productName": "Basic Savings",
+            "status": ACTIVE,
+            "currency": CURRENCY,
+            "summary": {
+                "accountBalance": round(rng.uniform(100, 10000), 2),
+                "availableBalance": round(rng.uniform(100, 10000), 2),
+                "totalDeposits": round(rng.uniform(1000, 50000), 2),
+                "totalWithdrawals": round(rng.uniform(100, 40000), 2),
+            },
+        }
+        if with_transactions:
+            account["transactions"] = self.transactions(savings_id, "savings")
+        return account
+
+    def transactions(self, account_id: int, source: str) -> List[Dict[str, Any]]:
+        rng = self._rng(source, "transactions", account_id)
+        count = self.settings.transactions_per_account
+        balance = 0.0
+        items = []
+        for n in range(count):
+            deposit = rng.random() < 0.55
+            amount = round(rng.uniform(5, 500), 2)
+            balance += amount if deposit else -amount
+            items.append(
+                {
+                    "id": account_id * 10000 + n + 1,
+                    "transactionType": {
+                        "id": 1 if deposit else 2,
+                        "code": (
+                            "savingsAccountTransactionType.deposit"
+                            if deposit
+                            else "savingsAccountTransactionType.withdrawal"
+                        ),
+                        "value": "Deposit" if deposit else "Withdrawal",
+                        "deposit": deposit,
+                        "withdrawal": not deposit,
+                    },
+                    "date": _day(n * 365 // max(count, 1)),
+                    "amount": amount,
+                    "runningBalance": round(balance, 2),
+                    "reversed": False,
+                    "currency": CURRENCY,
+                    "paymentDetailData": {"paymentType": {"id": 1, "name": "Cash"}},
+                    "note": self._padding(),
+                }
+            )
+        return list(reversed(items))
+
+    def loan_account(self, loan_id: int) -> Dict[str, Any]:
+        rng = self._rng("loan", loan_id)
+        principal = round(rng.uniform(1000, 20000), 2)
+        return {
+            "id": loan_id,
+            "accountNo": f"{loan_id:09d}",
+            "clientId": loan_id // 100,
+            "productName": "Personal Loan",
+            "status": LOAN_ACTIVE,
+            "currency": CURRENCY,
+            "principal": principal,
+            "inArrears": rng.random() < 0.1,
+            "summary": {
+                "principalOutstanding": round(principal * 0.6, 2),
+                "totalOutstanding": round(principal * 0.7, 2),
+                "totalOverdue": 0.0,
+            },
+            "transactions": self.transactions(loan_id, "loan")[:12],
+        }
+
+    def client_accounts(self, client_id: int) -> Dict[str, Any]:
+        ids = self.account_ids(client_id)
+        savings = [self.savings_account(account_id, False) for account_id in ids[: max(1, len(ids) - 1)]]
+        loans = [self.loan_account(account_id + 50) for account_id in ids[max(1, len(ids) - 1) :]]
+        return {
+            "savingsAccounts": [
+                {**account, "accountBalance": account["summary"]["accountBalance"]} for account in savings
+            ],
+            "loanAccounts": [
+                {
+                    **{k: v for k, v in loan.items() if k != "transactions"},
+                    "loanBalance": loan["summary"]["totalOutstanding"],
+                }
+                for loan in loans
+            ],
+            "shareAccounts": [],
+        }
+
+    def client_transactions(self, client_id: int, offset: int, limit: int) -> Dict[str, Any]:
+        history = self.transactions(client_id, "client")
+        page = [
+            {**txn, "type": txn["transactionType"], "officeName": "Head Office"}
+            for txn in history[offset : offset + limit]
+        ]
+        return {"totalFilteredRecords": len(history), "pageItems": page}
+
+    def charges(self, owner_id: int) -> List[Dict[str, Any]]:
+        rng = self._rng("charges", owner_id)
+        return [
+            {
+                "id": owner_id * 10 + n,
+                "name": f"Fee {n}",
+                "amount": round(rng.uniform(1, 50), 2),
+                "amountOutstanding": round(rng.uniform(0, 20), 2),
+                "dueDate": _day(30 * n),
+                "currency": CURRENCY,
+            }
+            for n in range(1, 4)
+        ]
+
+    def products(self, kind: str) -> List[Dict[str, Any]]:
+        return [
+            {"id": n, "name": f"{kind.title()} product {n}", "currency": CURRENCY, "description": self._padding()}
+            for n in range(1, 6)
+        ]
+
+    def beneficiaries(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": n,
+                "name": f"Beneficiary {n}",
+                "officeName": "Head Office",
+                "clientName": f"Client {n}",
+                "accountType": {"id": 2, "code": "accountType.savings", "value": "Savings Account"},
+                "accountNumber": f"{n:09d}",
+                "transferLimit": 1000,
+            }
+            for n in range(1, 6)
+        ]
+
+    def created(self) -> Dict[str, Any]:
+        self._next_resource_id += 1
+        return {"resourceId": self._next_resource_id}
+
+
+Handler = Callable[[FakeFineract, Dict[str, str], Dict[str, str], Any], Any]
+
+
+def _routes() -> List[Tuple[str, Pattern[str], Handler]]:
+    def page(items: List[Any]) -> Dict[str, Any]:
+        return {"totalFilteredRecords": len(items), "pageItems": items}
+
+    def authentication(fake: FakeFineract, params: Dict[str, str], query: Dict[str, str], body: Any) -> Any:
+        body = body or {}
+        key = base64.b64encode(f"{body.get('username')}:{body.get('password')}".encode()).decode()
+        return {
+            "username": body.get("username"),
+            "userId": 1,
+            "base64EncodedAuthenticationKey": key,
+            "authenticated": True,
+            "clients": [1],
+            "roles": [{"id": 2, "name": "Self Service User"}],
+            "permissions": ["ALL_FUNCTIONS_READ"],
+        }
+
+    def savings(fake: FakeFineract, params: Dict[str, str], query: Dict[str, str], body: Any) -> Any:
+        return fake.savings_account(int(params["id"]), "transactions" in query.get("associations", ""))
+
+    def schedule(fake: FakeFineract, params: Dict[str, str], query: Dict[str, str], body: Any) -> Any:
+        body = body or {}
+        periods = int(body.get("numberOfRepayments") or 12)
+        principal = float(body.get("principal") or 1000)
+        return {
+            "totalPrincipalExpected": principal,
+            "periods": [
+                {"period": n, "dueDate": _day(30 * n), "principalDue": round(principal / periods, 2)}
+                for n in range(1, periods + 1)
+            ],
+        }
+
+    def client_transactions(fake: FakeFineract, params: Dict[str, str], query: Dict[str, str], body: Any) -> Any:
+        offset, limit = int(query.get("offset", 0)), int(query.get("limit", 20))
+        return fake.client_transactions(int(params["id"]), offset, limit)
+
+    def transaction(source: str) -> Handler:
+        def handler(fake: FakeFineract, params: Dict[str, str], query: Dict[str, str], body: Any) -> Any:
+            for txn in fake.transactions(int(params["id"]), source):
+                if txn["id"] == int(params["txn"]):
+                    return txn
+            return None
+
+        return handler
+
+    return [
+        ("POST", re.compile(r"^/self/authentication$"), authentication),
+        ("GET", re.compile(r"^/self/clients$"), lambda f, p, q, b: page([f.client(1)])),
+        ("GET", re.compile(r"^/self/clients/(?P<id>\d+)$"), lambda f, p, q, b: f.client(int(p["id"]))),
+        (
+            "GET",
+            re.compile(r"^/self/clients/(?P<id>\d+)/accounts$"),
+            lambda f, p, q, b: f.client_accounts(int(p["id"])),
+        ),
+        ("GET", re.compile(r"^/self/clients/(?P<id>\d+)/charges$"), lambda f, p, q, b: page(f.charges(int(p["id"])))),
+        ("GET", re.compile(r"^/self/clients/(?P<id>\d+)/images$"), lambda f, p, q, b: []),
+        ("GET", re.compile(r"^/self/clients/(?P<id>\d+)/transactions$"), client_transactions),
+        ("GET", re.compile(r"^/self/clients/(?P<id>\d+)/transactions/(?P<txn>\d+)$"), transaction("client")),
+        (
+            "GET",
+            re.compile(r"^/self/savingsaccounts/template$"),
+            lambda f, p, q, b: {"productOptions": f.products("savings")},
+        ),
+        ("GET", re.compile(r"^/self/savingsaccounts/(?P<id>\d+)$"), savings),
+        ("GET", re.compile(r"^/self/savingsaccounts/(?P<id>\d+)/charges$"), lambda f, p, q, b: f.charges(int(p["id"]))),
+        ("GET", re.compile(r"^/self/savingsaccounts/(?P<id>\d+)/transactions/(?P<txn>\d+)$"), transaction("savings")),
+        ("GET", re.compile(r"^/self/loans/template$"), lambda f, p, q, b: {"productOptions": f.products("loan")}),
+        ("GET", re.compile(r"^/self/loans/(?P<id>\d+)$"), lambda f, p, q, b: f.loan_account(int(p["id"]))),
+        ("GET", re.compile(r"^/self/loans/(?P<id>\d+)/charges$"), lambda f, p, q, b: f.charges(int(p["id"]))),
+        ("GET", re.compile(r"^/self/loans/(?P<id>\d+)/transactions/(?P<txn>\d+)$"), transaction("loan")),
+        ("GET", re.compile(r"^/self/loans/(?P<id>\d+)/guarantors(/template)?$"), lambda f, p, q, b: []),
+        (
+            "POST",
+            re.compile(r"^/self/loans$"),
+            lambda f, p, q, b: schedule(f, p, q, b) if q.get("command") == "calculateLoanSchedule" else f.created(),
+        ),
+        ("GET", re.compile(r"^/self/loanproducts$"), lambda f, p, q, b: f.products("loan")),
+        ("GET", re.compile(r"^/self/savingsproducts$"), lambda f, p, q, b: f.products("savings")),
+        ("GET", re.compile(r"^/self/products/share$"), lambda f, p, q, b: page(f.products("share"))),
+        ("GET", re.compile(r"^/self/beneficiaries/tpt$"), lambda f, p, q, b: f.beneficiaries()),
+        ("GET", re.compile(r"^/self/beneficiaries/tpt/template$"), lambda f, p, q, b: {"accountTypeOptions": []}),
+        (
+            "GET",
+            re.compile(r"^/self/accounttransfers/template$"),
+            lambda f, p, q, b: {"fromAccountOptions": [], "toAccountOptions": []},
+        ),
+        (
+            "GET",
+            re.compile(r"^/self/device/registration/client/(?P<id>\d+)$"),
+            lambda f, p, q, b: {"registrationId": "fake"},
+        ),
+    ]
+
+
+ROUTES = _routes()
+WRITE_METHODS = {"POST", "PUT", "DELETE"}
+
+
+def create_app(settings: FakeSettings = FakeSettings()) -> Starlette:
+    """Build the ASGI app; ``app.state.fake`` exposes request and error counters."""
+    fake = FakeFineract(settings)
+
+    async def dispatch(request: Request) -> Response:
+        fake.requests += 1
+        delay = settings.latency_ms + fake._random.uniform(-settings.jitter_ms, settings.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if settings.error_rate and fake._random.random() < settings.error_rate:
+            fake.errors += 1
+            return JSONResponse({"developerMessage": "Injected failure"}, status_code=503)
+
+        path = "/" + request.path_params["path"]
+        body: Optional[Any] = None
+        if request.method in WRITE_METHODS:
+            raw = await request.body()
+            body = await request.json() if raw else None
+        for method, pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match and method == request.method:
+                result = handler(fake, match.groupdict(), dict(request.query_params), body)
+                if result is None:
+                    break
+                return JSONResponse(result)
+        if request.method in WRITE_METHODS:
+            return JSONResponse(fake.created())
+        return JSONResponse({"developerMessage": f"No fake for {request.method} {path}"}, status_code=404)
+
+    app = Starlette(routes=[Route(API_BASE_PATH + "/{path:path}", dispatch, methods=["GET", "POST", "PUT", "DELETE"])])
+    app.state.fake = fake
+    return app
+
+
+def settings_from_args(args: argparse.Namespace) -> FakeSettings:
+    return FakeSettings(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        accounts_per_client=args.accounts,
+        transactions_per_account=args.transactions,
+        padding_bytes=args.padding_bytes,
+    )
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="mean added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="uniform +/- jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--accounts", type=int, default=3, help="accounts per client")
+    parser.add_argument("--transactions", type=int, default=200, help="transactions per account")
+    parser.add_argument("--padding-bytes", type=int, default=0, help="filler added to every record")
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(settings_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Requests per second of the streamable HTTP transport by uvicorn worker count.
+
+For each worker count, starts ``main.py --transport streamable-http --workers N``
+against one shared fake Fineract, drives ``tools/call`` requests from concurrent
+clients (the mix in ``benchmarks.load.SCENARIOS``) and prints a row per run.
+
+    python -m benchmarks.http_workers --workers 1 2 4 --concurrency 64 --duration 15
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+import httpx
+from benchmarks.fake_fineract import add_server_arguments
+from benchmarks.load import CREDENTIALS, SCENARIOS, _free_port, start_fake_server, summarize
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+def start_mcp_server(workers: int, fineract_url: str) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {**os.environ, "MIFOS_BASE_URL": fineract_url, "MIFOS_STATELESS_HTTP": "true"}
+    command = [sys.executable, "main.py", "--transport", "streamable-http", "--port", str(port)]
+    process = subprocess.Popen(
+        command + ["--workers", str(workers)], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{url}/metrics", timeout=1)
+            return process, url
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"MCP server with {workers} workers did not start")
+
+
+async def drive(url: str, concurrency: int, duration: float, warmup: float, users: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    weights = [weight for weight, _, _ in SCENARIOS]
+    latencies: List[float] = []
+    errors = 0
+    measuring = False
+    stop_at = time.perf_counter() + warmup + duration
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        request_id = 0
+        while time.perf_counter() < stop_at:
+            _, name, arguments = rng.choices(SCENARIOS, weights)[0]
+            request_id += 1
+            payload = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {"name": name, "arguments": {**arguments(rng.randint(1, users)), **CREDENTIALS}},
+            }
+            started = time.perf_counter()
+            try:
+                response = await client.post(f"{url}/mcp", json=payload, headers=MCP_HEADERS)
+                body = response.json()
+                failed = response.status_code != 200 or "error" in body or body["result"].get("isError", False)
+            except (httpx.HTTPError, ValueError):
+                failed = True
+            if measuring:
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+
+    async def end_warmup() -> None:
+        nonlocal measuring
+        await asyncio.sleep(warmup)
+        measuring = True
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        await asyncio.gather(end_warmup(), *(worker(client) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started - warmup
+    return {"rps": round(len(latencies) / elapsed, 1), "errors": errors, **summarize(latencies)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure requests/s of the HTTP transport by worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    fake, fineract_url = start_fake_server(args)
+    print(f"cpus {os.cpu_count()}  concurrency {args.concurrency}  upstream latency {args.latency_ms} ms")
+    if max(args.workers) >= (os.cpu_count() or 1):
+        print("note: workers share the cores with the fake and the load driver; rows past that show no scaling")
+    print(f"{'workers':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    try:
+        for workers in args.workers:
+            server, url = start_mcp_server(workers, fineract_url)
+            try:
+                result = asyncio.run(drive(url, args.concurrency, args.duration, args.warmup, args.users, args.seed))
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait()
+            print(
+                f"{workers:>7} {result['rps']:>8} {result['p50_ms']:>8} {result['p95_ms']:>8} "
+                f"{result['p99_ms']:>8} {result['errors']:>7}"
+            )
+    finally:
+        fake.terminate()
+        fake.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Decode/encode timings of the installed JSON backends on large Fineract payloads.
+
+Payloads come from the fake server: a savings account with its full transaction
+history (``associations=transactions``) and a client's accounts overview.
+
+    python -m benchmarks.json_codecs --transactions 2000 --repeat 50
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+from benchmarks.fake_fineract import FakeFineract, FakeSettings
+from utils.jsoncodec import BACKENDS, JsonCodec, select_codec
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure(codec: JsonCodec, payloads: Dict[str, Any], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, payload in payloads.items():
+        body = select_codec("json").dumps(payload)
+        results[name] = {
+            "bytes": len(body),
+            "decode_ms": round(_best_of(lambda: codec.loads(body), repeat) * 1000, 3),
+            "encode_ms": round(_best_of(lambda: codec.dumps(payload), repeat) * 1000, 3),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON backends on Fineract-shaped payloads")
+    parser.add_argument("--transactions", type=int, default=2000, help="transactions in the savings history")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    fake = FakeFineract(FakeSettings(transactions_per_account=args.transactions, accounts_per_client=10))
+    payloads = {
+        "savings_with_transactions": fake.savings_account(101, True),
+        "client_accounts": fake.client_accounts(1),
+    }
+
+    print(f"{'backend':10} {'payload':28} {'KiB':>8} {'decode ms':>10} {'encode ms':>10}")
+    for name, factory in BACKENDS.items():
+        try:
+            codec = factory()
+        except ImportError:
+            print(f"{name:10} (not installed)")
+            continue
+        for payload, stats in measure(codec, payloads, args.repeat).items():
+            print(
+                f"{name:10} {payload:28} {stats['bytes'] / 1024:>8.1f} "
+                f"{stats['decode_ms']:>10} {stats['encode_ms']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Load generator driving the MCP tools against the fake Fineract server.
+
+Starts ``benchmarks.fake_fineract`` on a free local port (or uses ``--base-url``),
+runs a weighted mix of tool calls from concurrent simulated users and reports
+throughput, p50/p95/p99 latency per tool, error counts and memory.
+
+    python -m benchmarks.load --concurrency 32 --duration 20 --json results.json
+    python -m benchmarks.load --baseline results.json   # exit 1 on regression
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
+from benchmarks.fake_fineract import add_server_arguments, create_app, settings_from_args
+
+CREDENTIALS = {"username": "bench", "password": "bench"}
+
+Scenario = Tuple[float, str, Callable[[int], Dict[str, Any]]]
+
+# (weight, tool, arguments for a client id); account ids follow the fake's numbering
+SCENARIOS: List[Scenario] = [
+    (3.0, "get_client_details", lambda client: {"client_id": client}),
+    (3.0, "get_client_accounts", lambda client: {"client_id": client}),
+    (2.0, "get_client_dashboard", lambda client: {"client_id": client, "transactions_limit": 5}),
+    (2.0, "get_savings_account_details", lambda client: {"savings_id": client * 100 + 1}),
+    (
+        2.0,
+        "get_savings_account_transactions",
+        lambda client: {"savings_id": client * 100 + 1, "from_date": "2024-06-01", "limit": 20},
+    ),
+    (1.0, "get_loan_account_details", lambda client: {"loan_id": client * 100 + 53}),
+    (1.0, "get_client_transactions", lambda client: {"client_id": client, "offset": 0, "limit": 20}),
+    (1.0, "get_loan_products", lambda client: {"client_id": client}),
+    (1.0, "get_beneficiary_list", lambda client: {}),
+    (
+        0.5,
+        "transfer_between_accounts",
+        lambda client: {
+            "data": {
+                "fromAccountId": client * 100 + 1,
+                "fromAccountType": 2,
+                "toAccountId": client * 100 + 2,
+                "toAccountType": 2,
+                "transferAmount": 10,
+                "transferDate": "01 January 2025",
+                "transferDescription": "benchmark",
+                "dateFormat": "dd MMMM yyyy",
+                "locale": "en",
+                "fromOfficeId": 1,
+                "fromClientId": client,
+                "toOfficeId": 1,
+                "toClientId": client,
+            }
+        },
+    ),
+]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "calls": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_fake_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    """Run the fake server in a child process so it does not share our event loop."""
+    port = _free_port()
+    command = [sys.executable, "-m", "benchmarks.fake_fineract", "--port", str(port)]
+    for flag in ("latency_ms", "jitter_ms", "error_rate", "accounts", "transactions", "padding_bytes"):
+        command += ["--" + flag.replace("_", "-"), str(getattr(args, flag))]
+    process = subprocess.Popen(command)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/fineract-provider/api/v1/self/loanproducts", timeout=1)
+            return process, base_url
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("fake Fineract server did not start")
+
+
+async def run_load(
+    tools: Dict[str, Any],
+    concurrency: int,
+    duration: float,
+    users: int,
+    warmup: float = 0.0,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    """Call ``tools`` (name -> async callable taking an arguments dict) from concurrent workers."""
+    rng = random.Random(seed)
+    weights = [weight for weight, _, _ in SCENARIOS]
+    latencies: Dict[str, List[float]] = {name: [] for _, name, _ in SCENARIOS}
+    errors: Dict[str, int] = {}
+    measuring = warmup <= 0
+    started = time.perf_counter()
+    stop_at = started + warmup + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < stop_at:
+            _, name, arguments = rng.choices(SCENARIOS, weights)[0]
+            call_started = time.perf_counter()
+            try:
+                result = await tools[name]({**arguments(rng.randint(1, users)), **CREDENTIALS})
+                failed = isinstance(result, dict) and result.get("error") is True
+                status = str(result.get("status_code")) if failed else None
+            except Exception as e:
+                failed, status = True, type(e).__name__
+            if measuring:
+                latencies[name].append(time.perf_counter() - call_started)
+                if failed:
+                    errors[f"{name}:{status}"] = errors.get(f"{name}:{status}", 0) + 1
+
+    async def end_warmup() -> None:
+        nonlocal measuring, started
+        await asyncio.sleep(warmup)
+        measuring, started = True, time.perf_counter()
+
+    if warmup > 0:
+        asyncio.ensure_future(end_warmup())
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    elapsed = time.perf_counter() - started
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 2),
+        "throughput_rps": round(len(all_latencies) / elapsed, 1) if elapsed else 0.0,
+        "errors": sum(errors.values()),
+        "error_breakdown": errors,
+        "overall": summarize(all_latencies),
+        "tools": {name: summarize(values) for name, values in latencies.items() if values},
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Regressions beyond ``max_regression`` (a fraction) in throughput or overall p95/p99."""
+    problems = []
+    if result["throughput_rps"] < baseline["throughput_rps"] * (1 - max_regression):
+        problems.append(f"throughput {result['throughput_rps']} < baseline {baseline['throughput_rps']}")
+    for key in ("p95_ms", "p99_ms"):
+        if result["overall"][key] > baseline["overall"][key] * (1 + max_regression):
+            problems.append(f"{key} {result['overall'][key]} > baseline {baseline['overall'][key]}")
+    return problems
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    lines = [
+        f"concurrency {result['concurrency']}  duration {result['duration_s']}s  "
+        f"throughput {result['throughput_rps']} calls/s  errors {result['errors']}",
+        f"{'tool':40} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+    ]
+    for name, stats in sorted(result["tools"].items()) + [("overall", result["overall"])]:
+        lines.append(f"{name:40} {stats['calls']:>7} {stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+    memory = result.get("memory", {})
+    if memory:
+        lines.append("memory: " + ", ".join(f"{key} {value}" for key, value in memory.items()))
+    if result.get("upstream"):
+        lines.append("upstream: " + ", ".join(f"{key} {value}" for key, value in result["upstream"].items()))
+    return "\n".join(lines)
+
+
+async def _benchmark(args: argparse.Namespace, base_url: str, app: Optional[Any]) -> Dict[str, Any]:
+    # Imported here so MIFOS_BASE_URL is in place before the config module is read
+    import main  # noqa: F401
+    import utils.http as http
+    from mcp_app import mcp
+    from utils.jsoncodec import json_codec
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    if app is not None:
+        http._clients[http.DEFAULT_TENANT] = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url=base_url
+        )
+    tools = {name: mcp._tool_manager.get_tool(name).run for _, name, _ in SCENARIOS}
+
+    async with http.http_lifespan():
+        result = await run_load(tools, args.concurrency, args.duration, args.users, args.warmup, args.seed)
+        pool = http.get_pool_stats()
+    result["upstream"] = {
+        "requests": pool["requests"],
+        "errors": pool["errors"],
+        "retries": pool["retries"],
+        "cache_hit_rate": http.response_cache.stats()["hit_rate"],
+        "json_backend": json_codec.name,
+    }
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive the MCP tools against a fake Fineract server")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent simulated callers")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before measuring")
+    parser.add_argument("--users", type=int, default=50, help="distinct client ids to spread calls over")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--base-url", help="use an already running Fineract (or fake) instead of starting one")
+    parser.add_argument("--in-process", action="store_true", help="serve the fake through ASGI, without sockets")
+    parser.add_argument("--trace-memory", action="store_true", help="report tracemalloc peak (slower)")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="allowed fractional regression")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    process, app = None, None
+    if args.base_url:
+        base_url = args.base_url
+    elif args.in_process:
+        base_url, app = "http://fake-fineract", create_app(settings_from_args(args))
+    else:
+        process, base_url = start_fake_server(args)
+    os.environ["MIFOS_BASE_URL"] = base_url
+
+    if args.trace_memory:
+        tracemalloc.start()
+    try:
+        result = asyncio.run(_benchmark(args, base_url, app))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    result["memory"] = {"max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+    if args.trace_memory:
+        result["memory"]["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 1)
+
+    print(format_report(result))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(result, handle, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            problems = compare(result, json.load(handle), args.max_regression)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -7,3 +8,83 @@ load_dotenv()
 BASE_URL = os.getenv("MIFOS_BASE_URL", "https://tt.mifos.community")
 API_BASE_PATH = "/fineract-provider/api/v1"
 DEFAULT_TENANT = os.getenv("MIFOS_TENANT", "default")
+
+# Transport of main.py: "stdio", "sse" or "streamable-http" (the last two are served by uvicorn)
+TRANSPORT = os.getenv("MIFOS_TRANSPORT", "stdio").lower()
+SERVER_HOST = os.getenv("MIFOS_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("MIFOS_PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("MIFOS_WORKERS", "1"))
+# Stateless streamable HTTP lets any worker answer any request; the default with several workers
+_STATELESS_DEFAULT = "true" if SERVER_WORKERS > 1 else "false"
+STATELESS_HTTP = os.getenv("MIFOS_STATELESS_HTTP", _STATELESS_DEFAULT).lower() in ("1", "true", "yes")
+SHUTDOWN_TIMEOUT = float(os.getenv("MIFOS_SHUTDOWN_TIMEOUT", "10"))
+# List tools from routers/manifest.json and import each router module on its first call
+LAZY_TOOLS = os.getenv("MIFOS_LAZY_TOOLS", "false").lower() in ("1", "true", "yes")
+
+# Shared HTTP connection pool
+HTTP_TIMEOUT = float(os.getenv("MIFOS_HTTP_TIMEOUT", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("MIFOS_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MIFOS_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("MIFOS_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("MIFOS_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Each tenant gets its own pool and a cap on concurrent upstream calls. MIFOS_TENANTS is a
+# JSON object of per-tenant overrides, e.g. {"acme": {"base_url": "...", "timeout": 10,
+# "max_connections": 20, "max_keepalive_connections": 5, "max_concurrency": 8}}
+TENANT_MAX_CONCURRENCY = int(os.getenv("MIFOS_TENANT_MAX_CONCURRENCY", "50"))
+TENANT_OVERRIDES = json.loads(os.getenv("MIFOS_TENANTS", "{}"))
+
+# Circuit breaker per backend endpoint group and adaptive (AIMD) concurrency limit per backend
+RESILIENCE_ENABLED = os.getenv("MIFOS_RESILIENCE_ENABLED", "true").lower() in ("1", "true", "yes")
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("MIFOS_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RECOVERY_TIME = float(os.getenv("MIFOS_CIRCUIT_RECOVERY_TIME", "30"))
+ADAPTIVE_LIMIT_INITIAL = int(os.getenv("MIFOS_ADAPTIVE_LIMIT_INITIAL", "20"))
+ADAPTIVE_LIMIT_MAX = int(os.getenv("MIFOS_ADAPTIVE_LIMIT_MAX", str(HTTP_MAX_CONNECTIONS)))
+ADAPTIVE_LATENCY_THRESHOLD = float(os.getenv("MIFOS_ADAPTIVE_LATENCY_THRESHOLD", "5"))
+ADAPTIVE_QUEUE_TIMEOUT = float(os.getenv("MIFOS_ADAPTIVE_QUEUE_TIMEOUT", "10"))
+
+# Retries (idempotent reads only) and hedged GETs, both paid for from a per-host retry budget
+RETRY_MAX_ATTEMPTS = int(os.getenv("MIFOS_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("MIFOS_RETRY_BASE_DELAY", "0.1"))
+RETRY_MAX_DELAY = float(os.getenv("MIFOS_RETRY_MAX_DELAY", "2"))
+RETRY_BUDGET_RATIO = float(os.getenv("MIFOS_RETRY_BUDGET_RATIO", "0.2"))
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("MIFOS_RETRY_BUDGET_MIN_PER_SECOND", "1"))
+HEDGE_ENABLED = os.getenv("MIFOS_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+HEDGE_MIN_DELAY = float(os.getenv("MIFOS_HEDGE_MIN_DELAY", "0.05"))
+
+# Per-user response cache for read-only GETs
+CACHE_ENABLED = os.getenv("MIFOS_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CACHE_MAX_ENTRIES = int(os.getenv("MIFOS_CACHE_MAX_ENTRIES", "1024"))
+TRANSACTION_INDEX_TTL = float(os.getenv("MIFOS_TRANSACTION_INDEX_TTL", "300"))
+
+# Share one upstream call between identical concurrent GETs
+COALESCE_REQUESTS = os.getenv("MIFOS_COALESCE_REQUESTS", "true").lower() in ("1", "true", "yes")
+
+# JSON library for Fineract request and response bodies: "auto", "orjson", "msgspec" or "json"
+JSON_BACKEND = os.getenv("MIFOS_JSON_BACKEND", "auto").lower()
+
+# Default slimming of read tool responses: "minimal", "standard" or "full" (verbatim)
+RESPONSE_PROFILE = os.getenv("MIFOS_RESPONSE_PROFILE", "full").lower()
+
+# Byte budget of a tool response (0 disables); the rest is served through fetch_continuation
+RESPONSE_MAX_BYTES = int(os.getenv("MIFOS_RESPONSE_MAX_BYTES", "100000"))
+# Per-tool budgets as JSON, e.g. {"get_loan_account_details": 40000}
+RESPONSE_BUDGETS = json.loads(os.getenv("MIFOS_RESPONSE_BUDGETS") or "{}")
+CONTINUATION_TTL = float(os.getenv("MIFOS_CONTINUATION_TTL", "600"))
+CONTINUATION_MAX = int(os.getenv("MIFOS_CONTINUATION_MAX", "256"))
+
+# Local SQLite store for synced transaction history. Rows are keyed by an HMAC of the caller's
+# credentials; without MIFOS_TRANSACTION_STORE_SECRET a random key is kept in "<path>.key".
+TRANSACTION_STORE_PATH = os.getenv("MIFOS_TRANSACTION_STORE_PATH", "data/transactions.sqlite3")
+TRANSACTION_STORE_SECRET = os.getenv("MIFOS_TRANSACTION_STORE_SECRET", "")
+# Days before the last synced transaction that each sync re-reads to pick up later reversals
+TRANSACTION_SYNC_LOOKBACK_DAYS = int(os.getenv("MIFOS_TRANSACTION_SYNC_LOOKBACK_DAYS", "30"))
+
+# Login sessions reused by tools through a session handle
+SESSION_TTL = float(os.getenv("MIFOS_SESSION_TTL", "1800"))
+SESSION_MAX = int(os.getenv("MIFOS_SESSION_MAX", "1024"))
+
+# Tracing of tool calls and upstream requests: "" (off), "jsonl" or "otlp"
+TRACING_EXPORTER = os.getenv("MIFOS_TRACING", "").lower()
+TRACING_JSONL_PATH = os.getenv("MIFOS_TRACING_JSONL_PATH", "data/traces.jsonl")
+OTLP_ENDPOINT = os.getenv("MIFOS_OTLP_ENDPOINT", "http://localhost:4318")
@@ -1,25 +1,107 @@
+# Imported first so that startup timings start here
+from utils.startup import profile, register_resources, register_tools, write_manifest
+import argparse
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from starlette.applications import Starlette
 from mcp_app import mcp
-from config.config import BASE_URL, DEFAULT_TENANT
-
-# Register MCP tools (imports are required for side-effects)
-import routers.auth_tools  # noqa: F401
-import routers.client_tools  # noqa: F401
-import routers.beneficiary_tools  # noqa: F401
-import routers.transfer_tools  # noqa: F401
-import routers.loan_tools  # noqa: F401
-import routers.savings_tools  # noqa: F401
-import routers.guarantor_tools  # noqa: F401
-import routers.shares_tools  # noqa: F401
-import routers.notification_tools  # noqa: F401
-
-# Register MCP resources
-import resources.overview  # noqa: F401
-import resources.endpoints  # noqa: F401
-import resources.workflows  # noqa: F401
+from config.config import (
+    BASE_URL,
+    DEFAULT_TENANT,
+    TRANSPORT,
+    SERVER_HOST,
+    SERVER_PORT,
+    SERVER_WORKERS,
+    STATELESS_HTTP,
+    SHUTDOWN_TIMEOUT,
+    LAZY_TOOLS,
+)
+from utils.http import http_lifespan
+
+profile.mark("framework_loaded")
+
+# Register MCP tools and resources (importing their modules registers them); lazily,
+# tools are listed from routers/manifest.json and their modules load on first call
+register_tools(mcp, lazy=LAZY_TOOLS)
+register_resources()
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def create_app(transport: str = TRANSPORT, host: str = SERVER_HOST, stateless: bool = STATELESS_HTTP) -> Starlette:
+    """ASGI app of one HTTP worker; ``uvicorn`` calls it once per worker process.
+
+    Each worker keeps its own connection pools open from startup until graceful
+    shutdown, rather than per MCP session, and flushes pending spans on exit.
+    """
+    mcp.settings.host = host
+    mcp.settings.stateless_http = stateless
+    mcp.settings.json_response = stateless
+    if host not in LOOPBACK_HOSTS:
+        # FastMCP only turns on DNS rebinding protection for loopback hosts
+        mcp.settings.transport_security = None
+
+    app = mcp.sse_app() if transport == "sse" else mcp.streamable_http_app()
+    transport_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with http_lifespan(), transport_lifespan(app):
+            yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mifos self-service MCP server")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=TRANSPORT)
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS, help="uvicorn worker processes (HTTP only)")
+    parser.add_argument("--startup-report", action="store_true", help="print startup timings as JSON and exit")
+    parser.add_argument("--write-manifest", action="store_true", help="regenerate routers/manifest.json and exit")
+    args = parser.parse_args()
+
+    if args.startup_report:
+        asyncio.run(mcp.list_tools())
+        print(json.dumps(profile.report(), indent=2))
+        return
+    if args.write_manifest:
+        print(f"Wrote {len(write_manifest(mcp))} tools to the manifest")
+        return
 
-if __name__ == "__main__":
     print("Starting TT Mobile Banking MCP Server")
     print(f"Base URL: {BASE_URL}")
     print(f"Default Tenant: {DEFAULT_TENANT}")
 
-    mcp.run()
+    if args.transport == "stdio":
+        mcp.run()
+        return
+    if args.transport == "sse" and args.workers > 1:
+        parser.error("the sse transport keeps per-connection state and needs --workers 1")
+
+    import uvicorn
+
+    stateless = STATELESS_HTTP if "MIFOS_STATELESS_HTTP" in os.environ else args.workers > 1
+    options = {"host": args.host, "port": args.port, "timeout_graceful_shutdown": SHUTDOWN_TIMEOUT}
+    if args.workers == 1:
+        uvicorn.run(create_app(args.transport, args.host, stateless), **options)
+        return
+
+    # Worker processes import this module afresh and read their settings from the environment
+    os.environ.update(
+        MIFOS_TRANSPORT=args.transport,
+        MIFOS_HOST=args.host,
+        MIFOS_WORKERS=str(args.workers),
+        MIFOS_STATELESS_HTTP=str(stateless).lower(),
+    )
+    uvicorn.run("main:create_app", factory=True, workers=args.workers, **options)
+
+
+if __name__ == "__main__":
+    main()
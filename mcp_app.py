@@ -1,3 +1,80 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.types import Tool as MCPTool
+from utils.auth import with_session
+from utils.budget import limit_response
+from utils.http import http_lifespan
+from utils.metrics import instrument_tool
+from utils.startup import profile
+from utils.tracing import trace_tool
 
-mcp = FastMCP("Mifos Mobile Banking Server")
+logger = logging.getLogger(__name__)
+
+
+def _deferred() -> None:
+    """Signature of lazy tools; arguments are validated by the real tool once loaded."""
+
+
+class LazyTool(Tool):
+    """Placeholder listed from the tool manifest; ``fn`` imports the module and returns the real tool."""
+
+    async def run(self, arguments: Dict[str, Any], context: Any = None, convert_result: bool = False) -> Any:
+        return await self.fn().run(arguments, context=context, convert_result=convert_result)
+
+
+_DEFERRED_METADATA = func_metadata(_deferred, structured_output=False)
+
+
+class InstrumentedFastMCP(FastMCP):
+    """FastMCP that instruments every registered tool.
+
+    Each call records metrics and a tracing span, runs against the tenant of its
+    session handle (an unknown or expired handle is answered with a 401 error), and
+    the response is kept within the tool's byte budget (see ``utils.budget``).
+    Structured output is off by default: tools pass Fineract payloads through, and an
+    output schema inferred from their ``Dict[str, Any]`` annotation would reject the
+    endpoints that return lists.
+    """
+
+    def add_tool(self, fn: Callable[..., Any], name: Optional[str] = None, **kwargs: Any) -> None:
+        tool_name = name or fn.__name__
+        wrapped = instrument_tool(trace_tool(limit_response(with_session(fn), tool_name), tool_name), tool_name)
+        if kwargs.get("structured_output") is None:
+            kwargs["structured_output"] = False
+        if isinstance(self._tool_manager.get_tool(tool_name), LazyTool):
+            self._tool_manager.remove_tool(tool_name)
+        super().add_tool(wrapped, name=name, **kwargs)
+
+    def add_lazy_tool(self, name: str, module: str, description: str, parameters: Dict[str, Any]) -> None:
+        """List a tool whose ``module`` is imported, registering the real tool, on its first call."""
+        if self._tool_manager.get_tool(name) is not None:
+            return
+
+        def load() -> Tool:
+            profile.import_module(module, deferred=True)
+            tool = self._tool_manager.get_tool(name)
+            if tool is None or isinstance(tool, LazyTool):
+                raise ToolError(f"Module {module} did not register tool {name}; regenerate the tool manifest")
+            return tool
+
+        self._tool_manager._tools[name] = LazyTool(
+            fn=load,
+            name=name,
+            description=description,
+            parameters=parameters,
+            fn_metadata=_DEFERRED_METADATA,
+            is_async=True,
+        )
+
+    async def list_tools(self) -> List[MCPTool]:
+        tools = await super().list_tools()
+        if profile.mark("first_list_tools"):
+            logger.info("Listed %d tools %.1f ms after startup", len(tools), profile.milestones["first_list_tools"])
+        return tools
+
+
+mcp = InstrumentedFastMCP("Mifos Mobile Banking Server", lifespan=http_lifespan)
@@ -0,0 +1,18 @@
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from mcp_app import mcp
+from utils.metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@mcp.resource("file:///resources/metrics", mime_type="text/plain")
+async def get_metrics() -> str:
+    """Tool and upstream call counts, errors, latency histograms and cache statistics (Prometheus format)"""
+    return registry.render()
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint, served on the SSE and streamable HTTP transports."""
+    return PlainTextResponse(registry.render(), headers={"Content-Type": PROMETHEUS_CONTENT_TYPE})
@@ -17,10 +17,13 @@ async def get_workflows() -> str:
 
     ## 2. View Account Information
     ```
-    1. Call login_self_service to authenticate
-    2. Call get_client_info to get client ID
+    1. Call login_self_service to authenticate (returns sessionId and clients)
+    2. Use the client ID from the login response (or get_session) and pass the
+       sessionId as username with an empty password to the calls below
     3. Call get_client_accounts with client ID
     4. Call get_client_transactions for transaction history
+    Read tools accept profile="minimal" or "standard" to slim the response and
+    fields="id,summary" to keep only the named top-level fields
     ```
 
     ## 3. Setup and Make Transfer
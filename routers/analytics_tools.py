@@ -0,0 +1,57 @@
+from datetime import date
+from mcp_app import mcp
+from typing import Dict, Any, List, Optional
+from utils.auth import get_auth_header
+from utils.analytics import filter_dates, summarize, to_columns
+from utils.fineract import is_error
+from utils.pagination import PageFetchError
+from routers.client_tools import MAX_COLLECTED_TRANSACTIONS, iter_client_transactions
+from routers.savings_tools import get_savings_transactions
+
+
+@mcp.tool(name="analyze_account_transactions")
+async def analyze_account_transactions(
+    username: str,
+    password: str,
+    savings_id: Optional[int] = None,
+    client_id: Optional[int] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    top_n: int = 5,
+) -> Dict[str, Any]:
+    """Spending and cash-flow analytics for a savings account or a client's transactions.
+
+    Pass savings_id (full savings history) or client_id (client transactions, up to 1000). Returns
+    monthly inflow/outflow, balance trajectory, breakdown by transaction type and top debit
+    counterparties, optionally limited to from_date/to_date (YYYY-MM-DD).
+    """
+    if (savings_id is None) == (client_id is None):
+        return {"error": True, "status_code": 400, "message": "Provide exactly one of savings_id or client_id"}
+    try:
+        start = date.fromisoformat(from_date).isoformat() if from_date else None
+        end = date.fromisoformat(to_date).isoformat() if to_date else None
+    except ValueError as e:
+        return {"error": True, "status_code": 400, "message": f"Invalid date: {e}"}
+
+    transactions: List[Dict[str, Any]] = []
+    if savings_id is not None:
+        account = await get_savings_transactions(savings_id, username, password, profile="full")
+        if is_error(account):
+            return account
+        transactions = account.get("transactions") or []
+        source = "savings"
+    else:
+        pager = iter_client_transactions(client_id, get_auth_header(username, password), page_size=200)
+        try:
+            async for transaction in pager:
+                transactions.append(transaction)
+                if len(transactions) >= MAX_COLLECTED_TRANSACTIONS:
+                    break
+        except PageFetchError as e:
+            return e.response
+        finally:
+            await pager.aclose()
+        source = "client"
+
+    columns = filter_dates(to_columns(transactions, source), start, end)
+    return {"source": source, "accountId": savings_id or client_id, **summarize(columns, top_n=max(1, top_n))}
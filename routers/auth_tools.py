@@ -1,7 +1,12 @@
 from mcp_app import mcp
 from typing import Dict, Any, Optional
-from utils.http import make_request
-from utils.auth import get_auth_header
+from utils.http import current_tenant, is_known_tenant, make_request
+from utils.auth import get_auth_header, sessions
+from utils.fineract import is_error
+from utils.session import SessionError, describe
+from utils.projection import projected, with_fields
+from utils.validation import preflight
+from schemas.registration import RegistrationRequest
 
 
 @mcp.tool(name="register_self_service_existing_client")
@@ -16,7 +21,10 @@ async def register_self_service(
     middleName: Optional[str] = None,
     authenticationMode: str = "email",
 ) -> Dict[str, Any]:
-    """Register Self Service for Existing Client - Registers a new user."""
+    """Register Self Service for Existing Client - Registers a new user.
+
+    authenticationMode is "email" or "mobile"; the email address is checked before anything is sent.
+    """
     data = {
         "username": username,
         "accountNumber": accountNumber,
@@ -28,7 +36,10 @@ async def register_self_service(
         "email": email,
         "authenticationMode": authenticationMode,
     }
-    return await make_request("POST", "/self/registration", data=data)
+    payload, error = preflight(RegistrationRequest, data)
+    if error:
+        return error
+    return await make_request("POST", "/self/registration", data=payload)
 
 
 @mcp.tool(name="confirm_self_service_user_registration")
@@ -39,17 +50,50 @@ async def confirm_registration(requestId: int, authenticationToken: str) -> Dict
 
 
 @mcp.tool(name="login")
-async def login_mifos(username: str, password: str) -> Dict[str, Any]:
-    """Login - Authenticates user."""
+async def login_mifos(username: str, password: str, tenant: Optional[str] = None) -> Dict[str, Any]:
+    """Login - Authenticates user.
+
+    On success the response carries a sessionId; pass it as username with an empty
+    password to any other tool instead of repeating the credentials. tenant picks one
+    of the configured tenants (the default one otherwise); every tool called with the
+    sessionId then runs against it.
+    """
+    tenant = tenant or current_tenant()
+    if not is_known_tenant(tenant):
+        return {"error": True, "status_code": 400, "message": f"Unknown tenant {tenant!r}"}
     data = {"username": username, "password": password}
-    return await make_request("POST", "/self/authentication", data=data)
+    result = await make_request("POST", "/self/authentication", data=data, tenant=tenant)
+    if not isinstance(result, dict) or is_error(result) or not result.get("base64EncodedAuthenticationKey"):
+        return result
+    session = sessions.create(username, result, tenant)
+    return {**result, "sessionId": session.session_id, "sessionExpiresIn": round(sessions.ttl)}
+
+
+@mcp.tool(name="get_session")
+async def get_session(session_id: str) -> Dict[str, Any]:
+    """Get Session - Returns the client id, roles and permissions captured at login."""
+    try:
+        session = sessions.get(session_id)
+    except SessionError as e:
+        return {"error": True, "status_code": 401, "message": str(e)}
+    return describe(session, sessions.expires_in(session_id))
+
+
+@mcp.tool(name="logout")
+async def logout(session_id: str) -> Dict[str, Any]:
+    """Logout - Ends a session created by login."""
+    if not sessions.end(session_id):
+        return {"error": True, "status_code": 404, "message": "Unknown or expired session"}
+    return {"message": "Session ended", "sessionId": session_id}
 
 
 @mcp.tool(name="confirm_self_service_user_registration_status")
-async def confirm_registration_get(username: str, password: str) -> Dict[str, Any]:
+async def confirm_registration_get(
+    username: str, password: str, fields: Optional[str] = None, profile: Optional[str] = None
+) -> Dict[str, Any]:
     """Confirm Self Service User Registration (Status Check) - Confirms status via Clients list."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/clients", auth=auth)
+    return await projected(make_request("GET", with_fields("/self/clients", fields), auth=auth), profile, fields)
 
 
 @mcp.tool(name="update_account_password")
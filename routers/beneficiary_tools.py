@@ -1,35 +1,66 @@
+import asyncio
 from mcp_app import mcp
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.fineract import is_error, page_items
+from utils.projection import projected, with_fields
+from utils.validation import check_payload, preflight
+from schemas.beneficiary import BeneficiaryRequest, BeneficiaryUpdateRequest
+
+BENEFICIARY_SYNC_ACTIONS = ("create", "update", "replace", "delete")
 
 
 @mcp.tool(name="get_beneficiary_template")
-async def get_beneficiary_template(username: str, password: str) -> Dict[str, Any]:
+async def get_beneficiary_template(
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve template data for creating beneficiaries."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/beneficiaries/tpt/template", auth=auth)
+    path = with_fields("/self/beneficiaries/tpt/template", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_beneficiary_list")
-async def get_beneficiary_list(username: str, password: str) -> Dict[str, Any]:
+async def get_beneficiary_list(
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve list of third-party transfer beneficiaries."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/beneficiaries/tpt", auth=auth)
+    path = with_fields("/self/beneficiaries/tpt", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="create_beneficiary_savings")
 async def create_beneficiary_savings(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Create a new savings beneficiary."""
+    """Create a new savings beneficiary.
+
+    data needs name, officeName, accountNumber and accountType (1=Loan, 2=Savings); transferLimit is optional.
+    """
+    payload, error = preflight(BeneficiaryRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/beneficiaries/tpt", auth=auth, data=data)
+    return await make_request("POST", "/self/beneficiaries/tpt", auth=auth, data=payload)
 
 
 @mcp.tool(name="create_beneficiary_loan")
 async def create_beneficiary_loan(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Create a new loan beneficiary."""
+    """Create a new loan beneficiary.
+
+    data needs name, officeName, accountNumber and accountType (1=Loan, 2=Savings); transferLimit is optional.
+    """
+    payload, error = preflight(BeneficiaryRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/beneficiaries/tpt", auth=auth, data=data)
+    return await make_request("POST", "/self/beneficiaries/tpt", auth=auth, data=payload)
 
 
 @mcp.tool(name="update_beneficiary_savings")
@@ -39,13 +70,16 @@ async def update_beneficiary_savings(
     username: str,
     password: str,
 ) -> Dict[str, Any]:
-    """Update an existing savings beneficiary."""
+    """Update an existing savings beneficiary. Only name and transferLimit can change."""
+    payload, error = preflight(BeneficiaryUpdateRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
     return await make_request(
         "PUT",
         f"/self/beneficiaries/tpt/{beneficiary_id}",
         auth=auth,
-        data=data,
+        data=payload,
     )
 
 
@@ -56,13 +90,16 @@ async def update_beneficiary_loan(
     username: str,
     password: str,
 ) -> Dict[str, Any]:
-    """Update an existing loan beneficiary."""
+    """Update an existing loan beneficiary. Only name and transferLimit can change."""
+    payload, error = preflight(BeneficiaryUpdateRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
     return await make_request(
         "PUT",
         f"/self/beneficiaries/tpt/{beneficiary_id}",
         auth=auth,
-        data=data,
+        data=payload,
     )
 
 
@@ -75,3 +112,127 @@ async def delete_beneficiary(beneficiary_id: int, username: str, password: str)
         f"/self/beneficiaries/tpt/{beneficiary_id}",
         auth=auth,
     )
+
+
+def _beneficiary_state(item: Dict[str, Any]) -> Dict[str, Any]:
+    account_type = item.get("accountType")
+    transfer_limit = item.get("transferLimit")
+    return {
+        "name": item.get("name"),
+        "officeName": item.get("officeName"),
+        "accountType": account_type.get("id") if isinstance(account_type, dict) else account_type,
+        "transferLimit": None if transfer_limit is None else float(transfer_limit),
+    }
+
+
+def _plan_beneficiary_sync(
+    current: List[Dict[str, Any]], desired: List[Dict[str, Any]], delete_missing: bool
+) -> List[Dict[str, Any]]:
+    """Diff server beneficiaries against the desired list, keyed by account number.
+
+    Only name and transferLimit can be updated in place; a different office or account
+    type means the beneficiary has to be deleted and created again. A desired item
+    without transferLimit leaves the current limit as it is.
+    """
+    existing = {str(item.get("accountNumber")): item for item in current}
+    wanted = {str(item["accountNumber"]): item for item in desired}
+    plan: List[Dict[str, Any]] = []
+
+    for account_number, item in wanted.items():
+        target = _beneficiary_state(item)
+        found = existing.get(account_number)
+        if found is None:
+            plan.append({"action": "create", "accountNumber": account_number, "target": target})
+            continue
+        state = _beneficiary_state(found)
+        if (state["officeName"], state["accountType"]) != (target["officeName"], target["accountType"]):
+            plan.append({"action": "replace", "accountNumber": account_number, "id": found["id"], "target": target})
+        elif state["name"] != target["name"] or target["transferLimit"] not in (None, state["transferLimit"]):
+            plan.append({"action": "update", "accountNumber": account_number, "id": found["id"], "target": target})
+
+    if delete_missing:
+        for account_number, found in existing.items():
+            if account_number not in wanted:
+                plan.append({"action": "delete", "accountNumber": account_number, "id": found["id"]})
+    return plan
+
+
+def _change_report(change: Dict[str, Any]) -> Dict[str, Any]:
+    report = {"action": change["action"], "accountNumber": change["accountNumber"]}
+    if "target" in change:
+        report.update(name=change["target"]["name"], transferLimit=change["target"]["transferLimit"])
+    return report
+
+
+@mcp.tool(name="sync_beneficiaries")
+async def sync_beneficiaries(
+    desired: List[Dict[str, Any]],
+    username: str,
+    password: str,
+    dry_run: bool = True,
+    delete_missing: bool = True,
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """Sync third-party transfer beneficiaries to a desired list.
+
+    Each desired item needs name, officeName, accountNumber and accountType (1=Loan, 2=Savings);
+    transferLimit is optional. The current list is fetched once, diffed by accountNumber and the creates, updates
+    and deletes are applied concurrently. dry_run (the default) only reports the planned changes; set
+    dry_run=False to apply them. With delete_missing, beneficiaries absent from the list are removed.
+    """
+    checked = [check_payload(BeneficiaryRequest, item) for item in desired]
+    invalid: List[Dict[str, Any]] = []
+    seen = set()
+    for index, (payload, errors) in enumerate(checked):
+        if not errors and str(payload["accountNumber"]) in seen:
+            errors = [{"field": "accountNumber", "message": "duplicate accountNumber"}]
+        if errors:
+            invalid.append({"index": index, "errors": errors})
+        else:
+            seen.add(str(payload["accountNumber"]))
+    if invalid:
+        return {"error": True, "status_code": 400, "message": "Invalid desired beneficiaries", "invalid": invalid}
+    desired = [payload for payload, _ in checked]
+
+    auth = get_auth_header(username, password)
+    current = await make_request("GET", "/self/beneficiaries/tpt", auth=auth)
+    if is_error(current):
+        return current
+
+    plan = _plan_beneficiary_sync(page_items(current), desired, delete_missing)
+    summary = {action: sum(1 for change in plan if change["action"] == action) for action in BENEFICIARY_SYNC_ACTIONS}
+    summary["unchanged"] = len(desired) - summary["create"] - summary["update"] - summary["replace"]
+    if dry_run:
+        return {"dryRun": True, "summary": summary, "changes": [_change_report(change) for change in plan]}
+
+    limiter = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def call(method: str, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        async with limiter:
+            if data is None:
+                return await make_request(method, path, auth=auth)
+            return await make_request(method, path, auth=auth, data=data)
+
+    async def apply(change: Dict[str, Any]) -> Dict[str, Any]:
+        target = {key: value for key, value in (change.get("target") or {}).items() if value is not None}
+        create_payload = {"locale": "en", "accountNumber": change["accountNumber"], **target}
+        if change["action"] in ("delete", "replace"):
+            response = await call("DELETE", f"/self/beneficiaries/tpt/{change['id']}")
+            if is_error(response) or change["action"] == "delete":
+                return response
+        if change["action"] in ("create", "replace"):
+            return await call("POST", "/self/beneficiaries/tpt", create_payload)
+        update_payload = {key: target[key] for key in ("name", "transferLimit") if key in target}
+        return await call("PUT", f"/self/beneficiaries/tpt/{change['id']}", update_payload)
+
+    responses = await asyncio.gather(*(apply(change) for change in plan))
+    changes = []
+    for change, response in zip(plan, responses):
+        report = _change_report(change)
+        report["status"] = "failed" if is_error(response) else "applied"
+        if is_error(response):
+            report["message"] = response.get("message")
+        changes.append(report)
+
+    failed = sum(1 for change in changes if change["status"] == "failed")
+    return {"dryRun": False, "summary": {**summary, "failed": failed}, "changes": changes}
@@ -1,21 +1,41 @@
+import asyncio
+from datetime import date
 from mcp_app import mcp
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncGenerator, List, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.fineract import enum_value, is_error, page_items, parse_date, to_iso_date
+from utils.pagination import PageFetchError, paginate
+from utils.projection import projected, with_fields
+
+# Upper bound on transactions a single collect_client_transactions call may hold
+MAX_COLLECTED_TRANSACTIONS = 1000
 
 
 @mcp.tool(name="get_clients_linked_to_user")
-async def get_clients_linked_to_user(username: str, password: str) -> Dict[str, Any]:
+async def get_clients_linked_to_user(
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get list of clients linked to the authenticated user."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/clients", auth=auth)
+    return await projected(make_request("GET", with_fields("/self/clients", fields), auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_details")
-async def get_client_details(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_client_details(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve client details."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/clients/{client_id}", auth=auth)
+    path = with_fields(f"/self/clients/{client_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_accounts")
@@ -24,29 +44,40 @@ async def get_client_accounts(
     username: str,
     password: str,
     fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Retrieve client accounts (optional filtering by account type)."""
     auth = get_auth_header(username, password)
-    path = f"/self/clients/{client_id}/accounts"
-
-    if fields:
-        path += f"?fields={fields}"
-
-    return await make_request("GET", path, auth=auth)
+    path = with_fields(f"/self/clients/{client_id}/accounts", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_images")
-async def get_client_images(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_client_images(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve client images."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/clients/{client_id}/images", auth=auth)
+    path = with_fields(f"/self/clients/{client_id}/images", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_charges")
-async def get_client_charges(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_client_charges(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve client charges."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/clients/{client_id}/charges", auth=auth)
+    path = with_fields(f"/self/clients/{client_id}/charges", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_transactions")
@@ -56,11 +87,13 @@ async def get_client_transactions(
     password: str,
     offset: int = 0,
     limit: int = 20,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Retrieve client transactions with pagination."""
     auth = get_auth_header(username, password)
-    path = f"/self/clients/{client_id}/transactions?offset={offset}&limit={limit}"
-    return await make_request("GET", path, auth=auth)
+    path = with_fields(f"/self/clients/{client_id}/transactions?offset={offset}&limit={limit}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_client_transaction_detail")
@@ -69,11 +102,223 @@ async def get_client_transaction_detail(
     transaction_id: int,
     username: str,
     password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Retrieve specific client transaction detail."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/clients/{client_id}/transactions/{transaction_id}",
-        auth=auth,
+    path = with_fields(f"/self/clients/{client_id}/transactions/{transaction_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
+
+
+def _section_error(response: Any) -> Dict[str, Any]:
+    if isinstance(response, BaseException):
+        return {"status_code": 500, "message": str(response)}
+    return {"status_code": response.get("status_code"), "message": response.get("message")}
+
+
+def _compact_account(account: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": account.get("id"),
+        "accountNo": account.get("accountNo"),
+        "productName": account.get("productName"),
+        "status": enum_value(account.get("status")),
+        "active": (account.get("status") or {}).get("active", False),
+        "balance": account.get("accountBalance", account.get("loanBalance")),
+        "currency": (account.get("currency") or {}).get("code"),
+    }
+
+
+def _compact_transaction(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": transaction.get("id"),
+        "date": to_iso_date(transaction.get("date")),
+        "type": enum_value(transaction.get("type")),
+        "amount": transaction.get("amount"),
+        "currency": (transaction.get("currency") or {}).get("code"),
+    }
+
+
+def _compact_charge(charge: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": charge.get("id"),
+        "name": charge.get("name"),
+        "dueDate": to_iso_date(charge.get("dueDate")),
+        "amount": charge.get("amount"),
+        "outstanding": charge.get("amountOutstanding"),
+    }
+
+
+@mcp.tool(name="get_client_dashboard")
+async def get_client_dashboard(
+    client_id: int,
+    username: str,
+    password: str,
+    transactions_limit: int = 5,
+    include_account_details: bool = True,
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """Client dashboard - details, accounts, charges, recent transactions and active account summaries in one call.
+
+    Sections are fetched concurrently; a failing section is reported under "errors" instead of failing the call.
+    """
+    auth = get_auth_header(username, password)
+    limiter = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(path: str) -> Any:
+        async with limiter:
+            return await make_request("GET", path, auth=auth)
+
+    details, accounts, charges, transactions = await asyncio.gather(
+        fetch(f"/self/clients/{client_id}"),
+        fetch(f"/self/clients/{client_id}/accounts"),
+        fetch(f"/self/clients/{client_id}/charges"),
+        fetch(f"/self/clients/{client_id}/transactions?offset=0&limit={transactions_limit}"),
+        return_exceptions=True,
     )
+
+    dashboard: Dict[str, Any] = {"clientId": client_id}
+    errors: Dict[str, Any] = {}
+
+    if isinstance(details, BaseException) or is_error(details):
+        errors["client"] = _section_error(details)
+    else:
+        dashboard["client"] = {
+            "displayName": details.get("displayName"),
+            "accountNo": details.get("accountNo"),
+            "status": enum_value(details.get("status")),
+            "officeName": details.get("officeName"),
+            "mobileNo": details.get("mobileNo"),
+            "activationDate": to_iso_date(details.get("activationDate")),
+        }
+
+    loans: List[Dict[str, Any]] = []
+    savings: List[Dict[str, Any]] = []
+    if isinstance(accounts, BaseException) or is_error(accounts):
+        errors["accounts"] = _section_error(accounts)
+    else:
+        loans = [_compact_account(account) for account in accounts.get("loanAccounts") or []]
+        savings = [_compact_account(account) for account in accounts.get("savingsAccounts") or []]
+        dashboard["accounts"] = {
+            "loans": loans,
+            "savings": savings,
+            "shares": [_compact_account(account) for account in accounts.get("shareAccounts") or []],
+        }
+
+    if isinstance(charges, BaseException) or is_error(charges):
+        errors["charges"] = _section_error(charges)
+    else:
+        dashboard["charges"] = [_compact_charge(charge) for charge in page_items(charges)]
+
+    if isinstance(transactions, BaseException) or is_error(transactions):
+        errors["recentTransactions"] = _section_error(transactions)
+    else:
+        dashboard["recentTransactions"] = [_compact_transaction(txn) for txn in page_items(transactions)]
+
+    if include_account_details:
+        targets = [("loan", account) for account in loans if account["active"]]
+        targets += [("savings", account) for account in savings if account["active"]]
+        responses = await asyncio.gather(
+            *(
+                fetch(f"/self/loans/{account['id']}" if kind == "loan" else f"/self/savingsaccounts/{account['id']}")
+                for kind, account in targets
+            ),
+            return_exceptions=True,
+        )
+
+        for (kind, account), response in zip(targets, responses):
+            if isinstance(response, BaseException) or is_error(response):
+                errors[f"{kind}:{account['id']}"] = _section_error(response)
+                continue
+            summary = response.get("summary") or {}
+            if kind == "loan":
+                account["summary"] = {
+                    "principalOutstanding": summary.get("principalOutstanding"),
+                    "totalOutstanding": summary.get("totalOutstanding"),
+                    "totalOverdue": summary.get("totalOverdue"),
+                    "inArrears": response.get("inArrears"),
+                }
+            else:
+                account["summary"] = {
+                    "accountBalance": summary.get("accountBalance"),
+                    "availableBalance": summary.get("availableBalance"),
+                    "totalDeposits": summary.get("totalDeposits"),
+                    "totalWithdrawals": summary.get("totalWithdrawals"),
+                }
+
+    if errors:
+        dashboard["errors"] = errors
+    return dashboard
+
+
+def iter_client_transactions(
+    client_id: int,
+    auth: str,
+    page_size: int = 50,
+    stats: Optional[Dict[str, int]] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Stream client transactions (newest first), prefetching the next page while one is consumed."""
+
+    async def fetch_page(offset: int, limit: int) -> Any:
+        return await make_request(
+            "GET",
+            f"/self/clients/{client_id}/transactions?offset={offset}&limit={limit}",
+            auth=auth,
+        )
+
+    return paginate(fetch_page, page_size=page_size, stats=stats)
+
+
+@mcp.tool(name="collect_client_transactions")
+async def collect_client_transactions(
+    client_id: int,
+    username: str,
+    password: str,
+    max_items: int = 100,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    page_size: int = 50,
+) -> Dict[str, Any]:
+    """Collect client transactions across pages in one call.
+
+    Gathers up to max_items (capped at 1000) transactions, optionally limited to a from_date/to_date
+    range (YYYY-MM-DD, inclusive). Paging stops as soon as the limit is reached or transactions
+    older than from_date appear.
+    """
+    try:
+        start = date.fromisoformat(from_date) if from_date else None
+        end = date.fromisoformat(to_date) if to_date else None
+    except ValueError as e:
+        return {"error": True, "status_code": 400, "message": f"Invalid date: {e}"}
+
+    auth = get_auth_header(username, password)
+    limit = max(0, min(max_items, MAX_COLLECTED_TRANSACTIONS))
+    stats: Dict[str, int] = {}
+    collected: List[Dict[str, Any]] = []
+    complete = True
+
+    pager = iter_client_transactions(client_id, auth, page_size=max(1, page_size), stats=stats)
+    try:
+        async for transaction in pager:
+            txn_date = parse_date(transaction.get("date"))
+            if end and txn_date and txn_date > end:
+                continue
+            if start and txn_date and txn_date < start:
+                break
+            # Only an in-range transaction left over makes the result incomplete
+            if len(collected) >= limit:
+                complete = False
+                break
+            collected.append(_compact_transaction(transaction))
+    except PageFetchError as e:
+        return {**e.response, "transactions": collected, "pagesFetched": stats.get("pages", 0)}
+    finally:
+        await pager.aclose()
+
+    return {
+        "clientId": client_id,
+        "count": len(collected),
+        "complete": complete,
+        "pagesFetched": stats.get("pages", 0),
+        "transactions": collected,
+    }
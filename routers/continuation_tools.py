@@ -0,0 +1,26 @@
+from mcp_app import mcp
+from typing import Dict, Any
+from utils.budget import ContinuationError, continuations
+
+
+@mcp.tool(name="fetch_continuation")
+async def fetch_continuation(cursor: str) -> Dict[str, Any]:
+    """Fetch the next part of a response that was cut to fit its size budget.
+
+    Pass continuation.nextCursor from the truncated response, then each nextCursor returned
+    here until it is null. Items continue the list at "path" starting at "offset"; they are
+    served from memory without querying Fineract again.
+    """
+    try:
+        chunk, number, total, next_cursor = continuations.get(cursor)
+    except ContinuationError as e:
+        return {"error": True, "status_code": 404, "message": str(e)}
+
+    return {
+        "path": chunk.path,
+        "offset": chunk.offset,
+        "items": chunk.items,
+        "chunk": number + 1,
+        "chunks": total,
+        "nextCursor": next_cursor,
+    }
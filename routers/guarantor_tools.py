@@ -2,24 +2,39 @@ from mcp_app import mcp
 from typing import Dict, Any, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.projection import projected, with_fields
 
 
 @mcp.tool(name="get_guarantor_template")
-async def get_guarantor_template(loan_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_guarantor_template(
+    loan_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Get template for creating loan guarantors.
     """
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/loans/{loan_id}/guarantors/template", auth=auth)
+    path = with_fields(f"/self/loans/{loan_id}/guarantors/template", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_guarantor_list")
-async def get_loan_guarantors(loan_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_loan_guarantors(
+    loan_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Get list of guarantors for a specific loan.
     """
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/loans/{loan_id}/guarantors", auth=auth)
+    path = with_fields(f"/self/loans/{loan_id}/guarantors", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="create_guarantor")
@@ -0,0 +1,150 @@
+import asyncio
+from datetime import date, timedelta
+from mcp_app import mcp
+from typing import Dict, Any, List, Optional
+from config.config import TRANSACTION_SYNC_LOOKBACK_DAYS
+from utils.http import current_tenant, make_request
+from utils.auth import get_auth_header
+from utils.fineract import is_error, parse_date
+from utils.pagination import PageFetchError
+from utils.store import get_store
+from routers.client_tools import iter_client_transactions
+
+
+def _needs_sync(transaction: Dict[str, Any], last_id: int, last_date: Optional[str]) -> bool:
+    """Whether ``transaction`` is new, or recent enough to re-read for a reversal made since the last sync."""
+    if (transaction.get("id") or 0) > last_id:
+        return True
+    txn_date = parse_date(transaction.get("date"))
+    if not (last_date and txn_date):
+        return False
+    return txn_date >= date.fromisoformat(last_date) - timedelta(days=TRANSACTION_SYNC_LOOKBACK_DAYS)
+
+
+async def _sync_client(client_id: int, auth: str, owner: str) -> int:
+    store, tenant = get_store(), current_tenant()
+    last_id, last_date = await asyncio.to_thread(store.watermark, tenant, owner, "client", client_id)
+    fresh: List[Dict[str, Any]] = []
+    # Client transactions arrive newest first, so paging stops at the first one older than the lookback.
+    pager = iter_client_transactions(client_id, auth, page_size=100)
+    try:
+        async for transaction in pager:
+            if not _needs_sync(transaction, last_id, last_date):
+                break
+            fresh.append(transaction)
+    finally:
+        await pager.aclose()
+    return await asyncio.to_thread(store.add_transactions, tenant, owner, "client", client_id, fresh)
+
+
+async def _sync_account(source: str, account_id: int, auth: str, owner: str) -> int:
+    # Self-service has no incremental endpoint for account histories, so they are fetched whole
+    path = "loans" if source == "loan" else "savingsaccounts"
+    account = await make_request("GET", f"/self/{path}/{account_id}?associations=transactions", auth=auth)
+    if is_error(account):
+        raise PageFetchError(account, 0)
+    store, tenant = get_store(), current_tenant()
+    last_id, last_date = await asyncio.to_thread(store.watermark, tenant, owner, source, account_id)
+    fresh = [txn for txn in account.get("transactions") or [] if _needs_sync(txn, last_id, last_date)]
+    return await asyncio.to_thread(store.add_transactions, tenant, owner, source, account_id, fresh)
+
+
+@mcp.tool(name="sync_transaction_history")
+async def sync_transaction_history(
+    client_id: int,
+    username: str,
+    password: str,
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """Sync client, savings and loan transactions into the local store.
+
+    Only transactions newer than the last synced one per account are stored. Transactions from
+    the 30 days (MIFOS_TRANSACTION_SYNC_LOOKBACK_DAYS) before it are re-read so reversals made
+    since are picked up; older reversals are not. Savings and loan histories are downloaded in
+    full each time. Run it before query_transaction_history.
+    """
+    auth = get_auth_header(username, password)
+    owner = get_store().owner(current_tenant(), auth)
+    accounts = await make_request("GET", f"/self/clients/{client_id}/accounts", auth=auth)
+    if is_error(accounts):
+        return accounts
+
+    limiter = asyncio.Semaphore(max(1, max_concurrency))
+    targets = [("client", client_id)]
+    targets += [("savings", account["id"]) for account in accounts.get("savingsAccounts") or []]
+    targets += [("loan", account["id"]) for account in accounts.get("loanAccounts") or []]
+
+    async def sync(source: str, account_id: int) -> int:
+        async with limiter:
+            if source == "client":
+                return await _sync_client(account_id, auth, owner)
+            return await _sync_account(source, account_id, auth, owner)
+
+    results = await asyncio.gather(
+        *(sync(source, account_id) for source, account_id in targets), return_exceptions=True
+    )
+
+    synced: Dict[str, Any] = {}
+    errors: Dict[str, Any] = {}
+    for (source, account_id), result in zip(targets, results):
+        label = f"{source}:{account_id}"
+        if isinstance(result, PageFetchError):
+            errors[label] = {
+                "status_code": result.response.get("status_code"),
+                "message": result.response.get("message"),
+            }
+        elif isinstance(result, BaseException):
+            errors[label] = {"status_code": 500, "message": str(result)}
+        else:
+            synced[label] = result
+
+    response: Dict[str, Any] = {"clientId": client_id, "newTransactions": synced}
+    if errors:
+        response["errors"] = errors
+    return response
+
+
+@mcp.tool(name="query_transaction_history")
+async def query_transaction_history(
+    username: str,
+    password: str,
+    report: str = "spending",
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    account_type: Optional[str] = None,
+    limit: int = 20,
+) -> Dict[str, Any]:
+    """Query the locally synced transaction history (see sync_transaction_history).
+
+    - report: "spending" (debit/credit totals and debits by type), "largest_debits", "recent" or "sync_status".
+    - from_date / to_date: YYYY-MM-DD, inclusive.
+    - account_type: "client", "savings" or "loan" to restrict the source.
+    """
+    try:
+        from_date = date.fromisoformat(from_date).isoformat() if from_date else None
+        to_date = date.fromisoformat(to_date).isoformat() if to_date else None
+    except ValueError as e:
+        return {"error": True, "status_code": 400, "message": f"Invalid date: {e}"}
+
+    auth = get_auth_header(username, password)
+    store, tenant = get_store(), current_tenant()
+    owner = store.owner(tenant, auth)
+
+    if report == "spending":
+        result = await asyncio.to_thread(store.spending, tenant, owner, from_date, to_date, account_type)
+    elif report == "largest_debits":
+        rows = await asyncio.to_thread(
+            store.transactions, tenant, owner, from_date, to_date, account_type, "debit", "largest", limit
+        )
+        result = {"transactions": rows}
+    elif report == "recent":
+        rows = await asyncio.to_thread(
+            store.transactions, tenant, owner, from_date, to_date, account_type, None, "recent", limit
+        )
+        result = {"transactions": rows}
+    elif report == "sync_status":
+        result = {"accounts": await asyncio.to_thread(store.sync_state, tenant, owner)}
+    else:
+        return {"error": True, "status_code": 400, "message": f"Unknown report: {report}"}
+
+    return {"report": report, "fromDate": from_date, "toDate": to_date, **result}
@@ -2,28 +2,40 @@ from mcp_app import mcp
 from typing import Dict, Any, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.fineract import is_error, page_items
+from utils.amortization import UnsupportedSchedule, calculate_schedule, product_currency_digits
+from utils.projection import projected, with_fields
+from utils.validation import preflight
+from schemas.loan import LoanApplicationRequest
 
 
 @mcp.tool(name="get_loan_products")
-async def get_loan_products(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_loan_products(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve available loan products."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/loanproducts?clientId={client_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/loanproducts?clientId={client_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_loan_product_details")
-async def get_loan_product_details(client_id: int, product_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_loan_product_details(
+    client_id: int,
+    product_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve loan product details."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/loanproducts?clientId={client_id}&productId={product_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/loanproducts?clientId={client_id}&productId={product_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_loan_account_details")
@@ -32,6 +44,8 @@ async def get_loan_account_details(
     username: str,
     password: str,
     associations: Optional[str] = None,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Retrieve loan account details (optional associations)."""
     auth = get_auth_header(username, password)
@@ -40,48 +54,94 @@ async def get_loan_account_details(
     if associations:
         path += f"?associations={associations}"
 
-    return await make_request("GET", path, auth=auth)
+    return await projected(make_request("GET", with_fields(path, fields), auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_loan_transaction_detail")
 async def get_loan_transaction_detail(
-    loan_id: int, transaction_id: int, username: str, password: str
+    loan_id: int,
+    transaction_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Retrieve loan transaction detail."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/loans/{loan_id}/transactions/{transaction_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/loans/{loan_id}/transactions/{transaction_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_loan_account_charges")
-async def get_loan_account_charges(loan_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_loan_account_charges(
+    loan_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve loan charges."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/loans/{loan_id}/charges",
-        auth=auth,
-    )
+    path = with_fields(f"/self/loans/{loan_id}/charges", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_loan_template")
-async def get_loan_template(client_id: int, product_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_loan_template(
+    client_id: int,
+    product_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Retrieve loan application template."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/loans/template?clientId={client_id}&productId={product_id}&templateType=individual",
-        auth=auth,
-    )
+    path = f"/self/loans/template?clientId={client_id}&productId={product_id}&templateType=individual"
+    return await projected(make_request("GET", with_fields(path, fields), auth=auth), profile, fields)
+
+
+async def _local_schedule_digits(data: Dict[str, Any], auth: str) -> int:
+    """Currency digits of the payload's loan product, which must be one the local engine can schedule."""
+    if data.get("productId") is None:
+        raise UnsupportedSchedule("productId is required")
+    path = f"/self/loanproducts?clientId={data.get('clientId')}&productId={data['productId']}"
+    response = await make_request("GET", path, auth=auth)
+    if is_error(response):
+        raise UnsupportedSchedule("the loan product could not be read")
+    if isinstance(response, dict) and "pageItems" not in response:
+        response = [response]
+    product = next((item for item in page_items(response) if str(item.get("id")) == str(data["productId"])), None)
+    if product is None:
+        raise UnsupportedSchedule("the loan product could not be read")
+    return product_currency_digits(product)
 
 
 @mcp.tool(name="calculate_loan_repayment_calendar")
-async def calculate_loan_repayment_calendar(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Calculate loan repayment schedule."""
+async def calculate_loan_repayment_calendar(
+    data: Dict[str, Any], username: str, password: str, mode: str = "auto"
+) -> Dict[str, Any]:
+    """Calculate loan repayment schedule.
+
+    - mode: "auto" computes common configurations locally (declining balance or flat interest, equal
+      installments or equal principal, grace periods) after checking the loan product (currency decimals,
+      no rounding multiples, interest recalculation or 360-day years) and asks the server otherwise;
+      "local" never calls the server and assumes two currency decimals; "server" always does.
+    """
+    if mode not in ("auto", "local", "server"):
+        return {"error": True, "status_code": 400, "message": f"Unknown mode: {mode}"}
+    if mode == "local":
+        try:
+            return calculate_schedule(data)
+        except UnsupportedSchedule as e:
+            return {"error": True, "status_code": 422, "message": f"Cannot calculate locally: {e}"}
+
     auth = get_auth_header(username, password)
+    if mode == "auto":
+        try:
+            return calculate_schedule(data, currency_digits=await _local_schedule_digits(data, auth))
+        except UnsupportedSchedule:
+            pass
     return await make_request(
         "POST",
         "/self/loans?command=calculateLoanSchedule",
@@ -92,20 +152,32 @@ async def calculate_loan_repayment_calendar(data: Dict[str, Any], username: str,
 
 @mcp.tool(name="submit_loan_application")
 async def submit_loan_application(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Submit loan application."""
+    """Submit loan application.
+
+    data needs clientId, productId, principal, loanTermFrequency(Type), numberOfRepayments, repaymentEvery,
+    repaymentFrequencyType, interestRatePerPeriod, amortizationType, interestType,
+    interestCalculationPeriodType, submittedOnDate and expectedDisbursementDate (see the loan template). It
+    is checked before anything is sent and field errors come back at once.
+    """
+    payload, error = preflight(LoanApplicationRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/loans", auth=auth, data=data)
+    return await make_request("POST", "/self/loans", auth=auth, data=payload)
 
 
 @mcp.tool(name="update_loan_application")
 async def update_loan_application(loan_id: int, data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Update loan application."""
+    """Update loan application. The fields given are checked like submit_loan_application's."""
+    payload, error = preflight(LoanApplicationRequest, data, partial=True)
+    if error:
+        return error
     auth = get_auth_header(username, password)
     return await make_request(
         "PUT",
         f"/self/loans/{loan_id}",
         auth=auth,
-        data=data,
+        data=payload,
     )
 
 
@@ -1,16 +1,24 @@
 from mcp_app import mcp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.projection import projected, with_fields
 
 
 @mcp.tool(name="get_user_notification_details")
-async def get_notification_registration_details(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_notification_registration_details(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Get notification registration details for a client.
     """
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/device/registration/client/{client_id}", auth=auth)
+    path = with_fields(f"/self/device/registration/client/{client_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="register_for_notifications")
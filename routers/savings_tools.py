@@ -1,25 +1,47 @@
+from datetime import date
 from mcp_app import mcp
-from typing import Dict, Any, Optional
-from utils.http import make_request
+from typing import Dict, Any, Optional, Union
+from config.config import CACHE_ENABLED, TRANSACTION_INDEX_TTL
+from utils.http import current_tenant, make_request, response_cache
 from utils.auth import get_auth_header
+from utils.cache import cache_scope
+from utils.fineract import is_error
+from utils.projection import projected, with_fields
+from utils.validation import preflight
+from schemas.savings import SavingsApplicationRequest
+from utils.txindex import TransactionIndex, decode_cursor
+
+# Largest page of a filtered transaction window
+MAX_TRANSACTION_PAGE = 500
 
 
 @mcp.tool(name="get_savings_products")
-async def get_savings_products(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_savings_products(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get List of Savings Products"""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/savingsproducts?clientId={client_id}", auth=auth)
+    path = with_fields(f"/self/savingsproducts?clientId={client_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_savings_product_details")
-async def get_savings_product_details(client_id: int, product_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_savings_product_details(
+    client_id: int,
+    product_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get Detail of Savings Products"""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/savingsproducts?clientId={client_id}&productId={product_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/savingsproducts?clientId={client_id}&productId={product_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_savings_account_details")
@@ -28,6 +50,8 @@ async def get_savings_details(
     username: str,
     password: str,
     associations: Optional[str] = None,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get Detail of Savings Account - Supports associations (transactions,charges)."""
     auth = get_auth_header(username, password)
@@ -36,7 +60,30 @@ async def get_savings_details(
     if associations:
         path += f"?associations={associations}"
 
-    return await make_request("GET", path, auth=auth)
+    return await projected(make_request("GET", with_fields(path, fields), auth=auth), profile, fields)
+
+
+async def get_savings_transaction_index(savings_id: int, auth: str) -> Union[TransactionIndex, Dict[str, Any]]:
+    """Index of a savings account's full history, downloaded once per cache lifetime.
+
+    The index is cached alongside responses under the account's path, so writes that
+    invalidate the account (transfers, application updates) drop it as well.
+    """
+    path = f"/self/savingsaccounts/{savings_id}?associations=transactions"
+    tenant = current_tenant()
+    scope = cache_scope(tenant, auth)
+    key = (*scope, "INDEX", path) if scope and CACHE_ENABLED else None
+
+    index = response_cache.get(key) if key else None
+    if index is None:
+        generation = response_cache.generation(tenant)
+        account = await make_request("GET", path, auth=auth)
+        if is_error(account):
+            return account
+        index = TransactionIndex(account.get("transactions") or [])
+        if key:
+            response_cache.set(key, index, TRANSACTION_INDEX_TTL, generation=generation)
+    return index
 
 
 @mcp.tool(name="get_savings_account_transactions")
@@ -44,14 +91,52 @@ async def get_savings_transactions(
     savings_id: int,
     username: str,
     password: str,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    transaction_type: Optional[str] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Get List Savings Account Transactions"""
+    """Get List Savings Account Transactions
+
+    Without filters returns the account with its full history (fields/profile apply to it). With
+    any of from_date/to_date (YYYY-MM-DD), transaction_type, min_amount/max_amount, limit or cursor,
+    returns a compact, newest-first window (default 50 items, at most 500) plus nextCursor for the following page.
+    """
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/savingsaccounts/{savings_id}?associations=transactions",
-        auth=auth,
+    filters = (from_date, to_date, transaction_type, min_amount, max_amount, limit, cursor)
+    if all(value is None for value in filters):
+        path = with_fields(f"/self/savingsaccounts/{savings_id}?associations=transactions", fields)
+        return await projected(make_request("GET", path, auth=auth), profile, fields)
+
+    try:
+        start = date.fromisoformat(from_date) if from_date else None
+        end = date.fromisoformat(to_date) if to_date else None
+        if cursor is not None:
+            decode_cursor(cursor)
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+    except ValueError as e:
+        return {"error": True, "status_code": 400, "message": str(e)}
+
+    index = await get_savings_transaction_index(savings_id, auth)
+    if not isinstance(index, TransactionIndex):
+        return index
+
+    window = index.query(
+        from_date=start,
+        to_date=end,
+        transaction_type=transaction_type,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        limit=min(limit or 50, MAX_TRANSACTION_PAGE),
+        cursor=cursor,
     )
+    return {"savingsId": savings_id, **window}
 
 
 @mcp.tool(name="get_savings_account_transaction_details")
@@ -60,14 +145,13 @@ async def get_savings_transaction_details(
     transaction_id: int,
     username: str,
     password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get Detail of Savings Account Transaction"""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/savingsaccounts/{savings_id}/transactions/{transaction_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/savingsaccounts/{savings_id}/transactions/{transaction_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_savings_account_charges")
@@ -75,14 +159,13 @@ async def get_savings_charges(
     savings_id: int,
     username: str,
     password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get List of Savings Account Charges"""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/savingsaccounts/{savings_id}/charges",
-        auth=auth,
-    )
+    path = with_fields(f"/self/savingsaccounts/{savings_id}/charges", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_savings_account_template_raw")
@@ -91,14 +174,13 @@ async def get_savings_template_raw(
     product_id: int,
     username: str,
     password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Get Savings Account Template (Raw)"""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET",
-        f"/self/savingsaccounts/template?clientId={client_id}&productId={product_id}",
-        auth=auth,
-    )
+    path = with_fields(f"/self/savingsaccounts/template?clientId={client_id}&productId={product_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="submit_savings_application")
@@ -107,13 +189,20 @@ async def submit_savings_application(
     username: str,
     password: str,
 ) -> Dict[str, Any]:
-    """Request a New Savings Account (Submit Application)"""
+    """Request a New Savings Account (Submit Application)
+
+    data needs clientId, productId and submittedOnDate (in dateFormat, default "dd MMMM yyyy"); it is
+    checked before anything is sent.
+    """
+    payload, error = preflight(SavingsApplicationRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
     return await make_request(
         "POST",
         "/self/savingsaccounts",
         auth=auth,
-        data=data,
+        data=payload,
     )
 
 
@@ -124,11 +213,14 @@ async def update_savings_application(
     username: str,
     password: str,
 ) -> Dict[str, Any]:
-    """Update a Savings Account Application"""
+    """Update a Savings Account Application (the fields given are checked before sending)"""
+    payload, error = preflight(SavingsApplicationRequest, data, partial=True)
+    if error:
+        return error
     auth = get_auth_header(username, password)
     return await make_request(
         "PUT",
         f"/self/savingsaccounts/{savings_id}",
         auth=auth,
-        data=data,
+        data=payload,
     )
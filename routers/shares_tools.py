@@ -1,18 +1,34 @@
 from mcp_app import mcp
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.projection import projected, with_fields
 
 
 @mcp.tool(name="get_share_product_list")
-async def get_shares_products(client_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_shares_products(
+    client_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get List of Share Product"""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/products/share?clientId={client_id}", auth=auth)
+    path = with_fields(f"/self/products/share?clientId={client_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_share_product_details")
-async def get_shares_product_details(client_id: int, product_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_shares_product_details(
+    client_id: int,
+    product_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get Share Product Details"""
     auth = get_auth_header(username, password)
-    return await make_request("GET", f"/self/products/share?clientId={client_id}&productId={product_id}", auth=auth)
+    path = with_fields(f"/self/products/share?clientId={client_id}&productId={product_id}", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
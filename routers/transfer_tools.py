@@ -1,55 +1,176 @@
+import asyncio
+from mcp.server.fastmcp import Context
 from mcp_app import mcp
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from utils.http import make_request
 from utils.auth import get_auth_header
+from utils.fineract import is_error
+from utils.projection import projected, with_fields
+from utils.validation import check_payload, preflight
+from schemas.transfer import TransferRequest
 
 
 @mcp.tool(name="transfer_to_third_party_template")
-async def get_transfer_template(username: str, password: str) -> Dict[str, Any]:
+async def get_transfer_template(
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Transfer to Third Party (Template) - Retrieves template for third-party transfers."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/accounttransfers/template?type=tpt", auth=auth)
+    path = with_fields("/self/accounttransfers/template?type=tpt", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="transfer_between_accounts")
 async def transfer_between_accounts(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Transfer Between Accounts - Executes a transfer between accounts."""
+    """Transfer Between Accounts - Executes a transfer between accounts.
+
+    data is a TransferRequest, as for make_account_transfer.
+    """
+    payload, error = preflight(TransferRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/accounttransfers", auth=auth, data=data)
+    return await make_request("POST", "/self/accounttransfers", auth=auth, data=payload)
 
 
 @mcp.tool(name="transfer_to_third_party")
 async def transfer_third_party(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Transfer to Third Party - Executes a third-party transfer."""
+    """Transfer to Third Party - Executes a third-party transfer.
+
+    data is a TransferRequest, as for make_account_transfer.
+    """
+    payload, error = preflight(TransferRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/accounttransfers?type=tpt", auth=auth, data=data)
+    return await make_request("POST", "/self/accounttransfers?type=tpt", auth=auth, data=payload)
 
 
 @mcp.tool(name="get_account_transfer_template")
-async def get_account_transfer_template(savings_id: int, username: str, password: str) -> Dict[str, Any]:
+async def get_account_transfer_template(
+    savings_id: int,
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get Account Transfer Template - Retrieves template for account transfers from a specific savings account."""
     auth = get_auth_header(username, password)
-    return await make_request(
-        "GET", f"/self/accounttransfers/template?fromAccountId={savings_id}&fromAccountType=2", auth=auth
-    )
+    path = with_fields(f"/self/accounttransfers/template?fromAccountId={savings_id}&fromAccountType=2", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="get_third_party_transfer_template")
-async def get_third_party_transfer_template(username: str, password: str) -> Dict[str, Any]:
+async def get_third_party_transfer_template(
+    username: str,
+    password: str,
+    fields: Optional[str] = None,
+    profile: Optional[str] = None,
+) -> Dict[str, Any]:
     """Get Third Party Transfer Template - Retrieves template for third-party transfers."""
     auth = get_auth_header(username, password)
-    return await make_request("GET", "/self/accounttransfers/template?type=tpt", auth=auth)
+    path = with_fields("/self/accounttransfers/template?type=tpt", fields)
+    return await projected(make_request("GET", path, auth=auth), profile, fields)
 
 
 @mcp.tool(name="make_third_party_transfer")
 async def make_third_party_transfer(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Make Third Party Transfer - Executes a third-party transfer."""
+    """Make Third Party Transfer - Executes a third-party transfer.
+
+    data is a TransferRequest, as for make_account_transfer.
+    """
+    payload, error = preflight(TransferRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/accounttransfers?type=tpt", auth=auth, data=data)
+    return await make_request("POST", "/self/accounttransfers?type=tpt", auth=auth, data=payload)
 
 
 @mcp.tool(name="make_account_transfer")
 async def make_account_transfer(data: Dict[str, Any], username: str, password: str) -> Dict[str, Any]:
-    """Make Account Transfer - Executes a transfer between accounts."""
+    """Make Account Transfer - Executes a transfer between accounts.
+
+    data needs fromOfficeId, fromClientId, fromAccountType, fromAccountId, the same four to* fields (account
+    types: 1=Loan, 2=Savings), transferAmount, transferDate (in dateFormat, default "dd MMMM yyyy") and
+    transferDescription. It is checked before anything is sent and field errors come back at once.
+    """
+    payload, error = preflight(TransferRequest, data)
+    if error:
+        return error
     auth = get_auth_header(username, password)
-    return await make_request("POST", "/self/accounttransfers", auth=auth, data=data)
+    return await make_request("POST", "/self/accounttransfers", auth=auth, data=payload)
+
+
+@mcp.tool(name="make_batch_transfers")
+async def make_batch_transfers(
+    transfers: List[Dict[str, Any]],
+    username: str,
+    password: str,
+    third_party: bool = False,
+    max_concurrency: int = 4,
+    max_failures: int = 1,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Make Batch Transfers - Executes a list of account (or third-party) transfers.
+
+    Every payload is checked like make_account_transfer's before anything is sent. Transfers from the same
+    source account run in the given order; different source accounts run concurrently, up to max_concurrency
+    at a time. Once max_failures transfers have failed, transfers not yet started are skipped. Progress is
+    streamed per item and the result lists the outcome of every transfer by index.
+    """
+    checked = [check_payload(TransferRequest, payload) for payload in transfers]
+    invalid = [{"index": index, "errors": errors} for index, (_, errors) in enumerate(checked) if errors]
+    if invalid:
+        return {
+            "error": True,
+            "status_code": 400,
+            "message": "Batch rejected: invalid transfers, nothing was sent",
+            "invalid": invalid,
+        }
+    transfers = [payload for payload, _ in checked]
+
+    auth = get_auth_header(username, password)
+    path = "/self/accounttransfers?type=tpt" if third_party else "/self/accounttransfers"
+    limiter = asyncio.Semaphore(max(1, max_concurrency))
+    results: List[Dict[str, Any]] = [{"index": index, "status": "skipped"} for index in range(len(transfers))]
+    failures = 0
+    completed = 0
+
+    # Queue transfers per source account so each account sees its debits in order.
+    queues: Dict[Any, List[int]] = {}
+    for index, payload in enumerate(transfers):
+        queues.setdefault((payload["fromAccountType"], payload["fromAccountId"]), []).append(index)
+
+    async def run_queue(indexes: List[int]) -> None:
+        nonlocal failures, completed
+        for index in indexes:
+            async with limiter:
+                if failures >= max(1, max_failures):
+                    return
+                response = await make_request("POST", path, auth=auth, data=transfers[index])
+
+            completed += 1
+            if is_error(response):
+                failures += 1
+                results[index] = {
+                    "index": index,
+                    "status": "failed",
+                    "status_code": response.get("status_code"),
+                    "message": response.get("message"),
+                }
+            else:
+                results[index] = {"index": index, "status": "succeeded", "resourceId": response.get("resourceId")}
+
+            if ctx is not None:
+                await ctx.report_progress(completed, len(transfers))
+                await ctx.info(f"transfer {index}: {results[index]['status']}")
+
+    await asyncio.gather(*(run_queue(indexes) for indexes in queues.values()))
+
+    summary = {
+        status: sum(1 for r in results if r["status"] == status) for status in ("succeeded", "failed", "skipped")
+    }
+    return {"total": len(transfers), **summary, "stopped": summary["skipped"] > 0, "results": results}
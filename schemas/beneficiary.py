@@ -1,12 +1,22 @@
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import ConfigDict, Field
+from schemas.common import AccountType, FineractRequest
 
 
-class BeneficiaryRequest(BaseModel):
+class BeneficiaryRequest(FineractRequest):
     """Beneficiary request model"""
 
-    name: str
-    office_name: str = Field(alias="officeName")
-    account_number: str = Field(alias="accountNumber")
-    account_type: int = Field(alias="accountType")  # 1=Savings, 2=Loan
-    transfer_limit: float = Field(alias="transferLimit")
-    locale: str = "en"
+    name: str = Field(min_length=1)
+    office_name: str = Field(alias="officeName", min_length=1)
+    account_number: str = Field(alias="accountNumber", min_length=1)
+    account_type: AccountType = Field(alias="accountType")  # 1=Loan, 2=Savings
+    transfer_limit: Optional[float] = Field(default=None, alias="transferLimit", gt=0)
+
+
+class BeneficiaryUpdateRequest(FineractRequest):
+    """Beneficiary update request model; Fineract only lets the name and transfer limit change"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: Optional[str] = Field(default=None, min_length=1)
+    transfer_limit: Optional[float] = Field(default=None, alias="transferLimit", gt=0)
@@ -0,0 +1,67 @@
+import re
+from datetime import date
+from typing import Annotated, Any, ClassVar, Dict, Optional, Tuple
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, ValidationInfo, field_validator
+from utils.fineract import JAVA_DATE_TOKENS, parse_java_date
+
+DEFAULT_DATE_FORMAT = "dd MMMM yyyy"
+
+
+def _account_type(value: int) -> int:
+    if value not in (1, 2):
+        raise ValueError("must be 1 (loan) or 2 (savings)")
+    return value
+
+
+# Fineract portfolio account type of transfers and beneficiaries
+AccountType = Annotated[int, AfterValidator(_account_type)]
+
+
+def checked_date(value: str, date_format: str, locale: str) -> Optional[date]:
+    """``value`` parsed with ``date_format``, or None when the pattern cannot be checked locally.
+
+    Patterns with tokens other than ``JAVA_DATE_TOKENS``, and month names in a
+    non-English locale, are left for Fineract to judge. Raises ``ValueError``
+    when ``value`` does not match a pattern that can be checked.
+    """
+    remainder = date_format
+    for token, _ in JAVA_DATE_TOKENS:
+        remainder = remainder.replace(token, "")
+    if re.search("[A-Za-z]", remainder) or ("MMM" in date_format and not locale.lower().startswith("en")):
+        return None
+    return parse_java_date(value, date_format)
+
+
+class FineractRequest(BaseModel):
+    """Write payload checked before it is sent to Fineract.
+
+    Fields use Fineract's parameter names as aliases. Parameters the model does
+    not declare pass through unchanged. Dates named in ``DATE_FIELDS`` must match
+    ``dateFormat``, which is why it and ``locale`` come first.
+    """
+
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+    date_format: str = Field(default=DEFAULT_DATE_FORMAT, alias="dateFormat")
+    locale: str = "en"
+
+    DATE_FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    @field_validator("*")
+    @classmethod
+    def _match_date_format(cls, value: Any, info: ValidationInfo) -> Any:
+        if info.field_name in cls.DATE_FIELDS and isinstance(value, str) and "date_format" in info.data:
+            date_format = info.data["date_format"]
+            try:
+                checked_date(value, date_format, info.data.get("locale", "en"))
+            except ValueError:
+                raise ValueError(f"does not match dateFormat {date_format!r}") from None
+        return value
+
+    def payload(self) -> Dict[str, Any]:
+        """The fields that were given, under Fineract's names, with ``dateFormat`` and ``locale`` added for dates."""
+        data = self.model_dump(by_alias=True, exclude_unset=True)
+        if self.DATE_FIELDS:
+            data.setdefault("dateFormat", self.date_format)
+            data.setdefault("locale", self.locale)
+        return data
@@ -0,0 +1,41 @@
+from typing import Any, Optional
+from pydantic import Field, ValidationInfo, field_validator
+from schemas.common import FineractRequest, checked_date
+
+
+class LoanApplicationRequest(FineractRequest):
+    """Loan application request model (enum codes as in calculateLoanSchedule payloads)"""
+
+    client_id: int = Field(alias="clientId")
+    product_id: int = Field(alias="productId")
+    loan_type: str = Field(default="individual", alias="loanType")
+    principal: float = Field(gt=0)
+    loan_term_frequency: int = Field(alias="loanTermFrequency", gt=0)
+    loan_term_frequency_type: int = Field(alias="loanTermFrequencyType", ge=0, le=3)  # days, weeks, months, years
+    number_of_repayments: int = Field(alias="numberOfRepayments", gt=0)
+    repayment_every: int = Field(alias="repaymentEvery", gt=0)
+    repayment_frequency_type: int = Field(alias="repaymentFrequencyType", ge=0, le=3)
+    interest_rate_per_period: float = Field(alias="interestRatePerPeriod", ge=0)
+    amortization_type: int = Field(alias="amortizationType", ge=0, le=1)  # equal principal, equal installments
+    interest_type: int = Field(alias="interestType", ge=0, le=1)  # declining balance, flat
+    interest_calculation_period_type: int = Field(alias="interestCalculationPeriodType", ge=0, le=1)
+    transaction_processing_strategy_code: Optional[str] = Field(default=None, alias="transactionProcessingStrategyCode")
+    submitted_on_date: str = Field(alias="submittedOnDate")
+    expected_disbursement_date: str = Field(alias="expectedDisbursementDate")
+
+    DATE_FIELDS = ("submitted_on_date", "expected_disbursement_date")
+
+    @field_validator("expected_disbursement_date")
+    @classmethod
+    def _not_before_submission(cls, value: Any, info: ValidationInfo) -> Any:
+        if not isinstance(info.data.get("submitted_on_date"), str) or "date_format" not in info.data:
+            return value
+        date_format, locale = info.data["date_format"], info.data.get("locale", "en")
+        try:
+            submitted_on = checked_date(info.data["submitted_on_date"], date_format, locale)
+            disbursed_on = checked_date(value, date_format, locale)
+        except ValueError:
+            return value
+        if submitted_on and disbursed_on and disbursed_on < submitted_on:
+            raise ValueError("is before submittedOnDate")
+        return value
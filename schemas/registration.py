@@ -1,14 +1,19 @@
-from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from pydantic import Field
+from schemas.common import FineractRequest
 
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
 
-class RegistrationRequest(BaseModel):
+
+class RegistrationRequest(FineractRequest):
     """Self-service registration request model"""
 
-    username: str
-    account_number: str = Field(alias="accountNumber")
-    password: str
-    first_name: str = Field(alias="firstName")
-    mobile_number: str = Field(alias="mobileNumber")
-    last_name: str = Field(alias="lastName")
-    email: str
-    authentication_mode: str = Field(default="email", alias="authenticationMode")
+    username: str = Field(min_length=1)
+    account_number: str = Field(alias="accountNumber", min_length=1)
+    password: str = Field(min_length=1)
+    first_name: str = Field(alias="firstName", min_length=1)
+    middle_name: Optional[str] = Field(default=None, alias="middleName")
+    mobile_number: str = Field(alias="mobileNumber", min_length=1)
+    last_name: str = Field(alias="lastName", min_length=1)
+    email: str = Field(pattern=EMAIL_PATTERN)
+    authentication_mode: Literal["email", "mobile"] = Field(default="email", alias="authenticationMode")
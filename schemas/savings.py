@@ -0,0 +1,14 @@
+from typing import Optional
+from pydantic import Field
+from schemas.common import FineractRequest
+
+
+class SavingsApplicationRequest(FineractRequest):
+    """Savings account application request model"""
+
+    client_id: int = Field(alias="clientId")
+    product_id: int = Field(alias="productId")
+    submitted_on_date: str = Field(alias="submittedOnDate")
+    nominal_annual_interest_rate: Optional[float] = Field(default=None, alias="nominalAnnualInterestRate", ge=0)
+
+    DATE_FIELDS = ("submitted_on_date",)
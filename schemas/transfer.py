@@ -1,19 +1,29 @@
-from pydantic import BaseModel, Field
+from typing import Any
+from pydantic import Field, ValidationInfo, field_validator
+from schemas.common import AccountType, FineractRequest
 
 
-class TransferRequest(BaseModel):
+class TransferRequest(FineractRequest):
     """Transfer request model"""
 
+    from_office_id: int = Field(alias="fromOfficeId")
+    from_client_id: int = Field(alias="fromClientId")
+    from_account_type: AccountType = Field(alias="fromAccountType")
+    from_account_id: int = Field(alias="fromAccountId")
     to_office_id: int = Field(alias="toOfficeId")
     to_client_id: int = Field(alias="toClientId")
-    to_account_type: int = Field(alias="toAccountType")
-    to_account_id: str = Field(alias="toAccountId")
-    transfer_amount: float = Field(alias="transferAmount")
+    to_account_type: AccountType = Field(alias="toAccountType")
+    to_account_id: int = Field(alias="toAccountId")
+    transfer_amount: float = Field(alias="transferAmount", gt=0)
     transfer_date: str = Field(alias="transferDate")
-    transfer_description: str = Field(alias="transferDescription")
-    date_format: str = Field(default="dd MMMM yyyy", alias="dateFormat")
-    locale: str = "en"
-    from_account_id: str = Field(alias="fromAccountId")
-    from_account_type: str = Field(alias="fromAccountType")
-    from_client_id: int = Field(alias="fromClientId")
-    from_office_id: int = Field(alias="fromOfficeId")
+    transfer_description: str = Field(alias="transferDescription", min_length=1)
+
+    DATE_FIELDS = ("transfer_date",)
+
+    @field_validator("to_account_id")
+    @classmethod
+    def _different_accounts(cls, value: Any, info: ValidationInfo) -> Any:
+        source = (info.data.get("from_account_type"), info.data.get("from_account_id"))
+        if source == (info.data.get("to_account_type"), value):
+            raise ValueError("is the source account; transfers need two different accounts")
+        return value
@@ -0,0 +1,105 @@
+import pytest
+from utils.amortization import UnsupportedSchedule, calculate_schedule
+
+PAYLOAD = {
+    "clientId": 1,
+    "productId": 1,
+    "principal": "10000.00",
+    "loanTermFrequency": 12,
+    "loanTermFrequencyType": 2,
+    "numberOfRepayments": 12,
+    "repaymentEvery": 1,
+    "repaymentFrequencyType": 2,
+    "interestRatePerPeriod": 1,
+    "interestRateFrequencyType": 2,
+    "amortizationType": 1,
+    "interestType": 0,
+    "interestCalculationPeriodType": 1,
+    "expectedDisbursementDate": "31 January 2025",
+    "transactionProcessingStrategyCode": "mifos-standard-strategy",
+    "loanType": "individual",
+    "dateFormat": "dd MMMM yyyy",
+    "locale": "en",
+}
+
+# calculateLoanSchedule response for PAYLOAD (repayment periods only): 12 monthly installments of 888.49
+SERVER_PERIODS = [
+    (1, [2025, 2, 28], 788.49, 100.00, 9211.51),
+    (2, [2025, 3, 31], 796.37, 92.12, 8415.14),
+    (3, [2025, 4, 30], 804.34, 84.15, 7610.80),
+    (4, [2025, 5, 31], 812.38, 76.11, 6798.42),
+    (5, [2025, 6, 30], 820.51, 67.98, 5977.91),
+    (6, [2025, 7, 31], 828.71, 59.78, 5149.20),
+    (7, [2025, 8, 31], 837.00, 51.49, 4312.20),
+    (8, [2025, 9, 30], 845.37, 43.12, 3466.83),
+    (9, [2025, 10, 31], 853.82, 34.67, 2613.01),
+    (10, [2025, 11, 30], 862.36, 26.13, 1750.65),
+    (11, [2025, 12, 31], 870.98, 17.51, 879.67),
+    (12, [2026, 1, 31], 879.67, 8.80, 0.00),
+]
+SERVER_TOTALS = {"totalPrincipalExpected": 10000.00, "totalInterestCharged": 661.86, "totalRepaymentExpected": 10661.86}
+
+
+def test_declining_equal_installments_matches_server_schedule():
+    schedule = calculate_schedule(PAYLOAD)
+
+    periods = [
+        (p["period"], p["dueDate"], p["principalDue"], p["interestDue"], p["principalLoanBalanceOutstanding"])
+        for p in schedule["periods"][1:]
+    ]
+    assert periods == SERVER_PERIODS
+    assert schedule["periods"][0]["principalDisbursed"] == 10000.0
+    for key, value in SERVER_TOTALS.items():
+        assert schedule[key] == pytest.approx(value)
+    assert schedule["loanTermInDays"] == 365
+
+
+def test_declining_equal_principal():
+    schedule = calculate_schedule({**PAYLOAD, "amortizationType": 0, "numberOfRepayments": 4})
+    periods = schedule["periods"][1:]
+
+    assert [p["principalDue"] for p in periods] == [2500.0] * 4
+    assert [p["interestDue"] for p in periods] == [100.0, 75.0, 50.0, 25.0]
+
+
+def test_flat_interest_spreads_interest_evenly():
+    schedule = calculate_schedule({**PAYLOAD, "interestType": 1, "numberOfRepayments": 3, "principal": 1000})
+    periods = schedule["periods"][1:]
+
+    assert [p["interestDue"] for p in periods] == [10.0, 10.0, 10.0]
+    assert [p["principalDue"] for p in periods] == [333.33, 333.33, 333.34]
+    assert schedule["totalInterestCharged"] == 30.0
+
+
+def test_grace_on_principal_and_interest_payment():
+    schedule = calculate_schedule(
+        {**PAYLOAD, "numberOfRepayments": 4, "graceOnPrincipalPayment": 1, "graceOnInterestPayment": 1}
+    )
+    first, second = schedule["periods"][1:3]
+
+    assert (first["principalDue"], first["interestDue"]) == (0.0, 0.0)
+    assert second["interestDue"] == 200.0
+    assert schedule["totalPrincipalExpected"] == 10000.0
+
+
+def test_weekly_repayments_use_annual_rate_over_52_weeks():
+    schedule = calculate_schedule(
+        {**PAYLOAD, "repaymentFrequencyType": 1, "interestRatePerPeriod": 52, "interestRateFrequencyType": 3}
+    )
+    assert schedule["periods"][1]["dueDate"] == [2025, 2, 7]
+    assert schedule["periods"][1]["interestDue"] == 100.0
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"charges": [{"chargeId": 1, "amount": 10}]},
+        {"interestCalculationPeriodType": 0},
+        {"fixedEmiAmount": 900},
+        {"interestRateFrequencyType": 4},
+        {"principal": None},
+    ],
+)
+def test_unsupported_configurations_raise(overrides):
+    with pytest.raises(UnsupportedSchedule):
+        calculate_schedule({**PAYLOAD, **overrides})
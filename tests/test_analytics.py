@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from utils.analytics import filter_dates, summarize, to_columns
+from routers.analytics_tools import analyze_account_transactions
+
+SAVINGS = [
+    {
+        "id": 3,
+        "date": [2025, 2, 10],
+        "transactionType": {"withdrawal": True, "value": "Withdrawal"},
+        "amount": 40.0,
+        "runningBalance": 560.0,
+        "paymentDetailData": {"paymentType": {"name": "Card"}},
+    },
+    {
+        "id": 1,
+        "date": [2025, 1, 2],
+        "transactionType": {"deposit": True, "value": "Deposit"},
+        "amount": 700.0,
+        "runningBalance": 700.0,
+    },
+    {
+        "id": 2,
+        "date": [2025, 1, 20],
+        "transactionType": {"withdrawal": True, "value": "Withdrawal"},
+        "amount": 100.0,
+        "runningBalance": 600.0,
+        "paymentDetailData": {"accountNumber": "000123"},
+    },
+    {
+        "id": 4,
+        "date": [2025, 2, 11],
+        "transactionType": {"withdrawal": True, "value": "Withdrawal"},
+        "amount": 999.0,
+        "reversed": True,
+    },
+]
+
+
+def test_to_columns_sorts_and_signs():
+    columns = to_columns(SAVINGS, "savings")
+    assert [str(day) for day in columns["date"]] == ["2025-01-02", "2025-01-20", "2025-02-10"]
+    assert columns["signed"].tolist() == [700.0, -100.0, -40.0]
+
+
+def test_to_columns_drops_non_cash_loan_entries():
+    loan = [
+        {"id": 1, "date": [2025, 1, 2], "type": {"disbursement": True, "value": "Disbursement"}, "amount": 900.0},
+        {"id": 2, "date": [2025, 1, 31], "type": {"accrual": True, "value": "Accrual"}, "amount": 9.0},
+        {"id": 3, "date": [2025, 2, 1], "type": {"waiveCharges": True, "value": "Waive loan charges"}, "amount": 5.0},
+    ]
+
+    assert to_columns(loan, "loan")["signed"].tolist() == [900.0]
+
+
+def test_summarize_monthly_flows_and_breakdowns():
+    summary = summarize(to_columns(SAVINGS, "savings"), top_n=1)
+
+    assert summary["totals"] == {"inflow": 700.0, "outflow": 140.0, "net": 560.0}
+    assert summary["monthly"] == [
+        {"month": "2025-01", "inflow": 700.0, "outflow": 100.0, "net": 600.0, "closingBalance": 600.0},
+        {"month": "2025-02", "inflow": 0.0, "outflow": 40.0, "net": -40.0, "closingBalance": 560.0},
+    ]
+    assert summary["balance"]["source"] == "reported"
+    assert summary["byType"][0] == {"label": "Deposit", "count": 1, "total": 700.0}
+    assert summary["topDebitCounterparties"] == [{"label": "account 000123", "count": 1, "total": 100.0}]
+    assert summary["largestDebit"] == 100.0
+
+
+def test_summarize_without_running_balance_uses_cumulative_flow():
+    rows = [{key: value for key, value in txn.items() if key != "runningBalance"} for txn in SAVINGS]
+    summary = summarize(to_columns(rows, "savings"))
+    assert summary["balance"] == {
+        "source": "cumulative_net_flow",
+        "opening": 700.0,
+        "closing": 560.0,
+        "min": 560.0,
+        "max": 700.0,
+    }
+
+
+def test_filter_dates_and_empty_summary():
+    columns = filter_dates(to_columns(SAVINGS, "savings"), "2025-02-01", None)
+    assert columns["amount"].tolist() == [40.0]
+    assert summarize(filter_dates(columns, "2026-01-01", None)) == {"transactions": 0}
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+async def test_analyze_account_transactions_for_savings(mock_make_request):
+    mock_make_request.return_value = {"id": 9, "transactions": SAVINGS}
+
+    result = await analyze_account_transactions("user1", "pwd", savings_id=9, from_date="2025-01-15")
+
+    mock_make_request.assert_called_once()
+    assert result["source"] == "savings"
+    assert result["totals"] == {"inflow": 0.0, "outflow": 140.0, "net": -140.0}
+
+
+@pytest.mark.asyncio
+@patch("utils.projection.RESPONSE_PROFILE", "minimal")
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+async def test_analyze_account_transactions_ignores_the_default_profile(mock_make_request):
+    mock_make_request.return_value = {"id": 9, "transactions": SAVINGS}
+
+    result = await analyze_account_transactions("user1", "pwd", savings_id=9, from_date="2025-01-15")
+
+    assert result["totals"] == {"inflow": 0.0, "outflow": 140.0, "net": -140.0}
+    assert [row["label"] for row in result["topDebitCounterparties"]] == ["account 000123", "Card"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_account_transactions_requires_one_account():
+    result = await analyze_account_transactions("user1", "pwd")
+    assert result["status_code"] == 400
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, AsyncMock
+from config.config import DEFAULT_TENANT
 from routers.auth_tools import (
     register_self_service,
     confirm_registration,
@@ -8,7 +9,11 @@ from routers.auth_tools import (
     update_password_self,
     verify_user_registration_alias,
     authenticate_user_alias,
+    get_session,
+    logout,
 )
+from utils.auth import sessions
+from tests.test_session import LOGIN_RESPONSE
 
 
 @pytest.mark.asyncio
@@ -62,7 +67,7 @@ async def test_login_mifos(mock_make_request):
     result = await login_mifos("user1", "pwd")
     assert result == {"token": "auth_token"}
     mock_make_request.assert_called_once_with(
-        "POST", "/self/authentication", data={"username": "user1", "password": "pwd"}
+        "POST", "/self/authentication", data={"username": "user1", "password": "pwd"}, tenant=DEFAULT_TENANT
     )
 
 
@@ -111,3 +116,30 @@ async def test_authenticate_user_alias(mock_login_mifos):
     result = await authenticate_user_alias("user1", "pwd")
     assert result == {"status": "authenticated"}
     mock_login_mifos.assert_called_once_with("user1", "pwd")
+
+
+@pytest.mark.asyncio
+@patch("routers.auth_tools.make_request", new_callable=AsyncMock)
+async def test_login_creates_reusable_session(mock_make_request):
+    mock_make_request.return_value = dict(LOGIN_RESPONSE)
+    result = await login_mifos("maria", "password")
+
+    session_id = result["sessionId"]
+    assert result["clients"] == [42]
+    details = await get_session(session_id)
+    assert details["clientId"] == 42
+    assert details["permissions"] == LOGIN_RESPONSE["permissions"]
+
+    assert await logout(session_id) == {"message": "Session ended", "sessionId": session_id}
+    assert (await get_session(session_id))["status_code"] == 401
+    assert len(sessions) == 0
+
+
+@pytest.mark.asyncio
+@patch("routers.auth_tools.make_request", new_callable=AsyncMock)
+async def test_failed_login_creates_no_session(mock_make_request):
+    mock_make_request.return_value = {"error": True, "status_code": 401, "message": "Unauthorized"}
+    result = await login_mifos("maria", "wrong")
+
+    assert "sessionId" not in result
+    assert len(sessions) == 0
@@ -8,6 +8,7 @@ from routers.beneficiary_tools import (
     update_beneficiary_savings,
     update_beneficiary_loan,
     delete_beneficiary,
+    sync_beneficiaries,
 )
 
 
@@ -48,7 +49,7 @@ async def test_get_beneficiary_list(mock_get_auth_header, mock_make_request, moc
 async def test_create_beneficiary_savings(mock_get_auth_header, mock_make_request, mock_auth):
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 1}
-    data = {"name": "Ben"}
+    data = {"name": "Ben", "officeName": "Head Office", "accountNumber": "000000101", "accountType": 2}
 
     result = await create_beneficiary_savings(data, "user1", "pwd")
     assert result == {"resourceId": 1}
@@ -62,7 +63,7 @@ async def test_create_beneficiary_savings(mock_get_auth_header, mock_make_reques
 async def test_create_beneficiary_loan(mock_get_auth_header, mock_make_request, mock_auth):
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 2}
-    data = {"name": "Ben Loan"}
+    data = {"name": "Ben Loan", "officeName": "Head Office", "accountNumber": "000000201", "accountType": 1}
 
     result = await create_beneficiary_loan(data, "user1", "pwd")
     assert result == {"resourceId": 2}
@@ -109,3 +110,153 @@ async def test_delete_beneficiary(mock_get_auth_header, mock_make_request, mock_
     assert result == {"resourceId": 3}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with("DELETE", "/self/beneficiaries/tpt/3", auth=mock_auth)
+
+
+SERVER_BENEFICIARIES = [
+    {
+        "id": 1,
+        "name": "Alice",
+        "officeName": "HQ",
+        "accountNumber": "0001",
+        "accountType": {"id": 1},
+        "transferLimit": 100,
+    },
+    {
+        "id": 2,
+        "name": "Bob",
+        "officeName": "HQ",
+        "accountNumber": "0002",
+        "accountType": {"id": 1},
+        "transferLimit": 50,
+    },
+    {
+        "id": 3,
+        "name": "Carol",
+        "officeName": "HQ",
+        "accountNumber": "0003",
+        "accountType": {"id": 1},
+        "transferLimit": 10,
+    },
+    {
+        "id": 4,
+        "name": "Dan",
+        "officeName": "HQ",
+        "accountNumber": "0004",
+        "accountType": {"id": 1},
+        "transferLimit": 10,
+    },
+]
+
+DESIRED_BENEFICIARIES = [
+    {"name": "Alice", "officeName": "HQ", "accountNumber": "0001", "accountType": 1, "transferLimit": 100},
+    {"name": "Bob", "officeName": "HQ", "accountNumber": "0002", "accountType": 1, "transferLimit": 75},
+    {"name": "Carol", "officeName": "Branch", "accountNumber": "0003", "accountType": 1, "transferLimit": 10},
+    {"name": "Erin", "officeName": "HQ", "accountNumber": "0005", "accountType": 2, "transferLimit": 20},
+]
+
+
+@pytest.mark.asyncio
+@patch("routers.beneficiary_tools.make_request", new_callable=AsyncMock)
+@patch("routers.beneficiary_tools.get_auth_header")
+async def test_sync_beneficiaries_dry_run(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = SERVER_BENEFICIARIES
+
+    result = await sync_beneficiaries(DESIRED_BENEFICIARIES, "user1", "pwd")
+
+    mock_make_request.assert_called_once_with("GET", "/self/beneficiaries/tpt", auth=mock_auth)
+    assert result["dryRun"] is True
+    assert result["summary"] == {"create": 1, "update": 1, "replace": 1, "delete": 1, "unchanged": 1}
+    assert {change["action"]: change["accountNumber"] for change in result["changes"]} == {
+        "update": "0002",
+        "replace": "0003",
+        "create": "0005",
+        "delete": "0004",
+    }
+
+
+@pytest.mark.asyncio
+@patch("routers.beneficiary_tools.make_request", new_callable=AsyncMock)
+@patch("routers.beneficiary_tools.get_auth_header")
+async def test_sync_beneficiaries_applies_changes(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+
+    def respond(method, path, auth, data=None):
+        if method == "GET":
+            return SERVER_BENEFICIARIES
+        if method == "POST" and data["accountNumber"] == "0005":
+            return {"error": True, "status_code": 400, "message": "unknown account"}
+        return {"resourceId": 1}
+
+    mock_make_request.side_effect = respond
+
+    result = await sync_beneficiaries(DESIRED_BENEFICIARIES, "user1", "pwd", dry_run=False)
+
+    calls = [(c.args[0], c.args[1], c.kwargs.get("data")) for c in mock_make_request.call_args_list]
+    assert ("PUT", "/self/beneficiaries/tpt/2", {"name": "Bob", "transferLimit": 75.0}) in calls
+    assert ("DELETE", "/self/beneficiaries/tpt/3", None) in calls
+    assert ("DELETE", "/self/beneficiaries/tpt/4", None) in calls
+    assert (
+        "POST",
+        "/self/beneficiaries/tpt",
+        {
+            "locale": "en",
+            "accountNumber": "0003",
+            "name": "Carol",
+            "officeName": "Branch",
+            "accountType": 1,
+            "transferLimit": 10.0,
+        },
+    ) in calls
+    assert result["summary"]["failed"] == 1
+    assert [c["status"] for c in result["changes"] if c["accountNumber"] == "0005"] == ["failed"]
+
+
+@pytest.mark.asyncio
+@patch("routers.beneficiary_tools.make_request", new_callable=AsyncMock)
+async def test_sync_beneficiaries_rejects_invalid_desired_list(mock_make_request):
+    result = await sync_beneficiaries(
+        [{"accountNumber": "1"}, DESIRED_BENEFICIARIES[0], DESIRED_BENEFICIARIES[0]], "user1", "pwd"
+    )
+
+    mock_make_request.assert_not_called()
+    assert [item["index"] for item in result["invalid"]] == [0, 2]
+
+
+@pytest.mark.asyncio
+@patch("routers.beneficiary_tools.make_request", new_callable=AsyncMock)
+async def test_sync_beneficiaries_checks_items_against_the_schema(mock_make_request):
+    desired = [
+        {**DESIRED_BENEFICIARIES[0], "accountType": "savings"},
+        {**DESIRED_BENEFICIARIES[1], "accountType": 7},
+        {**DESIRED_BENEFICIARIES[2], "transferLimit": -5},
+    ]
+
+    result = await sync_beneficiaries(desired, "user1", "pwd")
+
+    mock_make_request.assert_not_called()
+    assert result["status_code"] == 400
+    assert [(item["index"], [error["field"] for error in item["errors"]]) for item in result["invalid"]] == [
+        (0, ["accountType"]),
+        (1, ["accountType"]),
+        (2, ["transferLimit"]),
+    ]
+
+
+@pytest.mark.asyncio
+@patch("routers.beneficiary_tools.make_request", new_callable=AsyncMock)
+@patch("routers.beneficiary_tools.get_auth_header")
+async def test_sync_beneficiaries_without_transfer_limit_keeps_the_current_one(
+    mock_get_auth_header, mock_make_request, mock_auth
+):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = SERVER_BENEFICIARIES[:2]
+    desired = [
+        {"name": "Alice", "officeName": "HQ", "accountNumber": "0001", "accountType": 1},
+        {"name": "Robert", "officeName": "HQ", "accountNumber": "0002", "accountType": 1},
+    ]
+
+    result = await sync_beneficiaries(desired, "user1", "pwd", dry_run=False)
+
+    assert result["summary"]["unchanged"] == 1
+    mock_make_request.assert_any_call("PUT", "/self/beneficiaries/tpt/2", auth=mock_auth, data={"name": "Robert"})
@@ -0,0 +1,118 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from benchmarks.fake_fineract import FakeFineract, FakeSettings
+import main  # noqa: F401
+import utils.budget as budget
+from mcp_app import mcp
+from utils.budget import ContinuationError, ContinuationStore, enforce_budget, truncate
+from utils.jsoncodec import json_codec
+
+ACCOUNT = FakeFineract(FakeSettings(transactions_per_account=300)).savings_account(101, True)
+
+
+def _size(value):
+    return len(json_codec.dumps(value))
+
+
+def _reassemble(kept, chunks):
+    transactions = list(kept["transactions"])
+    for chunk in chunks:
+        assert chunk.path == "transactions"
+        assert chunk.offset == len(transactions)
+        transactions.extend(chunk.items)
+    return transactions
+
+
+def test_responses_within_budget_are_untouched():
+    kept, chunks, size = truncate(ACCOUNT, _size(ACCOUNT))
+
+    assert kept is ACCOUNT
+    assert chunks == []
+    assert size == _size(ACCOUNT)
+
+
+def test_truncate_cuts_the_largest_list_at_element_boundaries():
+    kept, chunks, size = truncate(ACCOUNT, 20000)
+
+    assert size == _size(ACCOUNT)
+    assert _size(kept) <= 20000
+    assert kept["summary"] == ACCOUNT["summary"]
+    assert 0 < len(kept["transactions"]) < len(ACCOUNT["transactions"])
+    assert all(_size(chunk.items) <= 20000 for chunk in chunks)
+    assert _reassemble(kept, chunks) == ACCOUNT["transactions"]
+    assert len(ACCOUNT["transactions"]) == 300
+
+
+def test_top_level_lists_are_returned_as_page_items():
+    items = [{"id": n, "note": "x" * 100} for n in range(50)]
+
+    kept, chunks, _ = truncate(items, 2000)
+
+    assert kept["pageItems"] == items[: len(kept["pageItems"])]
+    assert {chunk.path for chunk in chunks} == {"pageItems"}
+
+
+def test_enforce_budget_reports_omitted_items():
+    result = enforce_budget(ACCOUNT, 20000)
+
+    continuation = result["continuation"]
+    assert continuation["bytes"] == _size(ACCOUNT)
+    assert continuation["omitted"] == {"transactions": 300 - len(result["transactions"])}
+    assert continuation["nextCursor"].startswith(budget.CONTINUATION_PREFIX)
+
+
+def test_store_expires_evicts_and_rejects_bad_cursors():
+    now = [0.0]
+    store = ContinuationStore(ttl=10, max_entries=2, clock=lambda: now[0])
+    first = store.put([budget.Chunk("items", 0, [1]), budget.Chunk("items", 1, [2])])
+
+    chunk, number, total, next_cursor = store.get(first)
+    assert (chunk.items, number, total) == ([1], 0, 2)
+    assert store.get(next_cursor)[3] is None
+    with pytest.raises(ContinuationError):
+        store.get(first.rpartition(".")[0] + ".5")
+    with pytest.raises(ContinuationError):
+        store.get("mifos-cont-unknown.0")
+
+    store.put([budget.Chunk("items", 0, [3])])
+    store.put([budget.Chunk("items", 0, [4])])
+    assert len(store) == 2
+    with pytest.raises(ContinuationError):
+        store.get(first)
+
+    now[0] = 11
+    with pytest.raises(ContinuationError):
+        store.get(next_cursor)
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+@patch("routers.savings_tools.get_auth_header")
+async def test_fetch_continuation_serves_the_rest_without_refetching(
+    mock_get_auth_header, mock_make_request, monkeypatch
+):
+    mock_get_auth_header.return_value = "Basic abc"
+    mock_make_request.return_value = ACCOUNT
+    monkeypatch.setitem(budget.RESPONSE_BUDGETS, "get_savings_account_transactions", 20000)
+
+    first = await mcp._tool_manager.get_tool("get_savings_account_transactions").run(
+        {"savings_id": 101, "username": "u", "password": "p"}
+    )
+    transactions = list(first["transactions"])
+    cursor = first["continuation"]["nextCursor"]
+    while cursor:
+        part = await mcp._tool_manager.get_tool("fetch_continuation").run({"cursor": cursor})
+        assert part["offset"] == len(transactions)
+        transactions.extend(part["items"])
+        cursor = part["nextCursor"]
+
+    assert transactions == ACCOUNT["transactions"]
+    mock_make_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_fetch_continuation_unknown_cursor():
+    result = await mcp._tool_manager.get_tool("fetch_continuation").run({"cursor": "mifos-cont-missing.0"})
+
+    assert result["error"] is True
+    assert result["status_code"] == 404
@@ -0,0 +1,101 @@
+from utils.cache import ResponseCache, cache_scope, cache_ttl, invalidation_targets
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_ttl_only_for_known_reads():
+    assert cache_ttl("GET", "/self/loanproducts?clientId=1") == 300.0
+    assert cache_ttl("GET", "/self/clients/1/accounts") == 30.0
+    assert cache_ttl("GET", "/self/clients") == 120.0
+    assert cache_ttl("POST", "/self/loanproducts?clientId=1") == 0.0
+    assert cache_ttl("GET", "/self/unknown") == 0.0
+
+
+def test_cache_scope_hashes_credentials():
+    scope = cache_scope("default", "Basic dXNlcjE6cHdk")
+    assert scope[0] == "default"
+    assert "dXNlcjE6cHdk" not in scope[1]
+    assert cache_scope("default", None) is None
+    assert cache_scope("default", "Basic a") != cache_scope("default", "Basic b")
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.set("k", b"{}", ttl=10)
+
+    clock.now = 9.9
+    assert cache.get("k") == b"{}"
+    clock.now = 10.0
+    assert cache.get("k") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_bound_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=60)
+    cache.get("a")
+    cache.set("c", b"3", ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_hit_and_miss_counters():
+    cache = ResponseCache()
+    cache.get("a")
+    cache.set("a", b"1", ttl=60)
+    cache.get("a")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_invalidation_targets_follow_rules():
+    assert invalidation_targets("DELETE", "/self/beneficiaries/tpt/7") == (
+        ("/self/beneficiaries/tpt", "/self/accounttransfers/template"),
+        False,
+    )
+    assert invalidation_targets("PUT", "/self/savingsaccounts/5") == (
+        ("/self/savingsaccounts/5", "/self/clients"),
+        False,
+    )
+    assert invalidation_targets("POST", "/self/accounttransfers?type=tpt")[1] is True
+    assert invalidation_targets("POST", "/self/loans?command=calculateLoanSchedule") == ((), False)
+    assert invalidation_targets("PUT", "/self/user") == (("",), False)
+
+
+def test_invalidate_respects_prefix_boundaries_and_users():
+    cache = ResponseCache()
+    cache.set(("t", "u1", "GET", "/self/loans/1"), b"1", ttl=60)
+    cache.set(("t", "u1", "GET", "/self/loans/12"), b"2", ttl=60)
+    cache.set(("t", "u1", "GET", "/self/loans/1?associations=all"), b"3", ttl=60)
+    cache.set(("t", "u2", "GET", "/self/loans/1"), b"4", ttl=60)
+
+    assert cache.invalidate("t", "u1", ["/self/loans/1"]) == 2
+    assert cache.get(("t", "u1", "GET", "/self/loans/12")) == b"2"
+    assert cache.get(("t", "u2", "GET", "/self/loans/1")) == b"4"
+
+    assert cache.invalidate("t", None, ["/self/loans"]) == 2
+    assert len(cache) == 0
+
+
+def test_set_skips_responses_fetched_across_an_invalidation():
+    cache = ResponseCache()
+    key = ("t", "u1", "GET", "/self/clients/1/accounts")
+    generation = cache.generation("t")
+    cache.invalidate("t", "u1", ["/self/clients"])
+
+    cache.set(key, b"stale", ttl=60, generation=generation)
+    assert cache.get(key) is None
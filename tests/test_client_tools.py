@@ -8,6 +8,8 @@ from routers.client_tools import (
     get_client_charges,
     get_client_transactions,
     get_client_transaction_detail,
+    get_client_dashboard,
+    collect_client_transactions,
 )
 
 
@@ -63,7 +65,8 @@ async def test_get_client_accounts_with_fields(mock_get_auth_header, mock_make_r
     mock_make_request.return_value = {"loanAccounts": []}
 
     result = await get_client_accounts(1, "user1", "pwd", fields="loanAccounts")
-    assert result == {"loanAccounts": []}
+    assert result["loanAccounts"] == []
+    assert result["projection"]["fields"] == ["loanAccounts"]
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with("GET", "/self/clients/1/accounts?fields=loanAccounts", auth=mock_auth)
 
@@ -118,3 +121,106 @@ async def test_get_client_transaction_detail(mock_get_auth_header, mock_make_req
     assert result == {"id": 100}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with("GET", "/self/clients/1/transactions/100", auth=mock_auth)
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.client_tools.get_auth_header")
+async def test_get_client_dashboard(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    responses = {
+        "/self/clients/1": {"displayName": "John", "status": {"value": "Active"}, "activationDate": [2024, 1, 5]},
+        "/self/clients/1/accounts": {
+            "loanAccounts": [{"id": 7, "productName": "Personal", "status": {"value": "Active", "active": True}}],
+            "savingsAccounts": [
+                {"id": 3, "accountBalance": 50.0, "currency": {"code": "USD"}, "status": {"active": True}},
+                {"id": 4, "status": {"value": "Closed", "active": False}},
+            ],
+        },
+        "/self/clients/1/charges": {"error": True, "status_code": 500, "message": "boom"},
+        "/self/clients/1/transactions?offset=0&limit=5": {
+            "pageItems": [{"id": 9, "date": [2025, 3, 1], "type": {"value": "Deposit"}, "amount": 10}]
+        },
+        "/self/loans/7": {"summary": {"totalOutstanding": 900.0}},
+        "/self/savingsaccounts/3": {"summary": {"accountBalance": 50.0}},
+    }
+    mock_make_request.side_effect = lambda method, path, auth: responses[path]
+
+    result = await get_client_dashboard(1, "user1", "pwd")
+
+    mock_get_auth_header.assert_called_once_with("user1", "pwd")
+    assert mock_make_request.call_count == 6
+    assert result["client"]["displayName"] == "John"
+    assert result["client"]["activationDate"] == "2024-01-05"
+    assert result["accounts"]["loans"][0]["summary"]["totalOutstanding"] == 900.0
+    assert result["accounts"]["savings"][0]["summary"]["accountBalance"] == 50.0
+    assert "summary" not in result["accounts"]["savings"][1]
+    assert result["recentTransactions"] == [
+        {"id": 9, "date": "2025-03-01", "type": "Deposit", "amount": 10, "currency": None}
+    ]
+    assert "charges" not in result
+    assert result["errors"] == {"charges": {"status_code": 500, "message": "boom"}}
+
+
+def transactions_page(path):
+    query = dict(part.split("=") for part in path.split("?")[1].split("&"))
+    offset, limit = int(query["offset"]), int(query["limit"])
+    days = [[2025, 3, 30 - i] for i in range(20)]
+    items = [{"id": i, "date": days[i], "amount": i} for i in range(offset, min(offset + limit, 20))]
+    return {"totalFilteredRecords": 20, "pageItems": items}
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.client_tools.get_auth_header")
+async def test_collect_client_transactions_stops_at_max_items(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.side_effect = lambda method, path, auth: transactions_page(path)
+
+    result = await collect_client_transactions(1, "user1", "pwd", max_items=7, page_size=5)
+
+    assert [txn["id"] for txn in result["transactions"]] == list(range(7))
+    assert result["complete"] is False
+    assert mock_make_request.call_args_list[0].args == ("GET", "/self/clients/1/transactions?offset=0&limit=5")
+    assert mock_make_request.call_count <= 3
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.client_tools.get_auth_header")
+async def test_collect_client_transactions_by_date_range(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.side_effect = lambda method, path, auth: transactions_page(path)
+
+    result = await collect_client_transactions(
+        1, "user1", "pwd", from_date="2025-03-20", to_date="2025-03-27", page_size=4
+    )
+
+    assert [txn["date"] for txn in result["transactions"]] == [f"2025-03-{day}" for day in range(27, 19, -1)]
+    assert result["complete"] is True
+    assert result["pagesFetched"] < 5
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.client_tools.get_auth_header")
+async def test_collect_client_transactions_full_window_is_complete(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.side_effect = lambda method, path, auth: transactions_page(path)
+
+    exact = await collect_client_transactions(
+        1, "user1", "pwd", max_items=8, from_date="2025-03-20", to_date="2025-03-27"
+    )
+    short = await collect_client_transactions(
+        1, "user1", "pwd", max_items=7, from_date="2025-03-20", to_date="2025-03-27"
+    )
+
+    assert (exact["count"], exact["complete"]) == (8, True)
+    assert (short["count"], short["complete"]) == (7, False)
+
+
+@pytest.mark.asyncio
+async def test_collect_client_transactions_rejects_bad_dates():
+    result = await collect_client_transactions(1, "user1", "pwd", from_date="March")
+    assert result["error"] is True
+    assert result["status_code"] == 400
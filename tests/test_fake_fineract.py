@@ -0,0 +1,82 @@
+import pytest
+from starlette.testclient import TestClient
+from benchmarks.fake_fineract import API_BASE_PATH, FakeSettings, create_app
+from benchmarks.load import SCENARIOS, compare, percentile, run_load
+
+
+@pytest.fixture
+def fake():
+    return TestClient(create_app(FakeSettings(transactions_per_account=30)))
+
+
+def test_client_accounts_are_deterministic(fake):
+    first = fake.get(f"{API_BASE_PATH}/self/clients/4/accounts").json()
+    second = fake.get(f"{API_BASE_PATH}/self/clients/4/accounts").json()
+
+    assert first == second
+    assert [a["id"] for a in first["savingsAccounts"]] == [401, 402]
+    assert [a["id"] for a in first["loanAccounts"]] == [453]
+
+
+def test_savings_transactions_only_with_associations(fake):
+    plain = fake.get(f"{API_BASE_PATH}/self/savingsaccounts/401").json()
+    full = fake.get(f"{API_BASE_PATH}/self/savingsaccounts/401", params={"associations": "transactions"}).json()
+
+    assert "transactions" not in plain
+    assert len(full["transactions"]) == 30
+
+
+def test_client_transactions_are_paged(fake):
+    page = fake.get(f"{API_BASE_PATH}/self/clients/4/transactions", params={"offset": 25, "limit": 10}).json()
+
+    assert page["totalFilteredRecords"] == 30
+    assert len(page["pageItems"]) == 5
+
+
+def test_authentication_and_writes(fake):
+    auth = fake.post(f"{API_BASE_PATH}/self/authentication", json={"username": "u", "password": "p"}).json()
+    created = fake.post(f"{API_BASE_PATH}/self/accounttransfers", json={"transferAmount": 1}).json()
+
+    assert auth["authenticated"] is True
+    assert auth["base64EncodedAuthenticationKey"] == "dTpw"
+    assert created == {"resourceId": 1001}
+
+
+def test_unknown_get_is_not_found(fake):
+    response = fake.get(f"{API_BASE_PATH}/self/unknown")
+
+    assert response.status_code == 404
+
+
+def test_error_rate_injects_failures():
+    app = create_app(FakeSettings(error_rate=1.0))
+    response = TestClient(app).get(f"{API_BASE_PATH}/self/clients/1")
+
+    assert response.status_code == 503
+    assert app.state.fake.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_run_load_reports_latency_and_errors():
+    async def ok(arguments):
+        return {"id": arguments.get("client_id")}
+
+    async def failing(arguments):
+        return {"error": True, "status_code": 503, "message": "down"}
+
+    tools = {name: ok for _, name, _ in SCENARIOS}
+    tools["transfer_between_accounts"] = failing
+
+    result = await run_load(tools, concurrency=2, duration=0.05, users=3)
+
+    assert result["overall"]["calls"] > 0
+    assert result["errors"] == result["tools"].get("transfer_between_accounts", {}).get("calls", 0)
+
+
+def test_compare_flags_regressions_beyond_the_threshold():
+    baseline = {"throughput_rps": 100.0, "overall": {"p95_ms": 10.0, "p99_ms": 20.0}}
+
+    assert compare({"throughput_rps": 95.0, "overall": {"p95_ms": 11.0, "p99_ms": 21.0}}, baseline, 0.15) == []
+    problems = compare({"throughput_rps": 80.0, "overall": {"p95_ms": 12.0, "p99_ms": 30.0}}, baseline, 0.15)
+    assert len(problems) == 3
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from utils.store import TransactionStore
+from routers.history_tools import sync_transaction_history, query_transaction_history
+
+
+@pytest.fixture
+def mock_auth():
+    return "Basic dXNlcjE6cHdk"
+
+
+@pytest.fixture
+def store():
+    store = TransactionStore(":memory:")
+    with patch("routers.history_tools.get_store", return_value=store):
+        yield store
+    store.close()
+
+
+def fake_fineract(client_transactions):
+    def respond(method, path, auth):
+        if path == "/self/clients/1/accounts":
+            return {"savingsAccounts": [{"id": 3}], "loanAccounts": [{"id": 8}]}
+        if path.startswith("/self/clients/1/transactions"):
+            return {"totalFilteredRecords": len(client_transactions), "pageItems": client_transactions}
+        if path == "/self/savingsaccounts/3?associations=transactions":
+            return {
+                "transactions": [
+                    {"id": 1, "date": [2025, 1, 2], "transactionType": {"value": "Deposit"}, "amount": 300.0},
+                    {"id": 2, "date": [2025, 1, 3], "transactionType": {"withdrawal": True}, "amount": 80.0},
+                ]
+            }
+        if path == "/self/loans/8?associations=transactions":
+            return {"error": True, "status_code": 403, "message": "denied"}
+        raise AssertionError(path)
+
+    return respond
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.history_tools.make_request", new_callable=AsyncMock)
+@patch("routers.history_tools.get_auth_header")
+async def test_sync_then_query(mock_get_auth_header, mock_make_request, mock_client_request, mock_auth, store):
+    mock_get_auth_header.return_value = mock_auth
+    client_transactions = [{"id": 5, "date": [2025, 1, 4], "type": {"value": "Pay Charge"}, "amount": 10.0}]
+    mock_make_request.side_effect = fake_fineract(client_transactions)
+    mock_client_request.side_effect = fake_fineract(client_transactions)
+
+    first = await sync_transaction_history(1, "user1", "pwd")
+    second = await sync_transaction_history(1, "user1", "pwd")
+
+    assert first["newTransactions"] == {"client:1": 1, "savings:3": 2}
+    assert first["errors"] == {"loan:8": {"status_code": 403, "message": "denied"}}
+    assert second["newTransactions"] == {"client:1": 0, "savings:3": 0}
+
+    spending = await query_transaction_history("user1", "pwd", report="spending", from_date="2025-01-01")
+    assert spending["debits"] == {"count": 2, "total": 90.0}
+    assert spending["credits"] == {"count": 1, "total": 300.0}
+
+    largest = await query_transaction_history("user1", "pwd", report="largest_debits", limit=1)
+    assert [row["amount"] for row in largest["transactions"]] == [80.0]
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+@patch("routers.history_tools.make_request", new_callable=AsyncMock)
+@patch("routers.history_tools.get_auth_header")
+async def test_resync_picks_up_recent_client_reversals(
+    mock_get_auth_header, mock_make_request, mock_client_request, mock_auth, store
+):
+    mock_get_auth_header.return_value = mock_auth
+    charge = {"type": {"value": "Pay Charge"}, "amount": 10.0}
+    client_transactions = [
+        {"id": 7, "date": [2025, 3, 1], **charge},
+        {"id": 6, "date": [2025, 2, 20], **charge},
+        {"id": 5, "date": [2025, 1, 4], **charge},
+    ]
+    mock_make_request.side_effect = fake_fineract(client_transactions)
+    mock_client_request.side_effect = fake_fineract(client_transactions)
+    await sync_transaction_history(1, "user1", "pwd")
+
+    # Both later transactions are reversed; only the one within the lookback of the last sync is re-read
+    client_transactions[1]["reversed"] = True
+    client_transactions[2]["reversed"] = True
+    second = await sync_transaction_history(1, "user1", "pwd")
+
+    assert second["newTransactions"]["client:1"] == 0
+    recent = await query_transaction_history("user1", "pwd", report="recent", account_type="client")
+    assert [row["txn_id"] for row in recent["transactions"]] == [7, 5]
+
+
+@pytest.mark.asyncio
+async def test_query_rejects_unknown_report(store):
+    result = await query_transaction_history("user1", "pwd", report="everything")
+    assert result["status_code"] == 400
@@ -0,0 +1,374 @@
+import asyncio
+import json
+import httpx
+import pytest
+import main  # noqa: F401
+import utils.http as http
+from mcp_app import mcp
+from utils.auth import sessions
+from utils.resilience import HALF_OPEN
+from utils.http import make_request, get_client, close_client, http_lifespan, get_pool_stats, response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    response_cache.clear()
+    yield
+    response_cache.clear()
+    http._breakers.clear()
+    http._adaptive_limiters.clear()
+    http._retry_budgets.clear()
+    http._latencies.clear()
+
+
+@pytest.fixture
+def flaky(monkeypatch):
+    """Upstream failing the first ``failures`` calls with 503, then answering."""
+    state = {"failures": 1, "calls": []}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["calls"].append(request.method)
+        if len(state["calls"]) <= state["failures"]:
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(http, "retry_policy", http.RetryPolicy(max_attempts=3, base_delay=0.0))
+    http._clients["default"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield state
+    http._clients.clear()
+
+
+@pytest.fixture
+def upstream():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, text="not found")
+        if request.url.path.endswith("/empty"):
+            return httpx.Response(200, content=b"")
+        return httpx.Response(200, json={"path": request.url.path})
+
+    for tenant in ("default", "other"):
+        http._clients[tenant] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield calls
+    http._clients.clear()
+
+
+@pytest.mark.asyncio
+async def test_make_request_reuses_shared_client(upstream):
+    client = get_client()
+
+    await make_request("GET", "/self/clients", auth="Basic abc")
+    await make_request("GET", "/self/clients/1", auth="Basic abc")
+
+    assert get_client() is client
+    assert len(upstream) == 2
+    assert upstream[0].headers["Authorization"] == "Basic abc"
+    assert upstream[0].headers["Fineract-Platform-TenantId"] == "default"
+
+
+@pytest.mark.asyncio
+async def test_make_request_returns_error_dict(upstream):
+    result = await make_request("GET", "/self/missing")
+    assert result == {"error": True, "status_code": 404, "message": "not found"}
+
+
+@pytest.mark.asyncio
+async def test_make_request_handles_empty_body(upstream):
+    result = await make_request("DELETE", "/self/empty")
+    assert result == {"message": "Success", "status_code": 200}
+
+
+@pytest.mark.asyncio
+async def test_make_request_maps_connect_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    http._clients["default"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        result = await make_request("GET", "/self/clients")
+    finally:
+        await close_client()
+
+    assert result["error"] is True
+    assert result["status_code"] == 503
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_client_after_last_user():
+    async with http_lifespan():
+        async with http_lifespan():
+            client = get_client()
+        assert not client.is_closed
+    assert client.is_closed
+    assert not http._clients
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_reports_limits_and_counters(upstream):
+    before = get_pool_stats()
+    await make_request("GET", "/self/clients")
+    after = get_pool_stats()
+
+    assert after["requests"] == before["requests"] + 1
+    assert after["in_flight"] == 0
+    assert after["limits"]["max_connections"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cached_get_skips_upstream(upstream):
+    first = await make_request("GET", "/self/loanproducts?clientId=1", auth="Basic abc")
+    first["path"] = "mutated by caller"
+    second = await make_request("GET", "/self/loanproducts?clientId=1", auth="Basic abc")
+
+    assert len(upstream) == 1
+    assert second == {"path": "/fineract-provider/api/v1/self/loanproducts"}
+
+
+@pytest.mark.asyncio
+async def test_cache_is_scoped_per_user_and_tenant(upstream):
+    await make_request("GET", "/self/clients/1", auth="Basic abc")
+    await make_request("GET", "/self/clients/1", auth="Basic xyz")
+    await make_request("GET", "/self/clients/1", auth="Basic abc", tenant="other")
+
+    assert len(upstream) == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_and_unauthenticated_calls_are_not_cached(upstream):
+    await make_request("GET", "/self/loanproducts/missing", auth="Basic abc")
+    await make_request("GET", "/self/loanproducts/missing", auth="Basic abc")
+    await make_request("GET", "/self/clients")
+    await make_request("GET", "/self/clients")
+
+    assert len(upstream) == 4
+
+
+@pytest.mark.asyncio
+async def test_transfer_evicts_cached_balances(upstream):
+    await make_request("GET", "/self/savingsaccounts/5", auth="Basic abc")
+    await make_request("GET", "/self/loanproducts?clientId=1", auth="Basic abc")
+    await make_request("POST", "/self/accounttransfers", auth="Basic abc", data={"transferAmount": 10})
+    await make_request("GET", "/self/savingsaccounts/5", auth="Basic abc")
+    await make_request("GET", "/self/loanproducts?clientId=1", auth="Basic abc")
+
+    paths = [request.url.path for request in upstream]
+    assert paths.count("/fineract-provider/api/v1/self/savingsaccounts/5") == 2
+    assert paths.count("/fineract-provider/api/v1/self/loanproducts") == 1
+
+
+@pytest.mark.asyncio
+async def test_third_party_transfer_evicts_for_every_user(upstream):
+    await make_request("GET", "/self/savingsaccounts/9", auth="Basic recipient")
+    await make_request("POST", "/self/accounttransfers?type=tpt", auth="Basic sender", data={})
+    await make_request("GET", "/self/savingsaccounts/9", auth="Basic recipient")
+
+    assert len(upstream) == 3
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_upstream_call():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"pageItems": []})
+
+    http._clients["default"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        results = await asyncio.gather(
+            *(make_request("GET", "/self/clients/1/transactions?offset=0&limit=5", auth="Basic abc") for _ in range(4)),
+            make_request("GET", "/self/clients/1/transactions?offset=0&limit=5", auth="Basic xyz"),
+        )
+    finally:
+        await close_client()
+
+    assert len(calls) == 2
+    assert all(result == {"pageItems": []} for result in results)
+    results[0]["pageItems"].append("mutated")
+    assert results[1] == {"pageItems": []}
+
+
+@pytest.fixture
+def tenants(monkeypatch):
+    monkeypatch.setattr(
+        http,
+        "_tenant_settings",
+        http.load_tenant_settings(
+            {
+                "slow": {"base_url": "https://slow.example", "max_concurrency": 1, "max_connections": 4},
+                "fast": {"base_url": "https://fast.example"},
+            }
+        ),
+    )
+    yield
+    http._clients.clear()
+    http._limiters.clear()
+    http._tenant_stats.clear()
+
+
+def test_tenant_settings_merge_overrides(tenants):
+    slow = http.tenant_settings("slow")
+    assert (slow.base_url, slow.max_concurrency, slow.max_connections) == ("https://slow.example", 1, 4)
+    assert http.tenant_settings("default").base_url == http.BASE_URL
+    assert http.tenant_settings("unlisted") == http.tenant_settings("default")
+    assert http.load_tenant_settings({"t": {"timeout": 5}})["t"].timeout == 5.0
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"typo": {"max_conections": 1}},
+        {"t": {"timeout": "10"}},
+        {"t": {"max_concurrency": 2.5}},
+        {"t": {"max_connections": True}},
+        {"t": {"max_concurrency": -1}},
+        {"t": {"base_url": 1}},
+        {"t": "https://t.example"},
+        ["t"],
+    ],
+)
+def test_invalid_tenant_settings_are_rejected_up_front(overrides):
+    with pytest.raises(ValueError):
+        http.load_tenant_settings(overrides)
+
+
+@pytest.mark.asyncio
+async def test_each_tenant_gets_its_own_pool(tenants):
+    assert get_client("slow") is not get_client("fast")
+    assert get_client("slow") is get_client("slow")
+
+    await close_client("slow")
+    assert "slow" not in http._clients and "fast" in http._clients
+
+
+@pytest.mark.asyncio
+async def test_tools_run_against_the_tenant_chosen_at_login(tenants):
+    def handler(request: httpx.Request) -> httpx.Response:
+        tenant = request.headers["Fineract-Platform-TenantId"]
+        if request.url.path.endswith("/self/authentication"):
+            return httpx.Response(200, json={"username": "u", "base64EncodedAuthenticationKey": f"key-{tenant}"})
+        return httpx.Response(200, json={"tenant": tenant, "host": request.url.host})
+
+    for tenant in ("slow", "fast"):
+        http._clients[tenant] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def call(tool, arguments):
+        return json.loads((await mcp.call_tool(tool, arguments))[0].text)
+
+    handles = {}
+    for tenant in ("slow", "fast"):
+        handles[tenant] = (await call("login", {"username": "u", "password": "p", "tenant": tenant}))["sessionId"]
+    try:
+        for tenant, host in (("slow", "slow.example"), ("fast", "fast.example")):
+            arguments = {"client_id": 1, "username": handles[tenant], "password": ""}
+            assert await call("get_client_details", arguments) == {"tenant": tenant, "host": host}
+        unknown = await call("login", {"username": "u", "password": "p", "tenant": "nobody"})
+    finally:
+        for handle in handles.values():
+            sessions.end(handle)
+
+    assert unknown["status_code"] == 400
+    assert http._limiters["slow"] is not http._limiters["fast"]
+    stats = get_pool_stats()["tenants"]
+    assert (stats["slow"]["requests"], stats["slow"]["max_concurrency"]) == (2, 1)
+    assert (stats["fast"]["requests"], stats["fast"]["max_concurrency"]) == (2, http.TENANT_MAX_CONCURRENCY)
+
+
+@pytest.mark.asyncio
+async def test_slow_tenant_does_not_block_other_tenants(tenants):
+    release = asyncio.Event()
+    hosts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        if request.url.host == "slow.example":
+            await release.wait()
+        return httpx.Response(200, json={"host": request.url.host})
+
+    for tenant in ("slow", "fast"):
+        http._clients[tenant] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    slow_calls = [asyncio.ensure_future(make_request("POST", f"/self/slow/{i}", tenant="slow")) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert await make_request("POST", "/self/fast", tenant="fast") == {"host": "fast.example"}
+    stats = get_pool_stats()["tenants"]
+    assert stats["slow"]["in_flight"] == 1
+    assert stats["slow"]["waiting"] == 2
+    assert stats["fast"]["requests"] == 1
+
+    release.set()
+    await asyncio.gather(*slow_calls)
+    assert hosts.count("slow.example") == 3
+    assert get_pool_stats()["tenants"]["slow"]["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_per_endpoint_group(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if "/loans" in request.url.path:
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json={})
+
+    monkeypatch.setattr(http, "CIRCUIT_FAILURE_THRESHOLD", 2)
+    http._clients["default"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        for loan_id in (1, 2, 3):
+            result = await make_request("GET", f"/self/loans/{loan_id}")
+        assert await make_request("GET", "/self/savingsaccounts/1") == {}
+    finally:
+        await close_client()
+
+    assert len(calls) == 3
+    assert result["status_code"] == 503
+    assert result["message"].startswith("Circuit open for /self/loans")
+    assert result["retry_after"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_its_half_open_slot(monkeypatch):
+    url = httpx.URL(f"{http.BASE_URL}{http.API_BASE_PATH}/self/loans/1")
+    breaker = http._get_breaker(url.host, "/self/loans")
+    breaker._state = HALF_OPEN
+    # A saturated tenant limiter keeps the probe waiting until it is cancelled
+    monkeypatch.setitem(http._limiters, "default", asyncio.Semaphore(0))
+
+    task = asyncio.create_task(http._send("GET", str(url), {}, None))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_of_a_read_is_retried(flaky):
+    assert await make_request("GET", "/self/clients/1") == {"ok": True}
+    assert flaky["calls"] == ["GET", "GET"]
+    assert get_pool_stats()["retries"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_writes_are_never_retried(flaky):
+    result = await make_request("POST", "/self/accounttransfers", data={})
+    assert result["status_code"] == 503
+    assert flaky["calls"] == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_empty_retry_budget_stops_retries(flaky):
+    flaky["failures"] = 10
+    http._get_retry_budget(httpx.URL(http.BASE_URL).host).tokens = 0
+
+    result = await make_request("GET", "/self/clients/1")
+    assert result["status_code"] == 503
+    assert len(flaky["calls"]) == 1
@@ -0,0 +1,65 @@
+import json
+import httpx
+import pytest
+import utils.http as http
+from utils.http import make_request, response_cache
+from utils.jsoncodec import BACKENDS, select_codec
+
+PAYLOAD = {"id": 7, "name": "Zoë", "amount": 12.5, "tags": ["a", None, True], "nested": {"date": [2024, 1, 31]}}
+
+
+def _installed():
+    names = []
+    for name, factory in BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", _installed())
+def test_backends_round_trip(name):
+    codec = select_codec(name)
+
+    encoded = codec.dumps(PAYLOAD)
+
+    assert codec.name == name
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    with pytest.raises(codec.decode_errors):
+        codec.loads(b"not json")
+
+
+def test_unknown_or_missing_backend_falls_back_to_stdlib(monkeypatch):
+    def missing():
+        raise ImportError("msgspec")
+
+    monkeypatch.setitem(BACKENDS, "msgspec", missing)
+
+    assert select_codec("yaml").name == "json"
+    assert select_codec("msgspec").name == "json"
+    assert select_codec("auto").name in ("orjson", "json")
+
+
+@pytest.mark.asyncio
+async def test_make_request_encodes_and_decodes_with_the_selected_codec(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=request.content)
+
+    monkeypatch.setattr(http, "json_codec", select_codec("json"))
+    http._clients["default"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        result = await make_request("POST", "/self/beneficiaries/tpt", data=PAYLOAD, auth="Basic abc")
+    finally:
+        http._clients.clear()
+        response_cache.clear()
+
+    assert result == PAYLOAD
+    assert seen[0].headers["Content-Type"] == "application/json"
+    assert seen[0].content == json.dumps(PAYLOAD, ensure_ascii=False, separators=(",", ":")).encode()
@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, AsyncMock
+from tests.test_amortization import PAYLOAD, SERVER_TOTALS
 from routers.loan_tools import (
     get_loan_products,
     get_loan_product_details,
@@ -121,12 +122,30 @@ async def test_calculate_loan_repayment_calendar(mock_get_auth_header, mock_make
 async def test_submit_loan_application(mock_get_auth_header, mock_make_request, mock_auth):
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 10}
-    data = {"amount": 1000}
+    data = {**PAYLOAD, "submittedOnDate": "20 January 2025"}
 
     result = await submit_loan_application(data, "user1", "pwd")
     assert result == {"resourceId": 10}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
-    mock_make_request.assert_called_once_with("POST", "/self/loans", auth=mock_auth, data=data)
+    mock_make_request.assert_called_once_with(
+        "POST", "/self/loans", auth=mock_auth, data={**data, "principal": 10000.0}
+    )
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_submit_loan_application_rejects_invalid_fields_locally(mock_get_auth_header, mock_make_request):
+    data = {**PAYLOAD, "submittedOnDate": "1 March 2025", "principal": "ten thousand"}
+
+    result = await submit_loan_application(data, "user1", "pwd")
+
+    mock_make_request.assert_not_called()
+    assert result["status_code"] == 400
+    assert result["errors"] == [
+        {"field": "principal", "message": "Input should be a valid number, unable to parse string as a number"},
+        {"field": "expectedDisbursementDate", "message": "is before submittedOnDate"},
+    ]
 
 
 @pytest.mark.asyncio
@@ -164,3 +183,101 @@ async def test_withdraw_loan_application(mock_get_auth_header, mock_make_request
             "locale": "en",
         },
     )
+
+
+LOAN_PRODUCT = {
+    "id": 1,
+    "name": "Personal Loan",
+    "currency": {"code": "USD", "decimalPlaces": 2, "inMultiplesOf": 0},
+    "daysInYearType": {"id": 1, "code": "DaysInYearType.actual", "value": "Actual"},
+    "daysInMonthType": {"id": 1, "code": "DaysInMonthType.actual", "value": "Actual"},
+    "isInterestRecalculationEnabled": False,
+}
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_calculate_loan_repayment_calendar_locally(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = LOAN_PRODUCT
+
+    result = await calculate_loan_repayment_calendar(PAYLOAD, "user1", "pwd")
+
+    mock_make_request.assert_called_once_with("GET", "/self/loanproducts?clientId=1&productId=1", auth=mock_auth)
+    assert result["calculatedLocally"] is True
+    assert result["totalRepaymentExpected"] == pytest.approx(SERVER_TOTALS["totalRepaymentExpected"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "product",
+    [
+        {**LOAN_PRODUCT, "currency": {"code": "USD", "decimalPlaces": 2, "inMultiplesOf": 100}},
+        {**LOAN_PRODUCT, "isInterestRecalculationEnabled": True},
+        {**LOAN_PRODUCT, "daysInYearType": {"id": 360, "code": "DaysInYearType.days360", "value": "360 Days"}},
+        {**LOAN_PRODUCT, "daysInMonthType": {"id": 30, "code": "DaysInMonthType.days30", "value": "30 Days"}},
+        {"error": True, "status_code": 404, "message": "not found"},
+    ],
+)
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_calculate_loan_repayment_calendar_defers_unmodelled_products(
+    mock_get_auth_header, mock_make_request, mock_auth, product
+):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.side_effect = [product, {"periods": []}]
+
+    result = await calculate_loan_repayment_calendar(PAYLOAD, "user1", "pwd")
+
+    assert result == {"periods": []}
+    mock_make_request.assert_called_with(
+        "POST", "/self/loans?command=calculateLoanSchedule", auth=mock_auth, data=PAYLOAD
+    )
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_calculate_loan_repayment_calendar_rounds_to_the_product_currency(
+    mock_get_auth_header, mock_make_request, mock_auth
+):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = [{**LOAN_PRODUCT, "currency": {"code": "JPY", "decimalPlaces": 0}}]
+
+    result = await calculate_loan_repayment_calendar(PAYLOAD, "user1", "pwd")
+
+    assert result["periods"][1]["interestDue"] == 100.0
+    assert all(period["principalDue"] == int(period["principalDue"]) for period in result["periods"][1:])
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+async def test_calculate_loan_repayment_calendar_local_mode_never_calls_the_server(mock_make_request):
+    result = await calculate_loan_repayment_calendar(PAYLOAD, "user1", "pwd", mode="local")
+
+    mock_make_request.assert_not_called()
+    assert result["calculatedLocally"] is True
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_calculate_loan_repayment_calendar_server_mode(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = {"periods": []}
+
+    result = await calculate_loan_repayment_calendar(PAYLOAD, "user1", "pwd", mode="server")
+    assert result == {"periods": []}
+    mock_make_request.assert_called_once_with(
+        "POST", "/self/loans?command=calculateLoanSchedule", auth=mock_auth, data=PAYLOAD
+    )
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+async def test_calculate_loan_repayment_calendar_local_mode_rejects_unsupported(mock_make_request):
+    result = await calculate_loan_repayment_calendar({"amount": 1000}, "user1", "pwd", mode="local")
+
+    mock_make_request.assert_not_called()
+    assert result["status_code"] == 422
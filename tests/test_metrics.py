@@ -0,0 +1,83 @@
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock
+from starlette.testclient import TestClient
+import main  # noqa: F401
+import utils.http as http
+from mcp_app import mcp
+from utils.http import make_request, response_cache
+from utils.metrics import MetricsRegistry, instrument_tool, registry
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    registry.reset()
+    response_cache.clear()
+    yield
+    registry.reset()
+    http._clients.clear()
+
+
+def test_render_counters_and_cumulative_histograms():
+    metrics = MetricsRegistry()
+    metrics.describe("jobs_total", "counter", "Jobs")
+    metrics.inc("jobs_total", (("queue", 'a"b'),), 2)
+    metrics.observe("job_seconds", (), 0.02)
+    metrics.observe("job_seconds", (), 3.0)
+    metrics.register_collector(lambda: [("depth", "gauge", "Queue depth", (), 4)])
+
+    text = metrics.render()
+    assert '# TYPE jobs_total counter\njobs_total{queue="a\\"b"} 2\n' in text
+    assert 'job_seconds_bucket{le="0.025"} 1\n' in text
+    assert 'job_seconds_bucket{le="+Inf"} 2\n' in text
+    assert "job_seconds_count 2\n" in text
+    assert "# TYPE depth gauge\ndepth 4\n" in text
+
+
+@pytest.mark.asyncio
+async def test_instrumented_tool_records_errors_by_status():
+    async def tool(fail: bool):
+        return {"error": True, "status_code": 404, "message": "gone"} if fail else {"ok": True}
+
+    wrapped = instrument_tool(tool, "sample")
+    await wrapped(False)
+    await wrapped(fail=True)
+
+    assert registry.counter("mifos_tool_calls_total", tool="sample") == 2
+    assert registry.counter("mifos_tool_errors_total", tool="sample", status="404") == 1
+    assert registry.histogram("mifos_tool_duration_seconds", tool="sample").count == 2
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+async def test_registered_tools_are_instrumented(mock_make_request):
+    mock_make_request.return_value = {"id": 1}
+    await mcp.call_tool("get_client_details", {"client_id": 1, "username": "u", "password": "p"})
+
+    assert registry.counter("mifos_tool_calls_total", tool="get_client_details") == 1
+
+
+@pytest.mark.asyncio
+async def test_upstream_calls_and_cache_hits_are_exported():
+    http._clients["default"] = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 5}))
+    )
+    hits = response_cache.hits
+    await make_request("GET", "/self/loanproducts/5", auth="Basic abc")
+    await make_request("GET", "/self/loanproducts/5", auth="Basic abc")
+
+    assert (
+        registry.counter("mifos_upstream_requests_total", method="GET", group="/self/loanproducts", status="200") == 1
+    )
+    assert registry.counter("mifos_upstream_response_bytes_total", group="/self/loanproducts") == len(b'{"id":5}')
+    text = registry.render()
+    assert f"mifos_cache_hits_total {hits + 1}\n" in text
+
+
+def test_metrics_route_serves_prometheus_text():
+    with TestClient(mcp.streamable_http_app()) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE mifos_cache_entries gauge" in response.text
@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from utils.pagination import PageFetchError, paginate
+
+
+def make_pages(total):
+    requested = []
+
+    async def fetch_page(offset, limit):
+        requested.append(offset)
+        items = [{"id": i} for i in range(offset, min(offset + limit, total))]
+        return {"totalFilteredRecords": total, "pageItems": items}
+
+    return fetch_page, requested
+
+
+@pytest.mark.asyncio
+async def test_paginate_yields_every_item_across_pages():
+    fetch_page, requested = make_pages(7)
+    stats = {}
+
+    items = [item["id"] async for item in paginate(fetch_page, page_size=3, stats=stats)]
+
+    assert items == list(range(7))
+    assert requested == [0, 3, 6]
+    assert stats["pages"] == 3
+
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_next_page_before_items_are_consumed():
+    fetch_page, requested = make_pages(10)
+    pager = paginate(fetch_page, page_size=5)
+
+    await pager.__anext__()
+    await asyncio.sleep(0)
+
+    assert requested == [0, 5]
+    await pager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_paginate_stops_on_short_page_without_total():
+    requested = []
+
+    async def fetch_page(offset, limit):
+        requested.append(offset)
+        return [{"id": 1}]
+
+    items = [item async for item in paginate(fetch_page, page_size=5)]
+
+    assert items == [{"id": 1}]
+    assert requested == [0]
+
+
+@pytest.mark.asyncio
+async def test_paginate_raises_on_error_page():
+    async def fetch_page(offset, limit):
+        return {"error": True, "status_code": 500, "message": "boom"}
+
+    with pytest.raises(PageFetchError) as excinfo:
+        [item async for item in paginate(fetch_page)]
+
+    assert excinfo.value.response["status_code"] == 500
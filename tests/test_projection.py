@@ -0,0 +1,102 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from benchmarks.fake_fineract import FakeFineract, FakeSettings
+from routers.loan_tools import get_loan_account_details
+from utils.projection import project, projected, with_fields
+
+LOAN = FakeFineract(FakeSettings()).loan_account(153)
+
+
+def test_full_profile_without_fields_is_verbatim():
+    assert project(LOAN, "full") is LOAN
+
+
+def test_standard_collapses_enums_currencies_and_dates():
+    result = project(LOAN, "standard")
+
+    assert result["status"] == "Active"
+    assert result["currency"] == "USD"
+    assert result["transactions"][0]["transactionType"] in ("Deposit", "Withdrawal")
+    assert result["transactions"][0]["date"].startswith("2024-")
+    assert "note" not in result["transactions"][0]
+    assert result["projection"]["bytesAfter"] < result["projection"]["bytesBefore"]
+
+
+def test_minimal_keeps_only_key_figures():
+    standard = project(LOAN, "standard")
+    minimal = project(LOAN, "minimal")
+
+    assert set(minimal) - {"projection"} <= set(standard)
+    assert "paymentDetailData" not in minimal["transactions"][0]
+    assert minimal["summary"]["totalOutstanding"] == LOAN["summary"]["totalOutstanding"]
+    assert minimal["projection"]["bytesAfter"] < standard["projection"]["bytesAfter"]
+
+
+def test_fields_select_top_level_keys_and_page_items():
+    page = {"totalFilteredRecords": 2, "pageItems": [{"id": 1, "amount": 5, "note": "x"}, {"id": 2, "amount": 7}]}
+
+    result = project(LOAN, "full", "id, principal")
+
+    assert result == {"id": 153, "principal": LOAN["principal"], "projection": result["projection"]}
+    assert result["projection"]["fields"] == ["id", "principal"]
+    assert project(page, "full", "id")["pageItems"] == [{"id": 1}, {"id": 2}]
+    assert project([{"id": 1, "name": "a"}], "full", "name")["pageItems"] == [{"name": "a"}]
+
+
+def test_errors_are_never_projected():
+    error = {"error": True, "status_code": 404, "message": "not found"}
+
+    assert project(error, "minimal", "id") is error
+
+
+def test_with_fields_appends_to_the_query_string():
+    assert with_fields("/self/loans/1", None) == "/self/loans/1"
+    assert with_fields("/self/loans/1", "id, summary") == "/self/loans/1?fields=id,summary"
+    assert with_fields("/self/loans/1?associations=all", "id") == "/self/loans/1?associations=all&fields=id"
+
+
+def test_with_fields_drops_names_that_are_not_identifiers():
+    assert with_fields("/self/loans/1", "id&associations=all, summary") == "/self/loans/1?fields=summary"
+    assert with_fields("/self/loans/1", "id=1,#") == "/self/loans/1"
+    assert project({"id": 1, "summary": {}}, "full", "id&x") == {"id": 1, "summary": {}}
+
+
+def test_minimal_keeps_reversal_flags():
+    transaction = {"id": 7, "amount": 10.0, "reversed": True, "submittedByUsername": "mifos"}
+
+    assert project(transaction, "minimal") == {
+        "id": 7,
+        "amount": 10.0,
+        "reversed": True,
+        "projection": project(transaction, "minimal")["projection"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_unknown_profile_is_rejected_without_a_request():
+    request = AsyncMock()
+
+    result = await projected(request(), "tiny", None)
+
+    assert result["status_code"] == 400
+    request.assert_called_once()
+    request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+async def test_read_tools_pass_fields_upstream_and_project_locally(mock_get_auth_header, mock_make_request):
+    mock_get_auth_header.return_value = "Basic abc"
+    mock_make_request.return_value = LOAN
+
+    result = await get_loan_account_details(
+        153, "user1", "pwd", associations="all", fields="id,status", profile="standard"
+    )
+
+    assert result["id"] == 153
+    assert result["status"] == "Active"
+    assert set(result) == {"id", "status", "projection"}
+    mock_make_request.assert_called_once_with(
+        "GET", "/self/loans/153?associations=all&fields=id,status", auth="Basic abc"
+    )
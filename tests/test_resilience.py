@@ -0,0 +1,163 @@
+import asyncio
+import pytest
+from utils.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    RetryPolicy,
+    endpoint_group,
+    hedge,
+    is_failure,
+    is_retryable,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_endpoint_group_and_failure_classification():
+    assert endpoint_group("/self/loans/5/guarantors?x=1") == "/self/loans"
+    assert endpoint_group("/self/clients?offset=0") == "/self/clients"
+    assert is_failure({"error": True, "status_code": 504, "message": ""})
+    assert not is_failure({"error": True, "status_code": 404, "message": ""})
+    assert not is_failure([{"id": 1}])
+
+
+def test_breaker_opens_after_consecutive_failures_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, recovery_time=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 10
+
+    clock.now = 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["rejected"] == 2
+
+
+def test_failed_probe_reopens_and_abandoned_probe_frees_its_slot():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=5, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 5
+    assert breaker.allow()
+    breaker.abandon()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.retry_after() == 5
+
+
+def test_limiter_grows_additively_and_backs_off_once_per_burst():
+    clock = FakeClock()
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=8, latency_threshold=1.0, clock=clock)
+
+    for _ in range(4):
+        limiter.in_flight += 1
+        limiter.release(started_at=0.0, failed=False)
+    assert limiter.current_limit == 4 and limiter.limit > 4.9
+
+    clock.now = 2
+    limiter.in_flight += 3
+    limiter.release(started_at=1.0, failed=True)
+    limiter.release(started_at=1.5, failed=True)
+    limiter.release(started_at=1.9, failed=False)
+    assert limiter.current_limit == 2
+    assert limiter.decreases == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_then_rejects_over_the_limit():
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=1, queue_timeout=0.05)
+    assert await limiter.acquire()
+
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.stats()["queued"] == 1
+    limiter.release(started_at=limiter._clock(), failed=False)
+    assert await waiter is True
+
+    assert await limiter.acquire() is False
+    assert limiter.stats() == {"limit": 1, "in_flight": 1, "queued": 0, "rejected": 1, "decreases": 0}
+
+
+def test_retry_policy_and_retryable_outcomes():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=0.3)
+    assert [policy.backoff(n, rand=lambda: 1.0) for n in (1, 2, 3)] == [0.1, 0.2, 0.3]
+
+    timeout = {"error": True, "status_code": 408, "message": ""}
+    assert is_retryable("GET", timeout)
+    assert not is_retryable("POST", timeout)
+    assert not is_retryable("GET", {"error": True, "status_code": 503, "message": "", "retry_after": 3})
+    assert not is_retryable("GET", {"error": True, "status_code": 400, "message": ""})
+
+
+def test_retry_budget_drains_and_refills():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.5, min_per_second=1.0, max_tokens=2.0, clock=clock)
+
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+    clock.now = 1.5
+    assert budget.try_spend()
+    assert budget.stats() == {"tokens": 0.5, "spent": 4, "exhausted": 1}
+
+
+def test_latency_tracker_needs_samples_before_reporting_p95():
+    tracker = LatencyTracker(min_samples=20)
+    for ms in range(1, 20):
+        tracker.record(ms / 1000)
+    assert tracker.quantile() is None
+    tracker.record(0.02)
+    assert tracker.quantile() == 0.019
+
+
+@pytest.mark.asyncio
+async def test_hedge_races_a_second_copy_after_the_delay():
+    delays = [0.2, 0.0]
+
+    async def call():
+        await asyncio.sleep(delays.pop(0))
+        return {"copy": len(delays)}, b""
+
+    (result, _), hedged = await hedge(call, 0.01, lambda: True)
+    assert (result, hedged) == ({"copy": 0}, True)
+
+
+@pytest.mark.asyncio
+async def test_hedge_skips_copy_when_fast_or_out_of_budget():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {}, None
+
+    assert (await hedge(call, 0.1, lambda: True))[1] is False
+    assert (await hedge(call, 0.001, lambda: False))[1] is False
+    assert len(calls) == 2
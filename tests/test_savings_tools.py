@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch, AsyncMock
+from utils.http import response_cache
 from routers.savings_tools import (
     get_savings_products,
     get_savings_product_details,
     get_savings_details,
+    MAX_TRANSACTION_PAGE,
     get_savings_transactions,
     get_savings_transaction_details,
     get_savings_charges,
@@ -119,7 +121,13 @@ async def test_get_savings_template_raw(mock_get_auth_header, mock_make_request,
 async def test_submit_savings_application(mock_get_auth_header, mock_make_request, mock_auth):
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 10}
-    data = {"amount": 1000}
+    data = {
+        "clientId": 1,
+        "productId": 2,
+        "submittedOnDate": "18 October 2026",
+        "locale": "en",
+        "dateFormat": "dd MMMM yyyy",
+    }
 
     result = await submit_savings_application(data, "user1", "pwd")
     assert result == {"resourceId": 10}
@@ -139,3 +147,72 @@ async def test_update_savings_application(mock_get_auth_header, mock_make_reques
     assert result == {"resourceId": 10}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with("PUT", "/self/savingsaccounts/10", auth=mock_auth, data=data)
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+@patch("routers.savings_tools.get_auth_header")
+async def test_update_savings_application_checks_the_fields_given(mock_get_auth_header, mock_make_request):
+    result = await update_savings_application(10, {"submittedOnDate": "31 Febtober 2026"}, "user1", "pwd")
+
+    mock_make_request.assert_not_called()
+    assert result["errors"] == [{"field": "submittedOnDate", "message": "does not match dateFormat 'dd MMMM yyyy'"}]
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+@patch("routers.savings_tools.get_auth_header")
+async def test_get_savings_transactions_window_reuses_index(mock_get_auth_header, mock_make_request, mock_auth):
+    response_cache.clear()
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = {
+        "id": 1,
+        "transactions": [
+            {"id": 10, "date": [2025, 1, 2], "transactionType": {"value": "Deposit"}, "amount": 500.0},
+            {"id": 11, "date": [2025, 2, 2], "transactionType": {"value": "Withdrawal"}, "amount": 40.0},
+            {"id": 12, "date": [2025, 3, 2], "transactionType": {"value": "Withdrawal"}, "amount": 60.0},
+        ],
+    }
+
+    first = await get_savings_transactions(1, "user1", "pwd", transaction_type="withdrawal", limit=1)
+    second = await get_savings_transactions(
+        1, "user1", "pwd", transaction_type="withdrawal", cursor=first["nextCursor"]
+    )
+    ranged = await get_savings_transactions(1, "user1", "pwd", from_date="2025-01-01", to_date="2025-01-31")
+    response_cache.clear()
+
+    mock_make_request.assert_called_once_with(
+        "GET", "/self/savingsaccounts/1?associations=transactions", auth=mock_auth
+    )
+    assert [txn["id"] for txn in first["transactions"]] == [12]
+    assert [txn["id"] for txn in second["transactions"]] == [11]
+    assert second["nextCursor"] is None
+    assert [txn["id"] for txn in ranged["transactions"]] == [10]
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+@patch("routers.savings_tools.get_auth_header")
+async def test_get_savings_transactions_rejects_bad_window(mock_get_auth_header, mock_make_request, mock_auth):
+    for window in ({"from_date": "yesterday"}, {"cursor": "2"}, {"limit": 0}):
+        result = await get_savings_transactions(1, "user1", "pwd", **window)
+        assert result["status_code"] == 400
+    mock_make_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("routers.savings_tools.make_request", new_callable=AsyncMock)
+@patch("routers.savings_tools.get_auth_header")
+async def test_get_savings_transactions_caps_the_page_size(mock_get_auth_header, mock_make_request, mock_auth):
+    response_cache.clear()
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.return_value = {
+        "id": 2,
+        "transactions": [{"id": i, "date": [2025, 1, 1], "amount": 1.0} for i in range(1, MAX_TRANSACTION_PAGE + 2)],
+    }
+
+    result = await get_savings_transactions(2, "user1", "pwd", limit=10_000)
+    response_cache.clear()
+
+    assert len(result["transactions"]) == MAX_TRANSACTION_PAGE
+    assert result["nextCursor"] is not None
@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import patch, AsyncMock
+from starlette.testclient import TestClient
+import utils.http as http
+from main import create_app
+from mcp_app import mcp
+
+MCP_HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.fixture
+def restore_settings():
+    settings = mcp.settings.model_copy()
+    # A session manager runs only once; start from a fresh one built with the new settings
+    mcp._session_manager = None
+    yield
+    mcp.settings = settings
+    mcp._session_manager = None
+
+
+@patch("routers.loan_tools.make_request", new_callable=AsyncMock)
+@patch("routers.loan_tools.get_auth_header")
+def test_streamable_http_worker_serves_tools_and_owns_the_pool(
+    mock_get_auth_header, mock_make_request, restore_settings
+):
+    mock_get_auth_header.return_value = "Basic abc"
+    mock_make_request.return_value = [{"id": 1, "name": "Personal Loan"}]
+    app = create_app("streamable-http", host="0.0.0.0", stateless=True)
+    call = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "get_loan_products", "arguments": {"client_id": 1, "username": "u", "password": "p"}},
+    }
+
+    with TestClient(app) as client:
+        assert http.DEFAULT_TENANT in http._clients
+        response = client.post("/mcp", json=call, headers=MCP_HEADERS)
+        metrics = client.get("/metrics")
+
+    assert response.status_code == 200
+    result = response.json()["result"]
+    assert result["isError"] is False
+    assert "Personal Loan" in result["content"][0]["text"]
+    assert metrics.status_code == 200
+    assert mcp.settings.transport_security is None
+    assert http._clients == {}
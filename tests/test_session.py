@@ -0,0 +1,91 @@
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+import main  # noqa: F401
+from mcp_app import mcp
+from utils.auth import get_auth_header, sessions
+from utils.session import SessionError, SessionManager, describe
+
+LOGIN_RESPONSE = {
+    "username": "maria",
+    "userId": 7,
+    "base64EncodedAuthenticationKey": "bWFyaWE6cGFzc3dvcmQ=",
+    "authenticated": True,
+    "clients": [42],
+    "roles": [{"id": 2, "name": "Self Service User"}],
+    "permissions": ["READ_SAVINGSACCOUNT", "CREATE_ACCOUNTTRANSFER"],
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_session_keeps_key_and_user_context():
+    manager = SessionManager()
+    session = manager.create("maria", LOGIN_RESPONSE)
+
+    assert manager.get(session.session_id) == session
+    details = describe(session, manager.expires_in(session.session_id))
+    assert details["clientId"] == 42
+    assert details["roles"] == ["Self Service User"]
+    assert "base64EncodedAuthenticationKey" not in details
+
+
+def test_session_expires_after_idle_ttl_and_use_extends_it():
+    clock = FakeClock()
+    manager = SessionManager(ttl=10, clock=clock)
+    session = manager.create("maria", LOGIN_RESPONSE)
+
+    clock.now = 8
+    manager.get(session.session_id)
+    clock.now = 16
+    manager.get(session.session_id)
+    clock.now = 27
+
+    with pytest.raises(SessionError):
+        manager.get(session.session_id)
+    assert len(manager) == 0
+
+
+def test_oldest_session_is_dropped_at_capacity():
+    clock = FakeClock()
+    manager = SessionManager(max_sessions=2, clock=clock)
+    first = manager.create("a", LOGIN_RESPONSE)
+    clock.now = 1
+    manager.create("b", LOGIN_RESPONSE)
+    clock.now = 2
+    manager.create("c", LOGIN_RESPONSE)
+
+    assert len(manager) == 2
+    with pytest.raises(SessionError):
+        manager.get(first.session_id)
+
+
+def test_auth_header_resolves_session_handle():
+    session = sessions.create("maria", LOGIN_RESPONSE)
+    try:
+        assert get_auth_header(session.session_id, "") == "Basic bWFyaWE6cGFzc3dvcmQ="
+        assert get_auth_header("maria", "password") == "Basic bWFyaWE6cGFzc3dvcmQ="
+    finally:
+        sessions.end(session.session_id)
+
+    with pytest.raises(SessionError):
+        get_auth_header(session.session_id, "")
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+async def test_tools_answer_unknown_session_with_401(mock_make_request):
+    arguments = {"client_id": 1, "username": "mifos-session-bogus", "password": ""}
+
+    content = await mcp.call_tool("get_client_details", arguments)
+
+    result = json.loads(content[0].text)
+    assert result["error"] is True
+    assert result["status_code"] == 401
+    mock_make_request.assert_not_called()
@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch, AsyncMock
+import main  # noqa: F401
+from mcp_app import LazyTool, mcp
+from utils.startup import StartupProfile, build_manifest, load_manifest, profile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_manifest_matches_registered_tools():
+    # Regenerate with `python main.py --write-manifest` after adding or changing a tool
+    def by_name(manifest):
+        return {entry["name"]: entry for entry in manifest}
+
+    assert by_name(load_manifest()) == by_name(build_manifest(mcp))
+
+
+def test_profile_marks_milestones_once_and_times_imports():
+    now = [10.0]
+    startup = StartupProfile(clock=lambda: now[0])
+    now[0] = 10.5
+    assert startup.mark("tools_registered") is True
+    now[0] = 11.0
+    assert startup.mark("tools_registered") is False
+    startup.import_module("json", deferred=True)
+
+    report = startup.report()
+    assert report["milestones_ms"] == {"tools_registered": 500.0}
+    assert report["deferred_modules_ms"] == {"json": 0.0}
+    assert report["modules_ms"] == {}
+
+
+@pytest.mark.asyncio
+async def test_lazy_tool_imports_its_module_on_first_call(monkeypatch):
+    entry = next(entry for entry in load_manifest() if entry["name"] == "get_loan_products")
+    monkeypatch.setattr(mcp._tool_manager, "warn_on_duplicate_tools", False)
+    monkeypatch.setattr(profile, "deferred", {})
+    monkeypatch.delitem(mcp._tool_manager._tools, "get_loan_products")
+    monkeypatch.delitem(sys.modules, "routers.loan_tools")
+    mcp.add_lazy_tool(**entry)
+
+    listed = {tool.name: tool for tool in await mcp.list_tools()}
+    assert listed["get_loan_products"].inputSchema == entry["parameters"]
+    assert isinstance(mcp._tool_manager.get_tool("get_loan_products"), LazyTool)
+
+    with patch("utils.http.make_request", new_callable=AsyncMock) as mock_make_request, patch(
+        "utils.auth.get_auth_header", return_value="Basic abc"
+    ):
+        mock_make_request.return_value = [{"id": 1, "name": "Personal Loan"}]
+        result = await mcp._tool_manager.get_tool("get_loan_products").run(
+            {"client_id": 1, "username": "u", "password": "p"}
+        )
+
+    assert result == [{"id": 1, "name": "Personal Loan"}]
+    assert "routers.loan_tools" in profile.deferred
+    assert not isinstance(mcp._tool_manager.get_tool("get_loan_products"), LazyTool)
+
+
+def test_lazy_startup_lists_every_tool_without_importing_routers():
+    env = {**os.environ, "MIFOS_LAZY_TOOLS": "true"}
+    completed = subprocess.run(
+        [sys.executable, "main.py", "--startup-report"], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+    report = json.loads(completed.stdout)
+    assert report["mode"] == "lazy"
+    assert "first_list_tools" in report["milestones_ms"]
+    assert not [module for module in report["modules_ms"] if module.startswith("routers.")]
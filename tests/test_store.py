@@ -0,0 +1,101 @@
+import hashlib
+import sqlite3
+from utils.fineract import is_cash_movement, transaction_direction
+from utils.store import TransactionStore
+
+SAVINGS = [
+    {"id": 1, "date": [2025, 1, 5], "transactionType": {"value": "Deposit", "deposit": True}, "amount": 500.0},
+    {"id": 2, "date": [2025, 1, 9], "transactionType": {"value": "Withdrawal", "withdrawal": True}, "amount": 120.0},
+    {"id": 3, "date": [2025, 2, 2], "transactionType": {"value": "Withdrawal", "withdrawal": True}, "amount": 40.0},
+    {"id": 4, "date": [2025, 2, 3], "transactionType": {"value": "Pay Charge"}, "amount": 5.0, "reversed": True},
+]
+
+
+def make_store():
+    return TransactionStore(":memory:")
+
+
+def test_transaction_direction():
+    assert transaction_direction(SAVINGS[0], "savings") == "credit"
+    assert transaction_direction(SAVINGS[1], "savings") == "debit"
+    assert transaction_direction({"type": {"value": "Repayment", "repayment": True}}, "loan") == "debit"
+    assert transaction_direction({"type": {"value": "Disbursement", "disbursement": True}}, "loan") == "credit"
+    assert transaction_direction({"type": {"value": "Pay Charge"}}, "client") == "debit"
+
+
+def test_add_transactions_is_incremental():
+    store = make_store()
+    assert store.add_transactions("t", "u", "savings", 7, SAVINGS[:2]) == 2
+    assert store.add_transactions("t", "u", "savings", 7, SAVINGS) == 2
+    assert store.add_transactions("t", "u", "savings", 7, SAVINGS) == 0
+    assert store.watermark("t", "u", "savings", 7) == (4, "2025-02-03")
+
+
+def test_spending_and_largest_debits_ignore_reversed_rows():
+    store = make_store()
+    store.add_transactions("t", "u", "savings", 7, SAVINGS)
+
+    spending = store.spending("t", "u", from_date="2025-01-01", to_date="2025-01-31")
+    assert spending["debits"] == {"count": 1, "total": 120.0}
+    assert spending["credits"] == {"count": 1, "total": 500.0}
+
+    largest = store.transactions("t", "u", direction="debit", order="largest")
+    assert [row["txn_id"] for row in largest] == [2, 3]
+
+
+def test_resync_marks_later_reversals():
+    store = make_store()
+    store.add_transactions("t", "u", "savings", 7, SAVINGS[:2])
+
+    assert store.add_transactions("t", "u", "savings", 7, [SAVINGS[0], {**SAVINGS[1], "reversed": True}]) == 0
+
+    spending = store.spending("t", "u", from_date="2025-01-01", to_date="2025-01-31")
+    assert spending["debits"]["count"] == 0
+    assert spending["credits"] == {"count": 1, "total": 500.0}
+
+
+def test_non_cash_loan_entries_are_not_stored():
+    loan = [
+        {"id": 1, "date": [2025, 1, 5], "type": {"value": "Disbursement", "disbursement": True}, "amount": 900.0},
+        {"id": 2, "date": [2025, 1, 31], "type": {"value": "Accrual", "accrual": True}, "amount": 9.0},
+        {"id": 3, "date": [2025, 2, 1], "type": {"value": "Waive interest", "waiveInterest": True}, "amount": 3.0},
+        {"id": 4, "date": [2025, 2, 2], "type": {"value": "Close (as written-off)", "writeOff": True}, "amount": 50.0},
+    ]
+    assert [is_cash_movement(txn) for txn in loan] == [True, False, False, False]
+
+    store = make_store()
+    assert store.add_transactions("t", "u", "loan", 9, loan) == 1
+    assert store.spending("t", "u")["credits"] == {"count": 1, "total": 900.0}
+
+
+def test_rows_are_isolated_per_owner():
+    store = make_store()
+    store.add_transactions("t", "alice", "savings", 7, SAVINGS)
+
+    assert store.transactions("t", "bob") == []
+    assert store.sync_state("t", "bob") == []
+
+
+def test_owner_is_keyed_and_not_a_plain_hash_of_the_credentials(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    auth = "Basic dXNlcjE6cHdk"
+    store = TransactionStore(path)
+    owner = store.owner("t", auth)
+    store.close()
+
+    assert owner != hashlib.sha256(auth.encode()).hexdigest()
+    assert TransactionStore(path).owner("t", auth) == owner
+    assert TransactionStore(path, secret="configured").owner("t", auth) != owner
+    assert (tmp_path / "history.sqlite3.key").stat().st_mode & 0o077 == 0
+
+
+def test_rows_of_older_schema_versions_are_dropped(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    TransactionStore(path).add_transactions("t", "u", "savings", 7, SAVINGS)
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA user_version = 0")
+
+    store = TransactionStore(path)
+
+    assert store.transactions("t", "u") == []
+    assert store.watermark("t", "u", "savings", 7) == (0, None)
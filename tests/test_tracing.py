@@ -0,0 +1,119 @@
+import json
+import httpx
+import pytest
+from unittest.mock import patch, AsyncMock
+import main  # noqa: F401
+import utils.http as http
+from mcp_app import mcp
+from utils.http import make_request, response_cache
+from utils.tracing import JsonlExporter, PhaseRecorder, Span, Tracer, to_otlp, tracer
+
+
+class MemoryExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    async def flush(self):
+        pass
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    exporter = MemoryExporter()
+    monkeypatch.setattr(tracer, "exporter", exporter)
+    response_cache.clear()
+    yield exporter.spans
+    http._clients.clear()
+
+
+def test_child_spans_share_the_trace_and_record_errors():
+    exporter = MemoryExporter()
+    local = Tracer(exporter)
+
+    with pytest.raises(ValueError):
+        with local.span("parent") as parent:
+            with local.span("child", kind="client", path="/x") as child:
+                child.set("status_code", 200)
+            raise ValueError("boom")
+
+    child, parent = exporter.spans
+    assert (child.trace_id, child.parent_id) == (parent.trace_id, parent.span_id)
+    assert child.attributes == {"path": "/x", "status_code": 200}
+    assert parent.error == "boom" and parent.parent_id is None
+
+
+def test_disabled_tracer_hands_out_noop_spans():
+    with Tracer().span("anything") as span:
+        span.set("ignored", 1)
+    assert span.recording is False
+
+
+def test_jsonl_exporter_appends_one_line_per_span(tmp_path):
+    path = tmp_path / "traces" / "spans.jsonl"
+    local = Tracer(JsonlExporter(str(path)))
+    with local.span("one"):
+        pass
+    with local.span("two"):
+        pass
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["one", "two"]
+    assert lines[0]["duration_ms"] >= 0
+
+
+def test_otlp_encoding():
+    span = Span("fineract.http", "client", None, {"status_code": 200, "cache": "miss", "coalesced": False})
+    span.end_ns = span.start_ns + 1000
+    encoded = to_otlp([span])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+
+    assert encoded["kind"] == 3 and "parentSpanId" not in encoded
+    assert {"key": "status_code", "value": {"intValue": "200"}} in encoded["attributes"]
+    assert {"key": "coalesced", "value": {"boolValue": False}} in encoded["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_phase_recorder_times_connect_and_first_byte():
+    span = Span("fineract.http", "client", None, {})
+    recorder = PhaseRecorder(span)
+    for event in (
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "http11.send_request_headers.started",
+        "http11.receive_response_headers.started",
+        "http11.receive_response_headers.complete",
+    ):
+        await recorder(event, {})
+
+    assert span.attributes["connection_reused"] is False
+    assert span.attributes["connect_ms"] >= 0 and span.attributes["ttfb_ms"] >= 0
+    assert "tls_ms" not in span.attributes
+
+
+@pytest.mark.asyncio
+async def test_upstream_span_is_child_of_make_request(spans):
+    http._clients["default"] = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": 1}))
+    )
+    await make_request("GET", "/self/loanproducts/1", auth="Basic abc")
+    await make_request("GET", "/self/loanproducts/1", auth="Basic abc")
+
+    upstream, first, cached = spans
+    assert upstream.name == "fineract.http" and upstream.parent_id == first.span_id
+    assert upstream.attributes["status_code"] == 200 and "queue_ms" in upstream.attributes
+    assert "decode_ms" in upstream.attributes
+    assert (first.attributes["cache"], cached.attributes["cache"]) == ("miss", "hit")
+
+
+@pytest.mark.asyncio
+@patch("routers.client_tools.make_request", new_callable=AsyncMock)
+async def test_tool_calls_open_a_root_span(mock_make_request, spans):
+    mock_make_request.return_value = {"error": True, "status_code": 404, "message": "missing"}
+    await mcp.call_tool("get_client_details", {"client_id": 1, "username": "u", "password": "p"})
+
+    (span,) = spans
+    assert span.name == "tool get_client_details"
+    assert span.attributes == {"mcp.tool": "get_client_details"}
+    assert span.error == "status 404"
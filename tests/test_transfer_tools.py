@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch, AsyncMock
 from routers.transfer_tools import (
@@ -8,6 +9,7 @@ from routers.transfer_tools import (
     get_third_party_transfer_template,
     make_third_party_transfer,
     make_account_transfer,
+    make_batch_transfers,
 )
 
 
@@ -16,6 +18,24 @@ def mock_auth():
     return "Basic dXNlcjE6cHdk"
 
 
+def transfer(source, target, amount=10):
+    return {
+        "fromOfficeId": 1,
+        "fromClientId": 1,
+        "fromAccountType": 2,
+        "fromAccountId": source,
+        "toOfficeId": 1,
+        "toClientId": 2,
+        "toAccountType": 2,
+        "toAccountId": target,
+        "transferAmount": amount,
+        "transferDate": "18 October 2026",
+        "transferDescription": "rent",
+        "dateFormat": "dd MMMM yyyy",
+        "locale": "en",
+    }
+
+
 @pytest.mark.asyncio
 @patch("routers.transfer_tools.make_request", new_callable=AsyncMock)
 @patch("routers.transfer_tools.get_auth_header")
@@ -36,10 +56,12 @@ async def test_transfer_between_accounts(mock_get_auth_header, mock_make_request
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 1}
 
-    result = await transfer_between_accounts({"amount": 100}, "user1", "pwd")
+    result = await transfer_between_accounts(transfer(1, 2, 100), "user1", "pwd")
     assert result == {"resourceId": 1}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
-    mock_make_request.assert_called_once_with("POST", "/self/accounttransfers", auth=mock_auth, data={"amount": 100})
+    mock_make_request.assert_called_once_with(
+        "POST", "/self/accounttransfers", auth=mock_auth, data=transfer(1, 2, 100)
+    )
 
 
 @pytest.mark.asyncio
@@ -49,11 +71,11 @@ async def test_transfer_third_party(mock_get_auth_header, mock_make_request, moc
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 2}
 
-    result = await transfer_third_party({"amount": 200}, "user1", "pwd")
+    result = await transfer_third_party(transfer(1, 2, 200), "user1", "pwd")
     assert result == {"resourceId": 2}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with(
-        "POST", "/self/accounttransfers?type=tpt", auth=mock_auth, data={"amount": 200}
+        "POST", "/self/accounttransfers?type=tpt", auth=mock_auth, data=transfer(1, 2, 200)
     )
 
 
@@ -92,11 +114,11 @@ async def test_make_third_party_transfer(mock_get_auth_header, mock_make_request
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 3}
 
-    result = await make_third_party_transfer({"amount": 300}, "user1", "pwd")
+    result = await make_third_party_transfer(transfer(1, 2, 300), "user1", "pwd")
     assert result == {"resourceId": 3}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
     mock_make_request.assert_called_once_with(
-        "POST", "/self/accounttransfers?type=tpt", auth=mock_auth, data={"amount": 300}
+        "POST", "/self/accounttransfers?type=tpt", auth=mock_auth, data=transfer(1, 2, 300)
     )
 
 
@@ -107,7 +129,92 @@ async def test_make_account_transfer(mock_get_auth_header, mock_make_request, mo
     mock_get_auth_header.return_value = mock_auth
     mock_make_request.return_value = {"resourceId": 4}
 
-    result = await make_account_transfer({"amount": 400}, "user1", "pwd")
+    result = await make_account_transfer(transfer(1, 2, 400), "user1", "pwd")
     assert result == {"resourceId": 4}
     mock_get_auth_header.assert_called_once_with("user1", "pwd")
-    mock_make_request.assert_called_once_with("POST", "/self/accounttransfers", auth=mock_auth, data={"amount": 400})
+    mock_make_request.assert_called_once_with(
+        "POST", "/self/accounttransfers", auth=mock_auth, data=transfer(1, 2, 400)
+    )
+
+
+@pytest.mark.asyncio
+@patch("routers.transfer_tools.make_request", new_callable=AsyncMock)
+@patch("routers.transfer_tools.get_auth_header")
+async def test_make_batch_transfers_validates_before_sending(mock_get_auth_header, mock_make_request):
+    result = await make_batch_transfers([transfer(1, 2), transfer(1, 1), {"fromAccountId": 1}], "user1", "pwd")
+
+    mock_make_request.assert_not_called()
+    assert result["status_code"] == 400
+    assert [item["index"] for item in result["invalid"]] == [1, 2]
+    assert result["invalid"][0]["errors"] == [
+        {"field": "toAccountId", "message": "is the source account; transfers need two different accounts"}
+    ]
+
+
+@pytest.mark.asyncio
+@patch("routers.transfer_tools.make_request", new_callable=AsyncMock)
+@patch("routers.transfer_tools.get_auth_header")
+async def test_make_account_transfer_rejects_invalid_fields_locally(mock_get_auth_header, mock_make_request):
+    data = {**transfer(1, 2, -5), "toAccountType": 3, "transferDate": "2026-10-18"}
+    del data["toClientId"]
+
+    result = await make_account_transfer(data, "user1", "pwd")
+
+    mock_make_request.assert_not_called()
+    assert result["status_code"] == 400
+    assert {item["field"] for item in result["errors"]} == {
+        "toClientId",
+        "toAccountType",
+        "transferAmount",
+        "transferDate",
+    }
+    assert "transferDate: does not match dateFormat 'dd MMMM yyyy'" in result["message"]
+
+
+@pytest.mark.asyncio
+@patch("routers.transfer_tools.make_request", new_callable=AsyncMock)
+@patch("routers.transfer_tools.get_auth_header")
+async def test_make_batch_transfers_orders_per_source_and_caps_concurrency(
+    mock_get_auth_header, mock_make_request, mock_auth
+):
+    mock_get_auth_header.return_value = mock_auth
+    order = []
+    active = 0
+    peak = 0
+
+    async def respond(method, path, auth, data):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        order.append((data["fromAccountId"], data["transferAmount"]))
+        active -= 1
+        return {"resourceId": data["transferAmount"]}
+
+    mock_make_request.side_effect = respond
+    batch = [transfer(1, 9, 1), transfer(2, 9, 2), transfer(1, 9, 3), transfer(3, 9, 4), transfer(1, 9, 5)]
+
+    result = await make_batch_transfers(batch, "user1", "pwd", third_party=True, max_concurrency=2)
+
+    assert result["succeeded"] == 5
+    assert peak == 2
+    assert [amount for source, amount in order if source == 1] == [1, 3, 5]
+    assert mock_make_request.call_args.args == ("POST", "/self/accounttransfers?type=tpt")
+    assert [item["resourceId"] for item in result["results"]] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+@patch("routers.transfer_tools.make_request", new_callable=AsyncMock)
+@patch("routers.transfer_tools.get_auth_header")
+async def test_make_batch_transfers_stops_at_failure_threshold(mock_get_auth_header, mock_make_request, mock_auth):
+    mock_get_auth_header.return_value = mock_auth
+    mock_make_request.side_effect = [
+        {"resourceId": 1},
+        {"error": True, "status_code": 403, "message": "limit exceeded"},
+    ]
+
+    result = await make_batch_transfers([transfer(1, 9), transfer(1, 8), transfer(1, 7)], "user1", "pwd")
+
+    assert [item["status"] for item in result["results"]] == ["succeeded", "failed", "skipped"]
+    assert result["stopped"] is True
+    assert mock_make_request.call_count == 2
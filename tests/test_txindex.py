@@ -0,0 +1,55 @@
+from datetime import date
+import pytest
+from utils.txindex import TransactionIndex
+
+HISTORY = [
+    {"id": 1, "date": [2025, 1, 5], "transactionType": {"value": "Deposit"}, "amount": 100.0},
+    {"id": 2, "date": [2025, 1, 20], "transactionType": {"value": "Withdrawal"}, "amount": 30.0},
+    {"id": 3, "date": [2025, 2, 3], "transactionType": {"value": "Deposit"}, "amount": 250.0},
+    {"id": 4, "date": [2025, 2, 3], "transactionType": {"value": "Withdrawal"}, "amount": 75.0},
+    {"id": 5, "date": [2025, 3, 1], "transactionType": {"value": "Interest Posting"}, "amount": 1.5},
+]
+
+
+def ids(window):
+    return [txn["id"] for txn in window["transactions"]]
+
+
+def test_query_returns_newest_first():
+    window = TransactionIndex(HISTORY).query()
+    assert ids(window) == [5, 4, 3, 2, 1]
+    assert window["nextCursor"] is None
+    assert window["transactions"][0]["date"] == "2025-03-01"
+
+
+def test_query_filters_by_date_type_and_amount():
+    index = TransactionIndex(HISTORY)
+    assert ids(index.query(from_date=date(2025, 1, 20), to_date=date(2025, 2, 3))) == [4, 3, 2]
+    assert ids(index.query(transaction_type="withdrawal")) == [4, 2]
+    assert ids(index.query(min_amount=50, max_amount=200)) == [4, 1]
+
+
+def test_cursor_pages_through_matches():
+    index = TransactionIndex(HISTORY)
+    first = index.query(limit=2)
+    second = index.query(limit=2, cursor=first["nextCursor"])
+    third = index.query(limit=2, cursor=second["nextCursor"])
+
+    assert ids(first) == [5, 4]
+    assert ids(second) == [3, 2]
+    assert ids(third) == [1]
+    assert third["nextCursor"] is None
+
+
+def test_cursor_survives_a_rebuild_with_newer_transactions():
+    first = TransactionIndex(HISTORY).query(limit=2)
+    newer = [{"id": 6, "date": [2025, 3, 9], "amount": 5.0}, {"id": 7, "date": [2025, 3, 10], "amount": 9.0}]
+
+    second = TransactionIndex(HISTORY + newer).query(limit=2, cursor=first["nextCursor"])
+
+    assert ids(second) == [3, 2]
+
+
+def test_malformed_cursor_is_rejected():
+    with pytest.raises(ValueError):
+        TransactionIndex(HISTORY).query(cursor="3")
@@ -0,0 +1,237 @@
+import calendar
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Any, Dict, List, Optional
+from utils.fineract import parse_java_date
+
+# Fineract enum codes used by calculateLoanSchedule payloads
+FREQUENCY_DAYS, FREQUENCY_WEEKS, FREQUENCY_MONTHS, FREQUENCY_YEARS = 0, 1, 2, 3
+RATE_PER_MONTH, RATE_PER_YEAR = 2, 3
+AMORTIZATION_EQUAL_PRINCIPAL, AMORTIZATION_EQUAL_INSTALLMENTS = 0, 1
+INTEREST_DECLINING_BALANCE, INTEREST_FLAT = 0, 1
+INTEREST_PERIOD_SAME_AS_REPAYMENT = 1
+DAYS_ACTUAL = 1
+
+PERIODS_PER_YEAR = {FREQUENCY_DAYS: 365, FREQUENCY_WEEKS: 52, FREQUENCY_MONTHS: 12, FREQUENCY_YEARS: 1}
+
+# Payload keys that do not change the schedule arithmetic
+IGNORED_KEYS = {
+    "clientId",
+    "productId",
+    "loanType",
+    "locale",
+    "dateFormat",
+    "submittedOnDate",
+    "transactionProcessingStrategyCode",
+    "loanTermFrequency",
+    "loanTermFrequencyType",
+    "linkAccountId",
+    "externalId",
+    "loanPurposeId",
+    "fundId",
+    "loanOfficerId",
+    "inArrearsTolerance",
+    "graceOnArrearsAgeing",
+    "isTopup",
+    "createStandingInstructionAtDisbursement",
+}
+SUPPORTED_KEYS = IGNORED_KEYS | {
+    "principal",
+    "numberOfRepayments",
+    "repaymentEvery",
+    "repaymentFrequencyType",
+    "interestRatePerPeriod",
+    "interestRateFrequencyType",
+    "amortizationType",
+    "interestType",
+    "interestCalculationPeriodType",
+    "expectedDisbursementDate",
+    "graceOnPrincipalPayment",
+    "graceOnInterestPayment",
+    "graceOnInterestCharged",
+    "charges",
+}
+
+
+class UnsupportedSchedule(ValueError):
+    """The payload uses a product configuration the local engine does not model."""
+
+
+def _enum_id(value: Any) -> Any:
+    return value.get("id") if isinstance(value, dict) else value
+
+
+def product_currency_digits(product: Dict[str, Any]) -> int:
+    """Currency decimal places of a loan product the local engine can schedule.
+
+    The engine rounds to the currency's decimal places, counts actual days and
+    does not recalculate interest; raises ``UnsupportedSchedule`` for products
+    that round installments to a multiple, recalculate interest, or use a 360 or
+    364 day year or 30 day months.
+    """
+    currency = product.get("currency") or {}
+    if currency.get("inMultiplesOf") or product.get("installmentAmountInMultiplesOf"):
+        raise UnsupportedSchedule("amounts rounded to a multiple are not modelled locally")
+    if product.get("isInterestRecalculationEnabled"):
+        raise UnsupportedSchedule("interest recalculation is not modelled locally")
+    if _enum_id(product.get("daysInYearType")) not in (None, DAYS_ACTUAL, 365):
+        raise UnsupportedSchedule("only actual or 365 day years are supported")
+    if _enum_id(product.get("daysInMonthType")) not in (None, DAYS_ACTUAL):
+        raise UnsupportedSchedule("only actual days in month are supported")
+    digits = currency.get("decimalPlaces")
+    return 2 if digits is None else int(digits)
+
+
+def _add_months(start: date, months: int) -> date:
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def _due_date(start: date, frequency: int, every: int, period: int) -> date:
+    if frequency == FREQUENCY_DAYS:
+        return start + timedelta(days=every * period)
+    if frequency == FREQUENCY_WEEKS:
+        return start + timedelta(weeks=every * period)
+    if frequency == FREQUENCY_MONTHS:
+        return _add_months(start, every * period)
+    return _add_months(start, 12 * every * period)
+
+
+def _money(value: Decimal, digits: int) -> Decimal:
+    return value.quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_EVEN)
+
+
+def _int(data: Dict[str, Any], key: str, default: Optional[int] = None) -> int:
+    value = data.get(key, default)
+    if value is None or value == "":
+        raise UnsupportedSchedule(f"{key} is required")
+    return int(value)
+
+
+def calculate_schedule(data: Dict[str, Any], currency_digits: int = 2) -> Dict[str, Any]:
+    """Compute a repayment schedule for a calculateLoanSchedule payload.
+
+    Models declining-balance and flat interest, equal installments and equal
+    principal, interest calculated per repayment period, and grace on principal
+    payment, interest payment (interest deferred to the first installment after
+    the grace) and interest charged. Raises ``UnsupportedSchedule`` for anything
+    else (charges, daily interest calculation, rates per whole term, unknown
+    options, ...) so the caller can defer to the server.
+    """
+    unknown = sorted(key for key, value in data.items() if key not in SUPPORTED_KEYS and value not in (None, "", []))
+    if unknown:
+        raise UnsupportedSchedule(f"unsupported options: {', '.join(unknown)}")
+    if data.get("charges"):
+        raise UnsupportedSchedule("loan charges are not modelled locally")
+    if _int(data, "interestCalculationPeriodType", INTEREST_PERIOD_SAME_AS_REPAYMENT) != (
+        INTEREST_PERIOD_SAME_AS_REPAYMENT
+    ):
+        raise UnsupportedSchedule("only interest calculated per repayment period is supported")
+
+    try:
+        principal = Decimal(str(data["principal"]))
+        rate = Decimal(str(data["interestRatePerPeriod"]))
+        disbursed_on = parse_java_date(str(data["expectedDisbursementDate"]), data.get("dateFormat", "dd MMMM yyyy"))
+    except (KeyError, ArithmeticError, ValueError) as e:
+        raise UnsupportedSchedule(f"missing or invalid field: {e}")
+
+    repayments = _int(data, "numberOfRepayments")
+    every = _int(data, "repaymentEvery", 1)
+    frequency = _int(data, "repaymentFrequencyType")
+    rate_frequency = _int(data, "interestRateFrequencyType")
+    amortization = _int(data, "amortizationType")
+    interest_type = _int(data, "interestType")
+    principal_grace = _int(data, "graceOnPrincipalPayment", 0)
+    payment_grace = _int(data, "graceOnInterestPayment", 0)
+    charged_grace = _int(data, "graceOnInterestCharged", 0)
+
+    if frequency not in PERIODS_PER_YEAR or rate_frequency not in (RATE_PER_MONTH, RATE_PER_YEAR):
+        raise UnsupportedSchedule("unsupported repayment or interest rate frequency")
+    if amortization not in (AMORTIZATION_EQUAL_PRINCIPAL, AMORTIZATION_EQUAL_INSTALLMENTS):
+        raise UnsupportedSchedule("unsupported amortization type")
+    if interest_type not in (INTEREST_DECLINING_BALANCE, INTEREST_FLAT):
+        raise UnsupportedSchedule("unsupported interest type")
+    if repayments <= 0 or every <= 0 or principal <= 0 or max(principal_grace, payment_grace) >= repayments:
+        raise UnsupportedSchedule("invalid term or grace configuration")
+
+    annual_rate = rate * 12 if rate_frequency == RATE_PER_MONTH else rate
+    periodic_rate = annual_rate / 100 / PERIODS_PER_YEAR[frequency] * every
+
+    amortizing = repayments - principal_grace
+    if interest_type == INTEREST_FLAT:
+        flat_interest = _money(principal * periodic_rate * (repayments - charged_grace), currency_digits)
+        flat_share = _money(flat_interest / (repayments - charged_grace), currency_digits)
+    elif amortization == AMORTIZATION_EQUAL_INSTALLMENTS and periodic_rate:
+        factor = (1 + periodic_rate) ** amortizing
+        installment = _money(principal * periodic_rate * factor / (factor - 1), currency_digits)
+    else:
+        installment = _money(principal / amortizing, currency_digits)
+    equal_principal = _money(principal / amortizing, currency_digits)
+
+    periods: List[Dict[str, Any]] = [
+        {
+            "dueDate": [disbursed_on.year, disbursed_on.month, disbursed_on.day],
+            "principalDisbursed": float(principal),
+            "principalLoanBalanceOutstanding": float(principal),
+            "totalDueForPeriod": 0.0,
+        }
+    ]
+    balance = principal
+    deferred_interest = Decimal(0)
+    flat_charged = Decimal(0)
+    totals = {"principal": Decimal(0), "interest": Decimal(0)}
+    previous_due = disbursed_on
+
+    for number in range(1, repayments + 1):
+        due = _due_date(disbursed_on, frequency, every, number)
+
+        if number <= charged_grace:
+            interest = Decimal(0)
+        elif interest_type == INTEREST_FLAT:
+            interest = flat_share if number < repayments else flat_interest - flat_charged
+            flat_charged += interest
+        else:
+            interest = _money(balance * periodic_rate, currency_digits)
+
+        if number <= payment_grace:
+            deferred_interest += interest
+            interest_due = Decimal(0)
+        else:
+            interest_due, deferred_interest = interest + deferred_interest, Decimal(0)
+
+        if number <= principal_grace:
+            principal_due = Decimal(0)
+        elif number == repayments:
+            principal_due = balance
+        elif interest_type == INTEREST_DECLINING_BALANCE and amortization == AMORTIZATION_EQUAL_INSTALLMENTS:
+            principal_due = installment - interest
+        else:
+            principal_due = equal_principal
+
+        balance -= principal_due
+        totals["principal"] += principal_due
+        totals["interest"] += interest_due
+        periods.append(
+            {
+                "period": number,
+                "fromDate": [previous_due.year, previous_due.month, previous_due.day],
+                "dueDate": [due.year, due.month, due.day],
+                "daysInPeriod": (due - previous_due).days,
+                "principalDue": float(principal_due),
+                "interestDue": float(interest_due),
+                "totalDueForPeriod": float(principal_due + interest_due),
+                "principalLoanBalanceOutstanding": float(balance),
+            }
+        )
+        previous_due = due
+
+    return {
+        "loanTermInDays": (previous_due - disbursed_on).days,
+        "totalPrincipalDisbursed": float(principal),
+        "totalPrincipalExpected": float(totals["principal"]),
+        "totalInterestCharged": float(totals["interest"]),
+        "totalRepaymentExpected": float(totals["principal"] + totals["interest"]),
+        "periods": periods,
+        "calculatedLocally": True,
+    }
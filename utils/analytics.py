@@ -0,0 +1,119 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+from utils.fineract import enum_value, is_cash_movement, parse_date, transaction_direction
+
+
+def _counterparty(txn: Dict[str, Any]) -> str:
+    """Best-effort counterparty label from payment details or transfer metadata."""
+    payment = txn.get("paymentDetailData") or {}
+    if payment.get("accountNumber"):
+        return f"account {payment['accountNumber']}"
+    if (payment.get("paymentType") or {}).get("name"):
+        return payment["paymentType"]["name"]
+    transfer = txn.get("transfer") or {}
+    if transfer.get("transferDescription"):
+        return transfer["transferDescription"]
+    return "unspecified"
+
+
+def to_columns(transactions: List[Dict[str, Any]], source: str) -> Dict[str, np.ndarray]:
+    """Convert Fineract transactions to chronologically sorted columnar arrays.
+
+    Reversed, undated and non-cash (accrual, waiver, write-off) transactions are
+    dropped. ``signed`` holds credits as positive and debits as negative amounts;
+    ``balance`` is NaN where Fineract reported no running balance.
+    """
+    rows = [
+        txn for txn in transactions if not txn.get("reversed") and parse_date(txn.get("date")) and is_cash_movement(txn)
+    ]
+    dates = np.array([parse_date(txn.get("date")) for txn in rows], dtype="datetime64[D]")
+    amounts = np.array([float(txn.get("amount") or 0) for txn in rows], dtype=np.float64)
+    debits = np.array([transaction_direction(txn, source) == "debit" for txn in rows], dtype=bool)
+    balances = np.array(
+        [np.nan if txn.get("runningBalance") is None else float(txn["runningBalance"]) for txn in rows],
+        dtype=np.float64,
+    )
+    types = np.array([str(enum_value(txn.get("transactionType") or txn.get("type"))) for txn in rows], dtype=object)
+    counterparties = np.array([_counterparty(txn) for txn in rows], dtype=object)
+    ids = np.array([txn.get("id") or 0 for txn in rows], dtype=np.int64)
+
+    order = np.lexsort((ids, dates))
+    return {
+        "date": dates[order],
+        "amount": amounts[order],
+        "signed": np.where(debits, -amounts, amounts)[order],
+        "balance": balances[order],
+        "type": types[order],
+        "counterparty": counterparties[order],
+    }
+
+
+def _grouped_sums(labels: np.ndarray, values: np.ndarray) -> List[Dict[str, Any]]:
+    keys, inverse = np.unique(labels, return_inverse=True)
+    totals = np.bincount(inverse, weights=values, minlength=len(keys))
+    counts = np.bincount(inverse, minlength=len(keys))
+    order = np.argsort(-totals, kind="stable")
+    return [{"label": str(keys[i]), "count": int(counts[i]), "total": round(float(totals[i]), 2)} for i in order]
+
+
+def summarize(columns: Dict[str, np.ndarray], top_n: int = 5) -> Dict[str, Any]:
+    """Monthly cash flow, balance trajectory, type breakdown and top counterparties."""
+    signed = columns["signed"]
+    if signed.size == 0:
+        return {"transactions": 0}
+
+    inflow = np.where(signed > 0, signed, 0.0)
+    outflow = np.where(signed < 0, -signed, 0.0)
+
+    months = columns["date"].astype("datetime64[M]")
+    month_keys, month_index = np.unique(months, return_inverse=True)
+    monthly_in = np.bincount(month_index, weights=inflow, minlength=len(month_keys))
+    monthly_out = np.bincount(month_index, weights=outflow, minlength=len(month_keys))
+
+    # Prefer Fineract's running balance; fall back to the cumulative net flow when absent.
+    balance = columns["balance"]
+    balance_source = "reported"
+    if np.isnan(balance).any():
+        balance = np.cumsum(signed)
+        balance_source = "cumulative_net_flow"
+    last_of_month = np.r_[month_index[1:] != month_index[:-1], True]
+
+    debit_mask = signed < 0
+    return {
+        "transactions": int(signed.size),
+        "period": {"from": str(columns["date"][0]), "to": str(columns["date"][-1])},
+        "totals": {
+            "inflow": round(float(inflow.sum()), 2),
+            "outflow": round(float(outflow.sum()), 2),
+            "net": round(float(signed.sum()), 2),
+        },
+        "monthly": [
+            {
+                "month": str(month),
+                "inflow": round(float(monthly_in[i]), 2),
+                "outflow": round(float(monthly_out[i]), 2),
+                "net": round(float(monthly_in[i] - monthly_out[i]), 2),
+                "closingBalance": round(float(balance[last_of_month][i]), 2),
+            }
+            for i, month in enumerate(month_keys)
+        ],
+        "balance": {
+            "source": balance_source,
+            "opening": round(float(balance[0]), 2),
+            "closing": round(float(balance[-1]), 2),
+            "min": round(float(balance.min()), 2),
+            "max": round(float(balance.max()), 2),
+        },
+        "byType": _grouped_sums(columns["type"], np.abs(signed)),
+        "topDebitCounterparties": _grouped_sums(columns["counterparty"][debit_mask], outflow[debit_mask])[:top_n],
+        "largestDebit": round(float(outflow.max()), 2),
+    }
+
+
+def filter_dates(columns: Dict[str, np.ndarray], start: Optional[str], end: Optional[str]) -> Dict[str, np.ndarray]:
+    mask = np.ones(columns["date"].shape, dtype=bool)
+    if start:
+        mask &= columns["date"] >= np.datetime64(start, "D")
+    if end:
+        mask &= columns["date"] <= np.datetime64(end, "D")
+    return {name: values[mask] for name, values in columns.items()}
@@ -1,8 +1,43 @@
 import base64
+import functools
+from typing import Any, Callable
+from config.config import SESSION_TTL, SESSION_MAX
+from utils.http import current_tenant, tenant_scope
+from utils.session import SessionError, SessionManager, is_session_handle
+
+sessions = SessionManager(ttl=SESSION_TTL, max_sessions=SESSION_MAX)
 
 
 def get_auth_header(username: str, password: str) -> str:
-    """Generate Basic Auth header"""
+    """Generate Basic Auth header
+
+    A session handle returned by ``login`` can be passed as ``username`` with an
+    empty ``password``; the key cached at login is reused instead of credentials.
+    """
+    if not password and is_session_handle(username):
+        return f"Basic {sessions.get(username).auth_key}"
     credentials = f"{username}:{password}"
     encoded = base64.b64encode(credentials.encode()).decode()
     return f"Basic {encoded}"
+
+
+def with_session(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an async tool so it runs against the tenant of the session handle it is given.
+
+    Calls with credentials stay on the current (by default ``DEFAULT_TENANT``)
+    tenant. An unknown or expired session handle returns a 401 error dict.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        username = kwargs.get("username")
+        try:
+            tenant = current_tenant()
+            if not kwargs.get("password") and is_session_handle(username):
+                tenant = sessions.get(username).tenant
+            with tenant_scope(tenant):
+                return await fn(*args, **kwargs)
+        except SessionError as e:
+            return {"error": True, "status_code": 401, "message": str(e)}
+
+    return wrapper
@@ -0,0 +1,192 @@
+import functools
+import secrets
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from config.config import CONTINUATION_MAX, CONTINUATION_TTL, RESPONSE_BUDGETS, RESPONSE_MAX_BYTES
+from utils.fineract import is_error
+from utils.jsoncodec import json_codec
+
+# Prefix of continuation cursors, followed by a random token and the chunk number
+CONTINUATION_PREFIX = "mifos-cont-"
+
+# Room left in every budget for the ``continuation`` entry itself
+RESERVED_BYTES = 256
+
+# Tools whose responses are never cut (their chunks already fit the original budget)
+UNBUDGETED_TOOLS = frozenset({"fetch_continuation"})
+
+Path = Tuple[str, ...]
+
+
+class ContinuationError(LookupError):
+    """The continuation cursor is malformed, unknown or has expired."""
+
+
+class Chunk(NamedTuple):
+    path: str
+    offset: int
+    items: List[Any]
+
+
+def _size(value: Any) -> int:
+    return len(json_codec.dumps(value))
+
+
+def _lists(value: Any, path: Path = ()) -> List[Tuple[Path, List[Any]]]:
+    """Lists reachable through nested objects (not through other lists), with their paths."""
+    found = []
+    for key, item in value.items():
+        if isinstance(item, list):
+            found.append((path + (key,), item))
+        elif isinstance(item, dict):
+            found.extend(_lists(item, path + (key,)))
+    return found
+
+
+def _replace(value: Dict[str, Any], path: Path, items: List[Any]) -> Dict[str, Any]:
+    """Copy of ``value`` with the list at ``path`` replaced; the input is left untouched."""
+    if len(path) == 1:
+        return {**value, path[0]: items}
+    return {**value, path[0]: _replace(value[path[0]], path[1:], items)}
+
+
+def _fit(items: List[Any], room: int, minimum: int = 1) -> int:
+    """How many leading ``items`` fit in ``room`` bytes; chunks take at least one so they always advance."""
+    used = 0
+    for count, item in enumerate(items):
+        used += _size(item) + 1
+        if used > room and count >= minimum:
+            return count
+    return len(items)
+
+
+def truncate(response: Any, max_bytes: int) -> Tuple[Any, List[Chunk], int]:
+    """Cut an oversized response at list element boundaries.
+
+    The largest lists are shortened first until the response fits ``max_bytes``;
+    the elements left out are split into chunks of the same budget. Returns the
+    (possibly unchanged) response, the chunks and the original size in bytes.
+    """
+    size = _size(response)
+    if size <= max_bytes:
+        return response, [], size
+
+    kept = response if isinstance(response, dict) else {"pageItems": response}
+    candidates = sorted(_lists(kept), key=lambda candidate: _size(candidate[1]), reverse=True)
+    room = max(1, max_bytes - RESERVED_BYTES)
+    chunks: List[Chunk] = []
+    for path, items in candidates:
+        if _size(kept) <= room:
+            break
+        keep = _fit(items, room - _size(_replace(kept, path, [])), minimum=0)
+        kept = _replace(kept, path, items[:keep])
+        offset = keep
+        while offset < len(items):
+            count = _fit(items[offset:], room)
+            chunks.append(Chunk(".".join(path), offset, items[offset : offset + count]))
+            offset += count
+    return kept, chunks, size
+
+
+class ContinuationStore:
+    """Chunks of truncated responses kept server-side until fetched or expired.
+
+    Cursors are unguessable tokens, so only the caller that received one can read
+    the rest of its response; Fineract is never queried again for it.
+    """
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: Dict[str, List[Chunk]] = {}
+        self._expires: Dict[str, float] = {}
+
+    def put(self, chunks: List[Chunk]) -> str:
+        """Store ``chunks`` and return the cursor of the first one."""
+        self._purge()
+        while len(self._entries) >= self.max_entries:
+            self._drop(min(self._expires, key=self._expires.__getitem__))
+        token = secrets.token_urlsafe(16)
+        self._entries[token] = chunks
+        self._expires[token] = self._clock() + self.ttl
+        return make_cursor(token, 0)
+
+    def get(self, cursor: str) -> Tuple[Chunk, int, int, Optional[str]]:
+        """Return the chunk, its number, the chunk count and the next cursor.
+
+        Raises ``ContinuationError`` for unknown, expired or malformed cursors.
+        """
+        token, _, index = cursor[len(CONTINUATION_PREFIX) :].rpartition(".")
+        chunks = self._entries.get(token) if cursor.startswith(CONTINUATION_PREFIX) else None
+        if chunks is None or self._expires[token] <= self._clock():
+            self._drop(token)
+            raise ContinuationError("Unknown or expired continuation cursor; call the original tool again")
+        if not index.isdigit() or int(index) >= len(chunks):
+            raise ContinuationError(f"Invalid continuation cursor {cursor!r}")
+        number = int(index)
+        next_cursor = make_cursor(token, number + 1) if number + 1 < len(chunks) else None
+        return chunks[number], number, len(chunks), next_cursor
+
+    def _drop(self, token: str) -> None:
+        self._entries.pop(token, None)
+        self._expires.pop(token, None)
+
+    def _purge(self) -> None:
+        now = self._clock()
+        for token in [token for token, expires_at in self._expires.items() if expires_at <= now]:
+            self._drop(token)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def make_cursor(token: str, index: int) -> str:
+    return f"{CONTINUATION_PREFIX}{token}.{index}"
+
+
+continuations = ContinuationStore(ttl=CONTINUATION_TTL, max_entries=CONTINUATION_MAX)
+
+
+def budget_for(tool: str) -> int:
+    if tool in UNBUDGETED_TOOLS:
+        return 0
+    return int(RESPONSE_BUDGETS.get(tool, RESPONSE_MAX_BYTES))
+
+
+def enforce_budget(response: Any, max_bytes: int) -> Any:
+    """Truncate ``response`` to ``max_bytes`` and describe how to fetch the rest."""
+    try:
+        kept, chunks, size = truncate(response, max_bytes)
+    except (TypeError, ValueError):
+        return response
+    if not chunks:
+        return kept
+
+    omitted: Dict[str, int] = {}
+    for chunk in chunks:
+        omitted[chunk.path] = omitted.get(chunk.path, 0) + len(chunk.items)
+    return {
+        **kept,
+        "continuation": {
+            "bytes": size,
+            "budget": max_bytes,
+            "omitted": omitted,
+            "chunks": len(chunks),
+            "nextCursor": continuations.put(chunks),
+        },
+    }
+
+
+def limit_response(fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """Wrap an async tool so results over its byte budget are cut and continued."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await fn(*args, **kwargs)
+        max_bytes = budget_for(name)
+        if not max_bytes or is_error(result):
+            return result
+        return enforce_budget(result, max_bytes)
+
+    return wrapper
@@ -0,0 +1,212 @@
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+# Per-endpoint TTLs (seconds) for read-only self-service GETs, first match wins.
+# Paths include the query string; anything unmatched is never cached.
+CACHE_TTLS: List[Tuple[Pattern[str], float]] = [
+    (re.compile(r"^/self/(loanproducts|savingsproducts|products/share)\b"), 300.0),
+    (re.compile(r"^/self/(loans|savingsaccounts)/template\b"), 300.0),
+    (re.compile(r"^/self/beneficiaries/tpt/template\b"), 300.0),
+    (re.compile(r"^/self/accounttransfers/template\b"), 60.0),
+    (re.compile(r"^/self/clients/\d+/images\b"), 300.0),
+    (re.compile(r"^/self/clients/\d+/charges\b"), 60.0),
+    (re.compile(r"^/self/clients/\d+/(accounts|transactions)\b"), 30.0),
+    (re.compile(r"^/self/clients(/\d+)?(\?|$)"), 120.0),
+    (re.compile(r"^/self/(savingsaccounts|loans)/\d+"), 30.0),
+    (re.compile(r"^/self/beneficiaries/tpt(\?|$)"), 60.0),
+    (re.compile(r"^/self/device/registration/client/\d+"), 60.0),
+]
+
+CACHEABLE_METHODS = {"GET"}
+
+
+class InvalidationRule(NamedTuple):
+    """Cached read paths made stale by a mutating request.
+
+    ``prefixes`` may reference named groups of ``pattern`` (e.g. ``{loan_id}``).
+    ``tenant_wide`` rules evict the paths for every user of the tenant, for writes
+    that change data other users can see (such as the receiving side of a transfer).
+    """
+
+    methods: Tuple[str, ...]
+    pattern: Pattern[str]
+    prefixes: Tuple[str, ...]
+    tenant_wide: bool = False
+
+
+ACCOUNT_READS = ("/self/savingsaccounts", "/self/loans", "/self/clients", "/self/accounttransfers/template")
+
+# Write endpoints and the read-path prefixes they invalidate, first match wins.
+# A mutating request that matches no rule evicts everything cached for its user.
+INVALIDATION_RULES: List[InvalidationRule] = [
+    InvalidationRule(("POST",), re.compile(r"^/self/authentication\b"), ()),
+    InvalidationRule(("POST",), re.compile(r"^/self/loans\?command=calculateLoanSchedule\b"), ()),
+    InvalidationRule(("POST",), re.compile(r"^/self/accounttransfers\?type=tpt\b"), ACCOUNT_READS, tenant_wide=True),
+    InvalidationRule(("POST",), re.compile(r"^/self/accounttransfers(\?|$)"), ACCOUNT_READS),
+    InvalidationRule(
+        ("POST", "PUT", "DELETE"),
+        re.compile(r"^/self/beneficiaries/tpt\b"),
+        ("/self/beneficiaries/tpt", "/self/accounttransfers/template"),
+    ),
+    InvalidationRule(
+        ("POST", "PUT", "DELETE"),
+        re.compile(r"^/self/loans/(?P<loan_id>\d+)/guarantors\b"),
+        ("/self/loans/{loan_id}",),
+    ),
+    InvalidationRule(
+        ("POST", "PUT"),
+        re.compile(r"^/self/loans/(?P<loan_id>\d+)"),
+        ("/self/loans/{loan_id}", "/self/clients"),
+    ),
+    InvalidationRule(("POST",), re.compile(r"^/self/loans(\?|$)"), ("/self/clients",)),
+    InvalidationRule(
+        ("PUT",),
+        re.compile(r"^/self/savingsaccounts/(?P<savings_id>\d+)"),
+        ("/self/savingsaccounts/{savings_id}", "/self/clients"),
+    ),
+    InvalidationRule(("POST",), re.compile(r"^/self/savingsaccounts(\?|$)"), ("/self/clients",)),
+    InvalidationRule(("POST", "PUT"), re.compile(r"^/self/device/registration\b"), ("/self/device/registration",)),
+]
+
+
+def invalidation_targets(method: str, endpoint: str) -> Tuple[Tuple[str, ...], bool]:
+    """Read-path prefixes made stale by a write, and whether the eviction is tenant wide.
+
+    Returns ``(("",), False)`` (everything for the user) for unmatched writes.
+    """
+    method = method.upper()
+    for rule in INVALIDATION_RULES:
+        if method not in rule.methods:
+            continue
+        match = rule.pattern.search(endpoint)
+        if match:
+            groups = match.groupdict()
+            return tuple(prefix.format(**groups) for prefix in rule.prefixes), rule.tenant_wide
+    return ("",), False
+
+
+def _under(endpoint: str, prefix: str) -> bool:
+    """Whether ``endpoint`` is ``prefix`` itself or a path/query below it."""
+    if not endpoint.startswith(prefix):
+        return False
+    return len(endpoint) == len(prefix) or not prefix or endpoint[len(prefix)] in "/?"
+
+
+def cache_ttl(method: str, endpoint: str) -> float:
+    """TTL for a request, or 0 when the response must not be cached."""
+    if method.upper() not in CACHEABLE_METHODS:
+        return 0.0
+    for pattern, ttl in CACHE_TTLS:
+        if pattern.search(endpoint):
+            return ttl
+    return 0.0
+
+
+def cache_scope(tenant: str, auth: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Identify the (tenant, user) a response belongs to.
+
+    The Authorization header is hashed so credentials never live in cache keys.
+    Unauthenticated requests get no scope and are never cached.
+    """
+    if not auth:
+        return None
+    return tenant, hashlib.sha256(auth.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Bounded LRU cache of response bodies with per-entry expiry.
+
+    Keys are ``(tenant, user, method, endpoint)`` tuples as built by ``make_request``.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def generation(self, tenant: str) -> int:
+        """Counter bumped on every invalidation in ``tenant``.
+
+        Readers capture it before going upstream and pass it to ``set`` so a response
+        fetched while a write was in progress is never stored.
+        """
+        return self._generations.get(tenant, 0)
+
+    def set(self, key: Hashable, value: Any, ttl: float, generation: Optional[int] = None) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        if generation is not None and isinstance(key, tuple) and generation != self.generation(key[0]):
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, tenant: str, user: Optional[str], prefixes: Iterable[str]) -> int:
+        """Drop entries of ``tenant`` whose path falls under any prefix.
+
+        ``user=None`` applies to every user of the tenant. Returns the number removed.
+        """
+        prefixes = tuple(prefixes)
+        if not prefixes:
+            return 0
+
+        self._generations[tenant] = self.generation(tenant) + 1
+
+        stale = [
+            key
+            for key in self._entries
+            if key[0] == tenant
+            and (user is None or key[1] == user)
+            and any(_under(key[-1], prefix) for prefix in prefixes)
+        ]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
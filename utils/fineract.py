@@ -0,0 +1,82 @@
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+JAVA_DATE_TOKENS = [("yyyy", "%Y"), ("MMMM", "%B"), ("MMM", "%b"), ("MM", "%m"), ("dd", "%d")]
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Parse a Fineract date, which arrives as ``[yyyy, m, d]`` or an ISO string."""
+    if isinstance(value, (list, tuple)) and len(value) >= 3:
+        return date(int(value[0]), int(value[1]), int(value[2]))
+    if isinstance(value, str) and value:
+        return date.fromisoformat(value[:10])
+    return None
+
+
+def parse_java_date(value: str, java_format: str) -> date:
+    """Parse a date sent to Fineract with its ``dateFormat`` (a Java pattern such as ``dd MMMM yyyy``)."""
+    python_format = java_format
+    for token, directive in JAVA_DATE_TOKENS:
+        python_format = python_format.replace(token, directive)
+    return datetime.strptime(value, python_format).date()
+
+
+def to_iso_date(value: Any) -> Optional[str]:
+    parsed = parse_date(value)
+    return parsed.isoformat() if parsed else None
+
+
+def enum_value(value: Any) -> Any:
+    """Collapse Fineract enum objects (``{"id", "code", "value"}``) to their display value."""
+    if isinstance(value, dict):
+        return value.get("value", value.get("code"))
+    return value
+
+
+def page_items(response: Any) -> List[Dict[str, Any]]:
+    """Items of a list response, whether paged (``pageItems``) or a bare list."""
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        return response.get("pageItems") or []
+    return []
+
+
+def is_error(response: Any) -> bool:
+    return isinstance(response, dict) and response.get("error") is True
+
+
+# Money leaving the customer's hands; everything else is treated as a credit.
+DEBIT_FLAGS = ("withdrawal", "repayment", "feeDeduction", "payCharge", "withholdTax", "overdraftInterest")
+DEBIT_WORDS = ("withdraw", "repayment", "charge", "fee", "tax", "transfer out")
+
+
+# Loan entries that move no money (bookkeeping, forgiveness, write-offs); never inflow or outflow
+NON_CASH_FLAGS = ("accrual", "waiveInterest", "waiveCharges", "writeOff")
+NON_CASH_WORDS = ("accrual", "waive", "write off", "write-off", "writeoff", "written off")
+
+
+def is_cash_movement(txn: Dict[str, Any]) -> bool:
+    """Whether a Fineract transaction actually moved money (accruals, waivers and write-offs do not)."""
+    txn_type = txn.get("transactionType") or txn.get("type") or {}
+    if isinstance(txn_type, dict):
+        if any(txn_type.get(flag) for flag in NON_CASH_FLAGS):
+            return False
+        label = str(txn_type.get("value") or txn_type.get("code") or "").lower()
+    else:
+        label = str(txn_type).lower()
+    return not any(word in label for word in NON_CASH_WORDS)
+
+
+def transaction_direction(txn: Dict[str, Any], source: str) -> str:
+    """Classify a Fineract transaction as a ``debit`` or ``credit`` for the customer."""
+    txn_type = txn.get("transactionType") or txn.get("type") or {}
+    if isinstance(txn_type, dict):
+        if any(txn_type.get(flag) for flag in DEBIT_FLAGS):
+            return "debit"
+        label = str(txn_type.get("value") or txn_type.get("code") or "").lower()
+    else:
+        label = str(txn_type).lower()
+    if source == "client" or any(word in label for word in DEBIT_WORDS):
+        return "debit"
+    return "credit"
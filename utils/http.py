@@ -1,6 +1,501 @@
+import asyncio
+import contextvars
+import copy
+import logging
+import time
 import httpx
-from typing import Optional, Dict, Any
-from config.config import BASE_URL, API_BASE_PATH, DEFAULT_TENANT
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional, Dict, Any, AsyncIterator, Iterator, NamedTuple, Tuple
+from config.config import (
+    BASE_URL,
+    API_BASE_PATH,
+    DEFAULT_TENANT,
+    HTTP_TIMEOUT,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP2_ENABLED,
+    TENANT_MAX_CONCURRENCY,
+    TENANT_OVERRIDES,
+    RESILIENCE_ENABLED,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RECOVERY_TIME,
+    ADAPTIVE_LIMIT_INITIAL,
+    ADAPTIVE_LIMIT_MAX,
+    ADAPTIVE_LATENCY_THRESHOLD,
+    ADAPTIVE_QUEUE_TIMEOUT,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_BUDGET_RATIO,
+    RETRY_BUDGET_MIN_PER_SECOND,
+    HEDGE_ENABLED,
+    HEDGE_MIN_DELAY,
+    CACHE_ENABLED,
+    CACHE_MAX_ENTRIES,
+    COALESCE_REQUESTS,
+)
+from utils.cache import CACHEABLE_METHODS, ResponseCache, cache_scope, cache_ttl, invalidation_targets
+from utils.fineract import is_error
+from utils.jsoncodec import json_codec
+from utils.metrics import record_upstream, registry
+from utils.resilience import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    LatencyTracker,
+    RetryBudget,
+    RetryPolicy,
+    endpoint_group,
+    hedge,
+    is_failure,
+    is_retryable,
+)
+from utils.singleflight import SingleFlight
+from utils.tracing import PhaseRecorder, current_span, tracer
+
+logger = logging.getLogger(__name__)
+
+
+class TenantSettings(NamedTuple):
+    base_url: str
+    timeout: float
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    max_concurrency: int
+
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+_limiters: Dict[str, asyncio.Semaphore] = {}
+_lifespan_users = 0
+_stats = {
+    "clients_created": 0,
+    "requests": 0,
+    "in_flight": 0,
+    "errors": 0,
+    "rejected": 0,
+    "retries": 0,
+    "hedges": 0,
+    "hedge_wins": 0,
+}
+_tenant_stats: Dict[str, Dict[str, float]] = {}
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_adaptive_limiters: Dict[str, AdaptiveLimiter] = {}
+_retry_budgets: Dict[str, RetryBudget] = {}
+_latencies: Dict[Tuple[str, str], LatencyTracker] = {}
+
+retry_policy = RetryPolicy(max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY)
+
+response_cache = ResponseCache(max_entries=CACHE_MAX_ENTRIES)
+inflight = SingleFlight()
+
+# Methods whose identical concurrent requests can safely share one upstream call
+COALESCED_METHODS = {"GET", "HEAD"}
+
+
+def load_tenant_settings(overrides: Dict[str, Any]) -> Dict[str, TenantSettings]:
+    """Connection settings of each tenant in ``overrides`` (``MIFOS_TENANTS``), merged with the global defaults.
+
+    Raises ``ValueError`` for unknown setting names, values of the wrong type and
+    negative numbers, so a misconfigured tenant fails at startup rather than on
+    its first request.
+    """
+    defaults = TenantSettings(
+        base_url=BASE_URL,
+        timeout=HTTP_TIMEOUT,
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        max_concurrency=TENANT_MAX_CONCURRENCY,
+    )
+    if not isinstance(overrides, dict):
+        raise ValueError("MIFOS_TENANTS must be a JSON object of tenant names to settings")
+    settings = {DEFAULT_TENANT: defaults}
+    for tenant, values in overrides.items():
+        if not isinstance(values, dict):
+            raise ValueError(f"Settings for tenant {tenant!r} must be a JSON object")
+        unknown = set(values) - set(TenantSettings._fields)
+        if unknown:
+            raise ValueError(f"Unknown settings for tenant {tenant!r}: {', '.join(sorted(unknown))}")
+        checked = {}
+        for name, value in values.items():
+            kind = TenantSettings.__annotations__[name]
+            if isinstance(value, bool) or not isinstance(value, (int, float) if kind is float else kind):
+                raise ValueError(f"Setting {name} of tenant {tenant!r} must be a {kind.__name__}")
+            if kind is not str and value < 0:
+                raise ValueError(f"Setting {name} of tenant {tenant!r} must not be negative")
+            checked[name] = kind(value)
+        settings[tenant] = defaults._replace(**checked)
+    return settings
+
+
+_tenant_settings = load_tenant_settings(TENANT_OVERRIDES)
+
+
+def tenant_settings(tenant: str) -> TenantSettings:
+    """Connection settings for ``tenant``, validated at import (see ``load_tenant_settings``)."""
+    return _tenant_settings.get(tenant) or _tenant_settings[DEFAULT_TENANT]
+
+
+def is_known_tenant(tenant: str) -> bool:
+    """Whether ``tenant`` is the default tenant or one configured in ``MIFOS_TENANTS``."""
+    return tenant in _tenant_settings
+
+
+_current_tenant: contextvars.ContextVar[str] = contextvars.ContextVar("mifos_tenant", default=DEFAULT_TENANT)
+
+
+def current_tenant() -> str:
+    """The tenant requests go to when ``make_request`` is not given one (see ``tenant_scope``)."""
+    return _current_tenant.get()
+
+
+@contextmanager
+def tenant_scope(tenant: str) -> Iterator[None]:
+    """Send the requests made within the block, by this task and the tasks it starts, to ``tenant``."""
+    token = _current_tenant.set(tenant)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+def _tenant_counters(tenant: str) -> Dict[str, float]:
+    return _tenant_stats.setdefault(
+        tenant, {"requests": 0, "in_flight": 0, "waiting": 0, "errors": 0, "rejected": 0, "max_wait_ms": 0.0}
+    )
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client(settings: TenantSettings) -> httpx.AsyncClient:
+    """Create the pooled client used for every upstream call of one tenant."""
+    http2 = HTTP2_ENABLED and _http2_available()
+    if HTTP2_ENABLED and not http2:
+        logger.warning("MIFOS_HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    _stats["clients_created"] += 1
+    return httpx.AsyncClient(timeout=settings.timeout, limits=limits, http2=http2)
+
+
+def get_client(tenant: str = DEFAULT_TENANT) -> httpx.AsyncClient:
+    """Return the tenant's shared client, creating it on first use."""
+    client = _clients.get(tenant)
+    if client is None or client.is_closed:
+        client = _clients[tenant] = _build_client(tenant_settings(tenant))
+    return client
+
+
+def _get_limiter(tenant: str) -> asyncio.Semaphore:
+    limiter = _limiters.get(tenant)
+    if limiter is None:
+        limiter = _limiters[tenant] = asyncio.Semaphore(max(1, tenant_settings(tenant).max_concurrency))
+    return limiter
+
+
+def _get_breaker(host: str, group: str) -> CircuitBreaker:
+    breaker = _breakers.get((host, group))
+    if breaker is None:
+        breaker = _breakers[(host, group)] = CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD, recovery_time=CIRCUIT_RECOVERY_TIME
+        )
+    return breaker
+
+
+def _get_adaptive_limiter(host: str) -> AdaptiveLimiter:
+    limiter = _adaptive_limiters.get(host)
+    if limiter is None:
+        limiter = _adaptive_limiters[host] = AdaptiveLimiter(
+            initial_limit=ADAPTIVE_LIMIT_INITIAL,
+            max_limit=ADAPTIVE_LIMIT_MAX,
+            latency_threshold=ADAPTIVE_LATENCY_THRESHOLD,
+            queue_timeout=ADAPTIVE_QUEUE_TIMEOUT,
+        )
+    return limiter
+
+
+async def close_client(tenant: Optional[str] = None) -> None:
+    """Close the shared client of ``tenant`` (every tenant by default) and release its connections.
+
+    Closing every tenant also resets circuit breakers, adaptive limits, retry budgets
+    and latency history.
+    """
+    tenants = list(_clients) if tenant is None else [tenant]
+    for name in tenants:
+        client = _clients.pop(name, None)
+        if client is not None:
+            await client.aclose()
+        _limiters.pop(name, None)
+    if tenant is None:
+        _breakers.clear()
+        _adaptive_limiters.clear()
+        _retry_budgets.clear()
+        _latencies.clear()
+
+
+@asynccontextmanager
+async def http_lifespan(server: Any = None) -> AsyncIterator[None]:
+    """Server lifespan: open the pool at startup and close it when the last user exits.
+
+    The MCP server enters its lifespan once per session on HTTP transports, so the
+    pools are reference counted instead of being torn down by the first session to end.
+    """
+    global _lifespan_users
+    _lifespan_users += 1
+    get_client()
+    try:
+        yield
+    finally:
+        _lifespan_users -= 1
+        if _lifespan_users == 0:
+            await close_client()
+            await tracer.flush()
+
+
+def _pool_state(client: Optional[httpx.AsyncClient]) -> Dict[str, Any]:
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    return {
+        "open_connections": len(connections),
+        "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+        "http2": bool(getattr(pool, "_http2", False)),
+    }
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Snapshot of request counters and the state of the connection pools.
+
+    Top-level figures cover the default tenant's pool and all requests; ``tenants``
+    breaks them down per tenant, including time spent waiting for a concurrency slot.
+    """
+    stats: Dict[str, Any] = dict(_stats)
+    stats["limits"] = {
+        "max_connections": HTTP_MAX_CONNECTIONS,
+        "max_keepalive_connections": HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+    }
+    stats.update(_pool_state(_clients.get(DEFAULT_TENANT)))
+
+    stats["tenants"] = {}
+    for tenant in sorted(set(_clients) | set(_tenant_stats)):
+        settings = tenant_settings(tenant)
+        stats["tenants"][tenant] = {
+            **_tenant_counters(tenant),
+            **_pool_state(_clients.get(tenant)),
+            "base_url": settings.base_url,
+            "max_connections": settings.max_connections,
+            "max_concurrency": settings.max_concurrency,
+        }
+
+    stats["circuits"] = {f"{host}{group}": breaker.stats() for (host, group), breaker in sorted(_breakers.items())}
+    stats["adaptive_limits"] = {host: limiter.stats() for host, limiter in sorted(_adaptive_limiters.items())}
+    stats["retry_budgets"] = {host: budget.stats() for host, budget in sorted(_retry_budgets.items())}
+    return stats
+
+
+def _rejected(tenant: str, message: str, retry_after: float) -> Tuple[Dict[str, Any], None]:
+    _stats["rejected"] += 1
+    _tenant_counters(tenant)["rejected"] += 1
+    return {"error": True, "status_code": 503, "message": message, "retry_after": round(retry_after, 1)}, None
+
+
+async def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[Dict],
+    tenant: str = DEFAULT_TENANT,
+) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    """Perform the upstream call on the tenant's pool, within its concurrency limit.
+
+    Unless disabled, calls to an endpoint group whose circuit is open fail fast, and
+    calls to a backend above its adaptive concurrency limit queue briefly and are
+    rejected when no slot frees up; both come back as 503 errors with ``retry_after``.
+
+    Returns the decoded result together with the raw JSON body when the response
+    is a successful JSON document (the form kept by the response cache).
+    """
+    breaker = adaptive = None
+    if RESILIENCE_ENABLED:
+        target = httpx.URL(url)
+        group = endpoint_group(target.path.split(API_BASE_PATH, 1)[-1])
+        breaker, adaptive = _get_breaker(target.host, group), _get_adaptive_limiter(target.host)
+        if not breaker.allow():
+            return _rejected(
+                tenant,
+                f"Circuit open for {group} on {target.host}: the server is failing, try again later",
+                breaker.retry_after(),
+            )
+
+    counters = _tenant_counters(tenant)
+    limiter = _get_limiter(tenant)
+    # Outcome for the breaker; None (rejected, cancelled or raised) frees a half-open probe slot
+    failed: Optional[bool] = None
+    try:
+        counters["waiting"] += 1
+        queued_at = time.perf_counter()
+        try:
+            await limiter.acquire()
+        finally:
+            counters["waiting"] -= 1
+
+        try:
+            if adaptive and not await adaptive.acquire():
+                return _rejected(tenant, f"Server overloaded: {method} {url} was not sent", adaptive.queue_timeout)
+
+            wait_ms = round((time.perf_counter() - queued_at) * 1000, 3)
+            counters["max_wait_ms"] = max(counters["max_wait_ms"], wait_ms)
+            current_span().set("queue_ms", wait_ms)
+            _stats["requests"] += 1
+            counters["requests"] += 1
+            _stats["in_flight"] += 1
+            counters["in_flight"] += 1
+            started_at = time.monotonic()
+            try:
+                result, body = await _request(method, url, headers, data, tenant)
+                failed = is_failure(result)
+            finally:
+                _stats["in_flight"] -= 1
+                counters["in_flight"] -= 1
+                if adaptive:
+                    adaptive.release(started_at, bool(failed))
+        finally:
+            limiter.release()
+    finally:
+        if breaker and failed is None:
+            breaker.abandon()
+        elif breaker and failed:
+            breaker.record_failure()
+        elif breaker:
+            breaker.record_success()
+
+    if is_error(result):
+        _stats["errors"] += 1
+        counters["errors"] += 1
+    return result, body
+
+
+async def _request(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[Dict],
+    tenant: str,
+) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    started_at = time.perf_counter()
+    status, size = "exception", 0
+    span = current_span()
+    extensions = {"trace": PhaseRecorder(span)} if span.recording else None
+    try:
+        content = json_codec.dumps(data) if data is not None else None
+        response = await get_client(tenant).request(
+            method=method, url=url, headers=headers, content=content, extensions=extensions
+        )
+        status, size = str(response.status_code), len(response.content)
+        span.set("status_code", response.status_code)
+        span.set("bytes", size)
+
+        if response.status_code >= 400:
+            return {
+                "error": True,
+                "status_code": response.status_code,
+                "message": response.text,
+            }, None
+
+        decode_started_at = time.perf_counter()
+        try:
+            return json_codec.loads(response.content), response.content
+        except json_codec.decode_errors:
+            return {"message": "Success", "status_code": response.status_code}, None
+        finally:
+            span.set("decode_ms", round((time.perf_counter() - decode_started_at) * 1000, 3))
+
+    except httpx.TimeoutException:
+        status = "timeout"
+        return {"error": True, "status_code": 408, "message": f"Request timed out for {method} {url}"}, None
+    except httpx.ConnectError:
+        status = "connect_error"
+        return {"error": True, "status_code": 503, "message": f"Cannot connect to server: {url}"}, None
+    except Exception as e:
+        return {"error": True, "status_code": 500, "message": str(e)}, None
+    finally:
+        group = endpoint_group(httpx.URL(url).path.split(API_BASE_PATH, 1)[-1])
+        record_upstream(method, group, status, time.perf_counter() - started_at, size)
+
+
+def _get_retry_budget(host: str) -> RetryBudget:
+    budget = _retry_budgets.get(host)
+    if budget is None:
+        budget = _retry_budgets[host] = RetryBudget(
+            ratio=RETRY_BUDGET_RATIO, min_per_second=RETRY_BUDGET_MIN_PER_SECOND
+        )
+    return budget
+
+
+def _spend_budget(budget: RetryBudget, counter: str) -> bool:
+    if not budget.try_spend():
+        return False
+    _stats[counter] += 1
+    return True
+
+
+async def _send_with_retries(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[Dict],
+    tenant: str = DEFAULT_TENANT,
+) -> Tuple[Dict[str, Any], Optional[bytes]]:
+    """``_send`` with retries and, when enabled, hedging for idempotent reads.
+
+    Timeouts, connection errors, 429 and 502-504 responses to GET/HEAD/OPTIONS are
+    retried with jittered exponential backoff. With ``MIFOS_HEDGE_ENABLED`` a GET
+    still running after its endpoint group's p95 latency gets a second copy, and the
+    first good answer wins. Each retry or hedge spends from the host's retry budget.
+    """
+    target = httpx.URL(url)
+    group = endpoint_group(target.path.split(API_BASE_PATH, 1)[-1])
+    budget = _get_retry_budget(target.host)
+    latencies = _latencies.setdefault((target.host, group), LatencyTracker())
+    budget.record_request()
+
+    async def attempt() -> Tuple[Dict[str, Any], Optional[bytes]]:
+        with tracer.span("fineract.http", kind="client", method=method, group=group, tenant=tenant) as span:
+            started_at = time.monotonic()
+            outcome = await _send(method, url, headers, data, tenant)
+            if not is_error(outcome[0]):
+                latencies.record(time.monotonic() - started_at)
+            else:
+                span.set_error(outcome[0].get("message") if "retry_after" in outcome[0] else "upstream error")
+            return outcome
+
+    for number in range(1, max(1, retry_policy.max_attempts) + 1):
+        p95 = latencies.quantile() if HEDGE_ENABLED and method == "GET" else None
+        if p95 is None:
+            result, body = await attempt()
+        else:
+            (result, body), hedge_won = await hedge(
+                attempt, max(HEDGE_MIN_DELAY, p95), lambda: _spend_budget(budget, "hedges")
+            )
+            _stats["hedge_wins"] += hedge_won
+
+        if number >= retry_policy.max_attempts or not is_retryable(method, result):
+            break
+        if not _spend_budget(budget, "retries"):
+            break
+        await asyncio.sleep(retry_policy.backoff(number))
+    return result, body
 
 
 async def make_request(
@@ -8,10 +503,20 @@ async def make_request(
     endpoint: str,
     auth: Optional[str] = None,
     data: Optional[Dict] = None,
-    tenant: str = DEFAULT_TENANT,
+    tenant: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Make HTTP request to the API."""
-    url = f"{BASE_URL}{API_BASE_PATH}{endpoint}"
+    """Make HTTP request to the API.
+
+    Read-only GETs listed in ``utils.cache.CACHE_TTLS`` are served from a per-user
+    response cache; the cache keeps raw JSON bodies, so every hit decodes a fresh
+    object and callers can never mutate each other's results. Writes evict the read
+    paths declared in ``utils.cache.INVALIDATION_RULES``. Identical GETs issued
+    concurrently by the same user share a single upstream call. Each tenant has its
+    own pool, base URL and concurrency limit (see ``tenant_settings``); ``tenant``
+    defaults to the one of the calling tool's session (see ``tenant_scope``).
+    """
+    tenant = tenant or current_tenant()
+    url = f"{tenant_settings(tenant).base_url}{API_BASE_PATH}{endpoint}"
     headers = {
         "Fineract-Platform-TenantId": tenant,
         "Content-Type": "application/json",
@@ -20,25 +525,71 @@ async def make_request(
     if auth:
         headers["Authorization"] = auth
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.request(method=method, url=url, headers=headers, json=data)
+    method = method.upper()
+    with tracer.span("make_request", method=method, endpoint=endpoint, tenant=tenant) as span:
+        scope = cache_scope(tenant, auth)
+        ttl = cache_ttl(method, endpoint) if scope and CACHE_ENABLED else 0.0
+        key = (*scope, method, endpoint) if scope and ttl else None
+        generation = response_cache.generation(tenant)
 
-            if response.status_code >= 400:
-                return {
-                    "error": True,
-                    "status_code": response.status_code,
-                    "message": response.text,
-                }
+        if key:
+            body = response_cache.get(key)
+            span.set("cache", "miss" if body is None else "hit")
+            if body is not None:
+                return json_codec.loads(body)
 
-            try:
-                return response.json()
-            except ValueError:
-                return {"message": "Success", "status_code": response.status_code}
+        if COALESCE_REQUESTS and method in COALESCED_METHODS:
+            flight_key = (tenant, scope[1] if scope else None, method, endpoint)
+            (result, body), shared = await inflight.do(
+                flight_key, lambda: _send_with_retries(method, url, headers, data, tenant)
+            )
+            span.set("coalesced", shared)
+            if shared:
+                result = json_codec.loads(body) if body is not None else copy.deepcopy(result)
+        else:
+            result, body = await _send_with_retries(method, url, headers, data, tenant)
 
-    except httpx.TimeoutException:
-        return {"error": True, "status_code": 408, "message": f"Request timed out for {method} {url}"}
-    except httpx.ConnectError:
-        return {"error": True, "status_code": 503, "message": f"Cannot connect to server: {url}"}
-    except Exception as e:
-        return {"error": True, "status_code": 500, "message": str(e)}
+        if is_error(result):
+            span.set_error(f"status {result.get('status_code')}")
+        if key and body is not None:
+            response_cache.set(key, body, ttl, generation=generation)
+        elif scope and method not in CACHEABLE_METHODS:
+            # Evict on every outcome: a timed-out write may still have been applied upstream.
+            prefixes, tenant_wide = invalidation_targets(method, endpoint)
+            response_cache.invalidate(tenant, None if tenant_wide else scope[1], prefixes)
+        return result
+
+
+def _collect_metrics() -> Iterator[Tuple[str, str, str, Tuple[Tuple[str, str], ...], float]]:
+    """Expose cache, coalescing, pool and resilience state to ``utils.metrics``."""
+    stats = get_pool_stats()
+    cache = response_cache.stats()
+    for name in ("hits", "misses", "evictions", "expirations", "invalidations"):
+        yield f"mifos_cache_{name}_total", "counter", f"Response cache {name}", (), cache[name]
+    yield "mifos_cache_entries", "gauge", "Responses held in the cache", (), cache["entries"]
+    yield "mifos_cache_hit_ratio", "gauge", "Cache hits over lookups since start", (), cache["hit_rate"]
+    yield "mifos_coalesced_requests_total", "counter", "GETs served by another caller's upstream call", (), (
+        inflight.stats()["coalesced"]
+    )
+    yield "mifos_upstream_in_flight", "gauge", "Upstream requests in progress", (), stats["in_flight"]
+    for name in ("rejected", "retries", "hedges", "hedge_wins"):
+        yield f"mifos_upstream_{name}_total", "counter", f"Upstream {name.replace('_', ' ')}", (), stats[name]
+    for tenant, tenant_stats in stats["tenants"].items():
+        labels = (("tenant", tenant),)
+        yield "mifos_tenant_waiting", "gauge", "Calls queued for a tenant concurrency slot", labels, (
+            tenant_stats["waiting"]
+        )
+        yield "mifos_tenant_open_connections", "gauge", "Open pooled connections", labels, (
+            tenant_stats["open_connections"]
+        )
+    for circuit, circuit_stats in stats["circuits"].items():
+        yield "mifos_circuit_open", "gauge", "1 while a circuit rejects calls", (("circuit", circuit),), float(
+            circuit_stats["state"] != "closed"
+        )
+    for host, limiter_stats in stats["adaptive_limits"].items():
+        yield "mifos_adaptive_limit", "gauge", "Current AIMD concurrency limit", (("host", host),), (
+            limiter_stats["limit"]
+        )
+
+
+registry.register_collector(_collect_metrics)
@@ -0,0 +1,69 @@
+import json
+import logging
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+from config.config import JSON_BACKEND
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec(NamedTuple):
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+    decode_errors: Tuple[type, ...]
+
+
+def _stdlib() -> JsonCodec:
+    def dumps(obj: Any) -> bytes:
+        # Same output as httpx's ``json=`` encoding
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    return JsonCodec("json", json.loads, dumps, (ValueError,))
+
+
+def _orjson() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", orjson.loads, dumps, (ValueError,))
+
+
+def _msgspec() -> JsonCodec:
+    import msgspec
+
+    encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+    return JsonCodec("msgspec", decoder.decode, encoder.encode, (ValueError, msgspec.DecodeError))
+
+
+BACKENDS: Dict[str, Callable[[], JsonCodec]] = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+
+def select_codec(name: str = "auto") -> JsonCodec:
+    """Load the named backend; ``auto`` picks the fastest one installed.
+
+    orjson and msgspec are optional. Asking for one that is not installed (or for an
+    unknown name) logs a warning and falls back to the standard library.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return BACKENDS[candidate]()
+            except ImportError:
+                continue
+        return _stdlib()
+
+    if name not in BACKENDS:
+        logger.warning("Unknown MIFOS_JSON_BACKEND %r; using the standard json module", name)
+        return _stdlib()
+    try:
+        return BACKENDS[name]()
+    except ImportError:
+        logger.warning(
+            "MIFOS_JSON_BACKEND is %r but the package is not installed; using the standard json module", name
+        )
+        return _stdlib()
+
+
+json_codec = select_codec(JSON_BACKEND)
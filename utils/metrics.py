@@ -0,0 +1,164 @@
+import bisect
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from utils.fineract import is_error
+
+# Latency buckets in seconds, shared by every histogram
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: Any) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+class Histogram:
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Minimal in-process metrics rendered in the Prometheus text format.
+
+    Counters and histograms are updated by the code paths they measure; values that
+    already live elsewhere (cache, pool and breaker stats) are read at render time
+    through ``register_collector`` callbacks, so there is no double bookkeeping.
+    """
+
+    def __init__(self) -> None:
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, Labels, float]]]] = []
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1.0) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0.0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram()
+        histogram.observe(value)
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, Labels, float]]]) -> None:
+        """Add a callback yielding ``(name, kind, help, labels, value)`` samples at render time."""
+        self._collectors.append(collector)
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._histograms.clear()
+
+    def counter(self, name: str, **labels: Any) -> float:
+        return self._counters.get(name, {}).get(_labels(**labels), 0.0)
+
+    def histogram(self, name: str, **labels: Any) -> Histogram:
+        return self._histograms.get(name, {}).get(_labels(**labels)) or Histogram()
+
+    def render(self) -> str:
+        """Prometheus text exposition (format 0.0.4)."""
+        lines: List[str] = []
+        collected: Dict[str, List[Tuple[Labels, float]]] = {}
+        for collector in self._collectors:
+            for name, kind, help_text, labels, value in collector():
+                self._help.setdefault(name, (kind, help_text))
+                collected.setdefault(name, []).append((labels, value))
+
+        def header(name: str, default_kind: str) -> None:
+            kind, help_text = self._help.get(name, (default_kind, ""))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name in sorted(self._counters):
+            header(name, "counter")
+            for labels, value in sorted(self._counters[name].items()):
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name in sorted(self._histograms):
+            header(name, "histogram")
+            for labels, histogram in sorted(self._histograms[name].items(), key=lambda item: item[0]):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        for name in sorted(collected):
+            header(name, "gauge")
+            for labels, value in sorted(collected[name]):
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+registry.describe("mifos_tool_calls_total", "counter", "MCP tool invocations")
+registry.describe("mifos_tool_errors_total", "counter", "MCP tool calls that returned an error or raised")
+registry.describe("mifos_tool_duration_seconds", "histogram", "MCP tool latency")
+registry.describe("mifos_upstream_requests_total", "counter", "Requests sent to Fineract by status code")
+registry.describe("mifos_upstream_duration_seconds", "histogram", "Fineract request latency")
+registry.describe("mifos_upstream_response_bytes_total", "counter", "Response bytes received from Fineract")
+
+
+def _status(result: Any) -> str:
+    return str(result.get("status_code", "error")) if is_error(result) else "ok"
+
+
+def instrument_tool(fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """Wrap an async tool so each call records its count, latency and error status.
+
+    ``functools.wraps`` keeps the signature and annotations FastMCP derives the tool
+    schema (and Context injection) from.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        labels = _labels(tool=name)
+        started_at = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception:
+            registry.inc("mifos_tool_errors_total", _labels(tool=name, status="exception"))
+            raise
+        else:
+            if is_error(result):
+                registry.inc("mifos_tool_errors_total", _labels(tool=name, status=_status(result)))
+            return result
+        finally:
+            registry.inc("mifos_tool_calls_total", labels)
+            registry.observe("mifos_tool_duration_seconds", labels, time.perf_counter() - started_at)
+
+    return wrapper
+
+
+def record_upstream(method: str, group: str, status: str, seconds: float, size: int) -> None:
+    registry.inc("mifos_upstream_requests_total", _labels(method=method, group=group, status=status))
+    registry.observe("mifos_upstream_duration_seconds", _labels(method=method, group=group), seconds)
+    if size:
+        registry.inc("mifos_upstream_response_bytes_total", _labels(group=group), size)
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional
+from utils.fineract import is_error, page_items
+
+
+class PageFetchError(Exception):
+    """Raised by ``paginate`` when the upstream returns an error for a page."""
+
+    def __init__(self, response: Dict[str, Any], offset: int):
+        super().__init__(f"Page at offset {offset} failed: {response.get('message')}")
+        self.response = response
+        self.offset = offset
+
+
+async def paginate(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    page_size: int = 50,
+    stats: Optional[Dict[str, int]] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Yield items of an offset/limit endpoint one by one.
+
+    ``fetch_page(offset, limit)`` returns a Fineract page (``pageItems`` plus
+    ``totalFilteredRecords``) or a bare list. The next page is requested as soon as
+    the current one arrives, so the upstream round trip overlaps with the caller
+    processing items; at most two pages are held in memory. Closing the generator
+    early cancels the prefetch. ``stats``, when given, receives a ``pages`` count.
+    """
+    offset = 0
+    pending: Optional["asyncio.Future[Any]"] = asyncio.ensure_future(fetch_page(offset, page_size))
+    try:
+        while pending is not None:
+            response = await pending
+            pending = None
+            if stats is not None:
+                stats["pages"] = stats.get("pages", 0) + 1
+            if is_error(response):
+                raise PageFetchError(response, offset)
+
+            items = page_items(response)
+            offset += len(items)
+            total = response.get("totalFilteredRecords") if isinstance(response, dict) else None
+            if len(items) == page_size and (total is None or offset < total):
+                pending = asyncio.ensure_future(fetch_page(offset, page_size))
+
+            for item in items:
+                yield item
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
@@ -0,0 +1,171 @@
+import re
+from typing import Any, Coroutine, Dict, List, Optional
+from config.config import RESPONSE_PROFILE
+from utils.fineract import is_error, to_iso_date
+from utils.jsoncodec import json_codec
+
+PROFILES = ("minimal", "standard", "full")
+
+# Field names are sent in the query string, so anything else is dropped
+FIELD_NAME = re.compile(r"[A-Za-z0-9_]+")
+
+# Keys a "minimal" response keeps, at any depth; template choice lists (``*Options``) are kept too
+MINIMAL_KEYS = frozenset(
+    {
+        "id",
+        "accountNo",
+        "accountNumber",
+        "displayName",
+        "name",
+        "value",
+        "clientId",
+        "clientName",
+        "officeName",
+        "productName",
+        "status",
+        "active",
+        "type",
+        "transactionType",
+        "reversed",
+        "accountType",
+        "date",
+        "dueDate",
+        "amount",
+        "amountOutstanding",
+        "currency",
+        "principal",
+        "runningBalance",
+        "accountBalance",
+        "availableBalance",
+        "loanBalance",
+        "totalDeposits",
+        "totalWithdrawals",
+        "principalOutstanding",
+        "totalOutstanding",
+        "totalOverdue",
+        "inArrears",
+        "transferLimit",
+        "summary",
+        "savingsAccounts",
+        "loanAccounts",
+        "shareAccounts",
+        "transactions",
+        "periods",
+        "period",
+        "principalDue",
+        "totalDueForPeriod",
+        "pageItems",
+        "totalFilteredRecords",
+    }
+)
+
+
+def _is_enum(value: Dict[str, Any]) -> bool:
+    """Fineract enum objects: ``{"id", "code", "value"}`` plus optional boolean flags."""
+    return (
+        isinstance(value.get("code"), str)
+        and isinstance(value.get("value"), str)
+        and all(not isinstance(item, (dict, list)) for item in value.values())
+    )
+
+
+def _is_currency(value: Dict[str, Any]) -> bool:
+    return "code" in value and "decimalPlaces" in value
+
+
+def _is_date_key(key: str) -> bool:
+    return key == "date" or key.endswith("Date")
+
+
+def _slim(value: Any, minimal: bool) -> Any:
+    """Collapse enums, currencies and date arrays and drop empty values, recursively."""
+    if isinstance(value, list):
+        return [_slim(item, minimal) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if _is_currency(value):
+        return value["code"]
+    if _is_enum(value):
+        return value["value"]
+
+    slimmed = {}
+    for key, item in value.items():
+        if minimal and key not in MINIMAL_KEYS and not key.endswith("Options"):
+            continue
+        if _is_date_key(key) and isinstance(item, list):
+            item = to_iso_date(item) or item
+        else:
+            item = _slim(item, minimal)
+        if item is None or item == "" or item == [] or item == {}:
+            continue
+        slimmed[key] = item
+    return slimmed
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """The comma-separated names of ``fields``; names that are not ``FIELD_NAME`` are ignored."""
+    return [name for name in (part.strip() for part in (fields or "").split(",")) if FIELD_NAME.fullmatch(name)]
+
+
+def with_fields(path: str, fields: Optional[str]) -> str:
+    """Add Fineract's ``fields=`` parameter so the server can leave other fields out."""
+    names = parse_fields(fields)
+    if not names:
+        return path
+    return f"{path}{'&' if '?' in path else '?'}fields={','.join(names)}"
+
+
+def _select(value: Any, names: List[str]) -> Any:
+    if isinstance(value, list):
+        return [_select(item, names) for item in value]
+    if isinstance(value, dict):
+        return {key: value[key] for key in names if key in value}
+    return value
+
+
+def project(response: Any, profile: str = "full", fields: Optional[str] = None) -> Any:
+    """Apply a ``fields`` selection and a slimming profile to a Fineract response.
+
+    ``fields`` keeps the listed top-level keys (of each item for lists and paged
+    responses), for endpoints that ignore the ``fields=`` query parameter. "standard"
+    collapses enum and currency objects to their value or code, dates to ISO strings
+    and drops empty values; "minimal" also keeps only ``MINIMAL_KEYS``. Projected
+    responses carry a ``projection`` entry with their JSON size before and after;
+    list responses are returned as ``pageItems`` so the entry has somewhere to live.
+    Errors and "full" responses without ``fields`` are returned untouched.
+    """
+    names = parse_fields(fields)
+    if is_error(response) or (profile == "full" and not names):
+        return response
+
+    before = len(json_codec.dumps(response))
+    projected = response
+    if names:
+        if isinstance(projected, dict) and isinstance(projected.get("pageItems"), list):
+            projected = {**projected, "pageItems": _select(projected["pageItems"], names)}
+        else:
+            projected = _select(projected, names)
+    if profile != "full":
+        projected = _slim(projected, minimal=profile == "minimal")
+    if not isinstance(projected, dict):
+        projected = {"pageItems": projected}
+
+    after = len(json_codec.dumps(projected))
+    projected["projection"] = {"profile": profile, "fields": names or None, "bytesBefore": before, "bytesAfter": after}
+    return projected
+
+
+async def projected(request: Coroutine[Any, Any, Any], profile: Optional[str], fields: Optional[str]) -> Any:
+    """Await a read tool's ``make_request`` call and project its result.
+
+    An unknown profile is rejected before the request is sent.
+    """
+    profile = (profile or RESPONSE_PROFILE).lower()
+    if profile not in PROFILES:
+        request.close()
+        return {
+            "error": True,
+            "status_code": 400,
+            "message": f"Unknown profile {profile!r}; expected one of {', '.join(PROFILES)}",
+        }
+    return project(await request, profile, fields)
@@ -0,0 +1,321 @@
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional, Tuple
+from utils.fineract import is_error
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+# Outcomes that mean the backend is struggling, as opposed to rejecting the request
+FAILURE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+# Methods that are safe to send twice. PUT and DELETE are left out: Fineract answers a
+# repeated DELETE with 404, and a timed-out write may already have been applied.
+RETRYABLE_METHODS = {"GET", "HEAD", "OPTIONS"}
+RETRYABLE_STATUS_CODES = {408, 429, 502, 503, 504}
+
+
+def is_failure(result: Any) -> bool:
+    return is_error(result) and result.get("status_code") in FAILURE_STATUS_CODES
+
+
+def is_retryable(method: str, result: Any) -> bool:
+    """Whether a failed call may be sent again.
+
+    Errors carrying ``retry_after`` were produced locally by an open circuit or a
+    saturated limiter and are never retried.
+    """
+    return (
+        method in RETRYABLE_METHODS
+        and is_error(result)
+        and result.get("status_code") in RETRYABLE_STATUS_CODES
+        and "retry_after" not in result
+    )
+
+
+def endpoint_group(path: str) -> str:
+    """Group endpoints by their first two path segments (``/self/loans/5?x`` -> ``/self/loans``)."""
+    segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+    return "/" + "/".join(segments[:2])
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker counting consecutive failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls are
+    rejected without reaching the backend. Once ``recovery_time`` has passed up to
+    ``half_open_max_calls`` probes are let through; a successful probe closes the
+    circuit and a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self._clock() >= self._opened_at + self.recovery_time:
+            self._state, self._probes = HALF_OPEN, 0
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now; counts a probe slot when half-open."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_time - self._clock())
+
+    def record_success(self) -> None:
+        self._state, self._failures, self._probes = CLOSED, 0, 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._open()
+
+    def abandon(self) -> None:
+        """Forget a call that ended without an outcome (e.g. cancelled), freeing its probe slot."""
+        if self._state == HALF_OPEN and self._probes:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        if self._state != OPEN:
+            self.opened += 1
+        self._state, self._opened_at, self._probes = OPEN, self._clock(), 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 3),
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one backend.
+
+    Every call that finishes quickly and successfully raises the limit by
+    ``1 / limit`` (about one per round of calls); a failure or a call slower than
+    ``latency_threshold`` multiplies it by ``backoff``. Only calls started after the
+    last decrease can decrease it again, so one burst of timeouts counts once.
+    Calls over the limit wait up to ``queue_timeout`` seconds for a slot and are
+    rejected after that.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.5,
+        latency_threshold: float = 5.0,
+        queue_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self.backoff = backoff
+        self.latency_threshold = latency_threshold
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self.in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease = float("-inf")
+        self.rejected = 0
+        self.decreases = 0
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting up to ``queue_timeout``; False when the call is rejected."""
+        if not self._waiters and self.in_flight < self.current_limit:
+            self.in_flight += 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            raise
+        return True
+
+    def release(self, started_at: float, failed: bool) -> None:
+        """Free a slot and adapt the limit to how the call went."""
+        latency = self._clock() - started_at
+        if failed or latency > self.latency_threshold:
+            if started_at >= self._last_decrease:
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = self._clock()
+                self.decreases += 1
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "queued": sum(1 for waiter in self._waiters if not waiter.done()),
+            "rejected": self.rejected,
+            "decreases": self.decreases,
+        }
+
+
+class RetryPolicy(NamedTuple):
+    """Exponential backoff with full jitter: attempt ``n`` sleeps up to ``base_delay * 2**(n-1)``."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+
+    def backoff(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        return rand() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+
+class RetryBudget:
+    """Token bucket capping retries and hedges to a share of the traffic.
+
+    Every original request deposits ``ratio`` tokens and ``min_per_second`` tokens
+    accrue over time; each retry or hedge spends one. During an outage the bucket
+    drains and extra attempts stop, so they cannot multiply the load.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self.tokens = max_tokens
+        self._refilled_at = clock()
+        self.spent = 0
+        self.exhausted = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._refilled_at) * self.min_per_second)
+        self._refilled_at = now
+
+    def record_request(self) -> None:
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        self._refill()
+        if self.tokens < 1:
+            self.exhausted += 1
+            return False
+        self.tokens -= 1
+        self.spent += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {"tokens": round(self.tokens, 2), "spent": self.spent, "exhausted": self.exhausted}
+
+
+class LatencyTracker:
+    """Recent successful latencies of an endpoint group, used to time hedged requests."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, percentile: float = 0.95):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.percentile = percentile
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self) -> Optional[float]:
+        """The tracked percentile, or None until ``min_samples`` calls have been seen."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+
+
+async def hedge(
+    call: Callable[[], "asyncio.Future[Tuple[Any, Any]]"],
+    delay: float,
+    may_hedge: Callable[[], bool],
+) -> Tuple[Tuple[Any, Any], bool]:
+    """Run ``call`` and, if it has not finished after ``delay``, race a second copy.
+
+    ``call`` returns ``(result, body)`` pairs. The first pair that is not a failure
+    wins and the other copy is cancelled; if both fail the last failure is returned.
+    ``may_hedge`` is consulted before the copy is sent (e.g. to spend retry budget).
+    Returns the outcome and whether it came from the hedged copy.
+    """
+    first = asyncio.ensure_future(call())
+    tasks = [first]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not may_hedge():
+            return await first, False
+
+        second = asyncio.ensure_future(call())
+        tasks.append(second)
+        pending = set(tasks)
+        outcome: Tuple[Any, Any] = ({}, None)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                outcome = task.result()
+                if not is_failure(outcome[0]):
+                    return outcome, task is second
+        return outcome, False
+    finally:
+        losers = [task for task in tasks if not task.done()]
+        for task in losers:
+            task.cancel()
+        if losers:
+            await asyncio.gather(*losers, return_exceptions=True)
@@ -0,0 +1,106 @@
+import secrets
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from config.config import DEFAULT_TENANT
+
+# Prefix of the handles returned by ``login``, so they are never mistaken for usernames
+SESSION_PREFIX = "mifos-session-"
+
+
+class SessionError(LookupError):
+    """The session handle is unknown or has expired."""
+
+
+class Session(NamedTuple):
+    session_id: str
+    username: str
+    auth_key: str
+    client_ids: List[int]
+    user_id: Optional[int]
+    permissions: List[str]
+    roles: List[str]
+    created_at: float
+    tenant: str = DEFAULT_TENANT
+
+
+def is_session_handle(value: str) -> bool:
+    return isinstance(value, str) and value.startswith(SESSION_PREFIX)
+
+
+class SessionManager:
+    """Authenticated sessions created from ``/self/authentication`` responses.
+
+    A session keeps the ``base64EncodedAuthenticationKey`` and the user context
+    (client ids, permissions, roles) returned at login, so later tool calls can pass
+    the session handle instead of credentials and skip rediscovering their client id.
+    Sessions expire after ``ttl`` seconds without use.
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_sessions: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._clock = clock
+        self._sessions: Dict[str, Session] = {}
+        self._expires: Dict[str, float] = {}
+
+    def create(self, username: str, login_response: Dict[str, Any], tenant: str = DEFAULT_TENANT) -> Session:
+        """Start a session from a successful login response against ``tenant``."""
+        self._purge()
+        while len(self._sessions) >= self.max_sessions:
+            oldest = min(self._expires, key=self._expires.__getitem__)
+            self.end(oldest)
+
+        session = Session(
+            session_id=SESSION_PREFIX + secrets.token_urlsafe(24),
+            username=login_response.get("username") or username,
+            auth_key=login_response["base64EncodedAuthenticationKey"],
+            client_ids=[int(client_id) for client_id in login_response.get("clients") or []],
+            user_id=login_response.get("userId"),
+            permissions=list(login_response.get("permissions") or []),
+            roles=[role.get("name") if isinstance(role, dict) else role for role in login_response.get("roles") or []],
+            created_at=self._clock(),
+            tenant=tenant,
+        )
+        self._sessions[session.session_id] = session
+        self._expires[session.session_id] = self._clock() + self.ttl
+        return session
+
+    def get(self, session_id: str) -> Session:
+        """Return a live session and extend its expiry; raise ``SessionError`` otherwise."""
+        session = self._sessions.get(session_id)
+        now = self._clock()
+        if session is None or self._expires[session_id] <= now:
+            self.end(session_id)
+            raise SessionError("Unknown or expired session; call login again")
+        self._expires[session_id] = now + self.ttl
+        return session
+
+    def expires_in(self, session_id: str) -> float:
+        return max(0.0, self._expires.get(session_id, 0.0) - self._clock())
+
+    def end(self, session_id: str) -> bool:
+        self._expires.pop(session_id, None)
+        return self._sessions.pop(session_id, None) is not None
+
+    def _purge(self) -> None:
+        now = self._clock()
+        for session_id in [sid for sid, expires_at in self._expires.items() if expires_at <= now]:
+            self.end(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+def describe(session: Session, expires_in: float) -> Dict[str, Any]:
+    """Session details safe to show to the agent (the authentication key is left out)."""
+    return {
+        "sessionId": session.session_id,
+        "username": session.username,
+        "tenant": session.tenant,
+        "clientId": session.client_ids[0] if session.client_ids else None,
+        "clients": session.client_ids,
+        "userId": session.user_id,
+        "roles": session.roles,
+        "permissions": session.permissions,
+        "expiresIn": round(expires_in),
+    }
@@ -0,0 +1,152 @@
+import importlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from utils.metrics import Labels, registry
+
+logger = logging.getLogger(__name__)
+
+# Modules whose import registers the MCP tools and resources, in registration order
+TOOL_MODULES = (
+    "routers.auth_tools",
+    "routers.client_tools",
+    "routers.beneficiary_tools",
+    "routers.transfer_tools",
+    "routers.loan_tools",
+    "routers.savings_tools",
+    "routers.guarantor_tools",
+    "routers.shares_tools",
+    "routers.notification_tools",
+    "routers.history_tools",
+    "routers.analytics_tools",
+    "routers.continuation_tools",
+)
+RESOURCE_MODULES = (
+    "resources.overview",
+    "resources.endpoints",
+    "resources.workflows",
+    "resources.metrics",
+)
+
+# Tool names, descriptions and argument schemas, so tools can be listed before their modules load
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "routers", "manifest.json")
+
+
+class StartupProfile:
+    """Milestones of server startup and the import time of each tool and resource module.
+
+    Times are milliseconds since this module was imported, which main.py does first.
+    A module's import time includes the dependencies it is the first to import.
+    Modules that lazy registration loads on a tool's first call are kept apart
+    as ``deferred``.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.started_at = clock()
+        self.mode = "eager"
+        self.milestones: Dict[str, float] = {}
+        self.modules: Dict[str, float] = {}
+        self.deferred: Dict[str, float] = {}
+
+    def _elapsed_ms(self, since: float) -> float:
+        return round((self._clock() - since) * 1000, 2)
+
+    def mark(self, milestone: str) -> bool:
+        """Record ``milestone`` the first time it is reached; returns whether it was new."""
+        if milestone in self.milestones:
+            return False
+        self.milestones[milestone] = self._elapsed_ms(self.started_at)
+        return True
+
+    def import_module(self, name: str, deferred: bool = False) -> Any:
+        started_at = self._clock()
+        module = importlib.import_module(name)
+        timings = self.deferred if deferred else self.modules
+        timings.setdefault(name, self._elapsed_ms(started_at))
+        return module
+
+    def report(self) -> Dict[str, Any]:
+        def slowest_first(timings: Dict[str, float]) -> Dict[str, float]:
+            return dict(sorted(timings.items(), key=lambda item: item[1], reverse=True))
+
+        return {
+            "mode": self.mode,
+            "milestones_ms": dict(self.milestones),
+            "modules_ms": slowest_first(self.modules),
+            "deferred_modules_ms": slowest_first(self.deferred),
+        }
+
+    def collect(self) -> Iterable[Tuple[str, str, str, Labels, float]]:
+        for milestone, ms in self.milestones.items():
+            labels = (("milestone", milestone), ("mode", self.mode))
+            yield "mifos_startup_seconds", "gauge", "Seconds from startup to each milestone", labels, ms / 1000
+        for deferred, timings in (("false", self.modules), ("true", self.deferred)):
+            for module, ms in timings.items():
+                labels = (("deferred", deferred), ("module", module))
+                yield "mifos_module_import_seconds", "gauge", "Import time of tool modules", labels, ms / 1000
+
+
+profile = StartupProfile()
+registry.register_collector(profile.collect)
+
+
+def build_manifest(server: Any) -> List[Dict[str, Any]]:
+    """Metadata of every tool, importing all tool modules to register them."""
+    for module in TOOL_MODULES:
+        importlib.import_module(module)
+    return [
+        {
+            "name": tool.name,
+            "module": tool.fn.__module__,
+            "description": tool.description,
+            "parameters": tool.parameters,
+        }
+        for tool in server._tool_manager.list_tools()
+    ]
+
+
+def write_manifest(server: Any, path: str = MANIFEST_PATH) -> List[Dict[str, Any]]:
+    manifest = build_manifest(server)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return manifest
+
+
+def load_manifest(path: str = MANIFEST_PATH) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def register_tools(server: Any, lazy: bool = False) -> None:
+    """Register the tools of ``TOOL_MODULES`` on ``server``.
+
+    Lazy registration adds the manifest's tools without importing their modules;
+    each module (and whatever it imports) loads on the first call of one of its
+    tools. Modules missing from the manifest are still imported up front.
+    """
+    manifest: List[Dict[str, Any]] = []
+    if lazy:
+        try:
+            manifest = load_manifest()
+        except (OSError, ValueError) as e:
+            logger.warning("Cannot read the tool manifest %s (%s); registering tools eagerly", MANIFEST_PATH, e)
+            lazy = False
+
+    profile.mode = "lazy" if lazy else "eager"
+    listed = {entry["module"] for entry in manifest}
+    for entry in manifest:
+        server.add_lazy_tool(entry["name"], entry["module"], entry["description"], entry["parameters"])
+    for module in TOOL_MODULES:
+        if module not in listed:
+            profile.import_module(module)
+    profile.mark("tools_registered")
+
+
+def register_resources() -> None:
+    for module in RESOURCE_MODULES:
+        profile.import_module(module)
+    profile.mark("resources_registered")
@@ -0,0 +1,265 @@
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config.config import TRANSACTION_STORE_PATH, TRANSACTION_STORE_SECRET
+from utils.fineract import enum_value, is_cash_movement, parse_date, transaction_direction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    tenant TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    source TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    txn_id INTEGER NOT NULL,
+    txn_date TEXT,
+    type TEXT,
+    direction TEXT NOT NULL,
+    amount REAL NOT NULL,
+    running_balance REAL,
+    reversed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (tenant, owner, source, account_id, txn_id)
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (tenant, owner, txn_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    tenant TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    source TEXT NOT NULL,
+    account_id INTEGER NOT NULL,
+    last_txn_id INTEGER NOT NULL,
+    last_date TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (tenant, owner, source, account_id)
+);
+"""
+
+# Bumped when stored rows cannot be carried over; older rows are dropped on open.
+# 1: owners are an HMAC of the credentials instead of their plain SHA-256.
+SCHEMA_VERSION = 1
+
+
+def _load_secret(path: str) -> bytes:
+    """The key of the store at ``path``, kept in ``<path>.key`` (created on first use, owner-only)."""
+    if path == ":memory:":
+        return secrets.token_bytes(32)
+    key_path = f"{path}.key"
+    if not os.path.exists(key_path):
+        # Written aside and linked into place, so concurrent workers all end up with the first key
+        staged = f"{key_path}.{os.getpid()}"
+        fd = os.open(staged, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(32))
+        try:
+            os.link(staged, key_path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(staged)
+    with open(key_path, "rb") as f:
+        return f.read()
+
+
+class TransactionStore:
+    """Embedded SQLite (WAL) store of client, savings and loan transactions.
+
+    Rows are partitioned by tenant and owner (see ``owner``), so a user can only
+    ever query what was synced with their own login. All methods are blocking;
+    call them through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str, secret: str = ""):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._secret = secret.encode() if secret else _load_secret(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            with self._conn:
+                self._conn.execute("DELETE FROM transactions")
+                self._conn.execute("DELETE FROM sync_state")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def owner(self, tenant: str, auth: str) -> str:
+        """Opaque owner of the rows fetched with the Authorization header ``auth``.
+
+        An HMAC under the store's key: the file alone does not allow checking
+        guesses of the credentials.
+        """
+        return hmac.new(self._secret, f"{tenant}:{auth}".encode(), hashlib.sha256).hexdigest()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def watermark(self, tenant: str, owner: str, source: str, account_id: int) -> Tuple[int, Optional[str]]:
+        """Last synced ``(txn_id, date)`` for an account, ``(0, None)`` before the first sync."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_txn_id, last_date FROM sync_state"
+                " WHERE tenant = ? AND owner = ? AND source = ? AND account_id = ?",
+                (tenant, owner, source, account_id),
+            ).fetchone()
+        return (row["last_txn_id"], row["last_date"]) if row else (0, None)
+
+    def add_transactions(
+        self,
+        tenant: str,
+        owner: str,
+        source: str,
+        account_id: int,
+        transactions: Iterable[Dict[str, Any]],
+    ) -> int:
+        """Insert transactions newer than the account's watermark; returns the number added.
+
+        Transactions already stored only have their ``reversed`` flag refreshed, so a
+        reversal made after an earlier sync stops counting. Non-cash entries
+        (accruals, waivers, write-offs) are not stored.
+        """
+        last_id, last_date = self.watermark(tenant, owner, source, account_id)
+        rows = []
+        reversals = []
+        for txn in transactions:
+            txn_id = txn.get("id") or 0
+            if txn_id <= last_id:
+                if "reversed" in txn:
+                    flag = int(bool(txn["reversed"]))
+                    reversals.append((flag, tenant, owner, source, account_id, txn_id, flag))
+                continue
+            if not is_cash_movement(txn):
+                continue
+            txn_date = parse_date(txn.get("date"))
+            rows.append(
+                (
+                    tenant,
+                    owner,
+                    source,
+                    account_id,
+                    txn_id,
+                    txn_date.isoformat() if txn_date else None,
+                    enum_value(txn.get("transactionType") or txn.get("type")),
+                    transaction_direction(txn, source),
+                    float(txn.get("amount") or 0),
+                    txn.get("runningBalance"),
+                    int(bool(txn.get("reversed", False))),
+                )
+            )
+
+        if rows:
+            last_id = max(row[4] for row in rows)
+            last_date = max((row[5] for row in rows if row[5]), default=last_date)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "UPDATE transactions SET reversed = ?"
+                " WHERE tenant = ? AND owner = ? AND source = ? AND account_id = ? AND txn_id = ? AND reversed != ?",
+                reversals,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (tenant, owner, source, account_id, last_id, last_date, time.time()),
+            )
+        return len(rows)
+
+    def _where(
+        self,
+        tenant: str,
+        owner: str,
+        from_date: Optional[str],
+        to_date: Optional[str],
+        source: Optional[str],
+        direction: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        clauses = ["tenant = ?", "owner = ?", "reversed = 0"]
+        params: List[Any] = [tenant, owner]
+        for clause, value in (
+            ("txn_date >= ?", from_date),
+            ("txn_date <= ?", to_date),
+            ("source = ?", source),
+            ("direction = ?", direction),
+        ):
+            if value:
+                clauses.append(clause)
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def spending(
+        self,
+        tenant: str,
+        owner: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        source: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Total debits and credits in a window, with debits broken down by type."""
+        where, params = self._where(tenant, owner, from_date, to_date, source, None)
+        with self._lock:
+            totals = self._conn.execute(
+                f"SELECT direction, COUNT(*) AS count, SUM(amount) AS total FROM transactions WHERE {where}"
+                " GROUP BY direction",
+                params,
+            ).fetchall()
+            by_type = self._conn.execute(
+                f"SELECT type, COUNT(*) AS count, SUM(amount) AS total FROM transactions WHERE {where}"
+                " AND direction = 'debit' GROUP BY type ORDER BY total DESC",
+                params,
+            ).fetchall()
+        summary = {row["direction"]: {"count": row["count"], "total": round(row["total"], 2)} for row in totals}
+        return {
+            "debits": summary.get("debit", {"count": 0, "total": 0.0}),
+            "credits": summary.get("credit", {"count": 0, "total": 0.0}),
+            "debitsByType": [dict(row, total=round(row["total"], 2)) for row in by_type],
+        }
+
+    def transactions(
+        self,
+        tenant: str,
+        owner: str,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        source: Optional[str] = None,
+        direction: Optional[str] = None,
+        order: str = "recent",
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Transactions in a window, newest first (``recent``) or by amount (``largest``)."""
+        where, params = self._where(tenant, owner, from_date, to_date, source, direction)
+        order_by = "amount DESC" if order == "largest" else "txn_date DESC, txn_id DESC"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, account_id, txn_id, txn_date, type, direction, amount, running_balance"
+                f" FROM transactions WHERE {where} ORDER BY {order_by} LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def sync_state(self, tenant: str, owner: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, account_id, last_txn_id, last_date, synced_at FROM sync_state"
+                " WHERE tenant = ? AND owner = ? ORDER BY source, account_id",
+                (tenant, owner),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+_store: Optional[TransactionStore] = None
+
+
+def get_store() -> TransactionStore:
+    """Return the process-wide store, opening it on first use."""
+    global _store
+    if _store is None:
+        _store = TransactionStore(TRANSACTION_STORE_PATH, TRANSACTION_STORE_SECRET)
+    return _store
@@ -0,0 +1,258 @@
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import httpx
+from config.config import TRACING_EXPORTER, TRACING_JSONL_PATH, OTLP_ENDPOINT
+from utils.fineract import is_error
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("mifos_span", default=None)
+
+
+class Span:
+    """One timed operation; ``attributes`` hold phase timings and request details."""
+
+    recording = True
+
+    def __init__(self, name: str, kind: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, message: str) -> None:
+        self.error = message
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    recording = False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def current_span() -> Any:
+    """The span of the running operation, or a no-op span when not tracing."""
+    return _current_span.get() or NOOP_SPAN
+
+
+class JsonlExporter:
+    """Append finished spans, one JSON object per line, to a local file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(span.to_dict(), default=str) + "\n")
+        self._file.flush()
+
+    async def flush(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Span], service_name: str = "mifos-mcp-server") -> Dict[str, Any]:
+    """Encode spans as an OTLP/HTTP JSON ``ExportTraceServiceRequest``."""
+    encoded = []
+    for span in spans:
+        item = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 3 if span.kind == "client" else 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_id:
+            item["parentSpanId"] = span.parent_id
+        encoded.append(item)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+                "scopeSpans": [{"scope": {"name": "mifos.tracing"}, "spans": encoded}],
+            }
+        ]
+    }
+
+
+class OtlpExporter:
+    """Batch spans and POST them to an OTLP/HTTP collector (``<endpoint>/v1/traces``)."""
+
+    def __init__(self, endpoint: str, batch_size: int = 64):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.batch_size = batch_size
+        self._buffer: List[Span] = []
+        self._pending: "set[asyncio.Task[None]]" = set()
+
+    def export(self, span: Span) -> None:
+        self._buffer.append(span)
+        if len(self._buffer) >= self.batch_size:
+            batch, self._buffer = self._buffer, []
+            task = asyncio.get_running_loop().create_task(self._post(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _post(self, batch: List[Span]) -> None:
+        try:
+            async with httpx.AsyncClient(timeout=5) as client:
+                response = await client.post(self.url, json=to_otlp(batch))
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning("Dropped %d spans: OTLP export to %s failed: %s", len(batch), self.url, e)
+
+    async def flush(self) -> None:
+        batch, self._buffer = self._buffer, []
+        if batch:
+            await self._post(batch)
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+
+class Tracer:
+    """Creates spans linked through a context variable, so child tasks inherit their parent.
+
+    Without an exporter every span is a shared no-op object and tracing costs nothing.
+    """
+
+    def __init__(self, exporter: Any = None):
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Any]:
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+
+        span = Span(name, kind, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(type(e).__name__ if isinstance(e, asyncio.CancelledError) else str(e) or type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            try:
+                self.exporter.export(span)
+            except Exception as e:
+                logger.warning("Failed to export span %s: %s", name, e)
+
+    async def flush(self) -> None:
+        if self.exporter is not None:
+            await self.exporter.flush()
+
+
+def build_exporter(kind: str) -> Any:
+    if kind == "jsonl":
+        return JsonlExporter(TRACING_JSONL_PATH)
+    if kind == "otlp":
+        return OtlpExporter(OTLP_ENDPOINT)
+    if kind:
+        logger.warning("Unknown MIFOS_TRACING exporter %r; tracing is disabled", kind)
+    return None
+
+
+tracer = Tracer(build_exporter(TRACING_EXPORTER))
+
+
+def trace_tool(fn: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """Wrap an async tool in a root span that parents its upstream request spans."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with tracer.span(f"tool {name}", **{"mcp.tool": name}) as span:
+            result = await fn(*args, **kwargs)
+            if is_error(result):
+                span.set_error(f"status {result.get('status_code')}")
+            return result
+
+    return wrapper
+
+
+class PhaseRecorder:
+    """httpx ``trace`` extension callback turning httpcore events into span timings.
+
+    Records TCP connect, TLS handshake, time to first byte (request sent until the
+    response headers arrive) and body download in milliseconds. Reused keep-alive
+    connections emit no connect events and are flagged ``connection_reused``.
+    """
+
+    PHASES = {
+        "connect_tcp": "connect_ms",
+        "start_tls": "tls_ms",
+        "receive_response_headers": "ttfb_ms",
+        "receive_response_body": "body_ms",
+    }
+
+    def __init__(self, span: Any):
+        self.span = span
+        self._started: Dict[str, float] = {}
+        span.set("connection_reused", True)
+
+    async def __call__(self, event_name: str, info: Dict[str, Any]) -> None:
+        phase, _, state = event_name.rpartition(".")
+        phase = phase.rsplit(".", 1)[-1]
+        if phase == "send_request_headers" and state == "started":
+            self._started["receive_response_headers"] = time.perf_counter()
+        elif phase in self.PHASES and state == "started":
+            self._started.setdefault(phase, time.perf_counter())
+            if phase == "connect_tcp":
+                self.span.set("connection_reused", False)
+        elif phase in self.PHASES and state == "complete" and phase in self._started:
+            self.span.set(self.PHASES[phase], round((time.perf_counter() - self._started[phase]) * 1000, 3))
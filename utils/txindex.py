@@ -0,0 +1,86 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from utils.fineract import enum_value, parse_date, to_iso_date
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int]:
+    """The ``(date ordinal, transaction id)`` a ``nextCursor`` continues below; raises ``ValueError``."""
+    ordinal, _, txn_id = cursor.partition(".")
+    if not (ordinal.isdigit() and txn_id.isdigit()):
+        raise ValueError(f"invalid cursor {cursor!r}")
+    return int(ordinal), int(txn_id)
+
+
+class TransactionIndex:
+    """Queryable, newest-first index over an account's transaction history.
+
+    Built once from a full history and then queried repeatedly: date windows are
+    located by binary search and results are paged with an opaque cursor. The
+    cursor names the last transaction examined, not a position, so it stays valid
+    when the index is rebuilt with newer transactions.
+    """
+
+    def __init__(self, transactions: List[Dict[str, Any]]):
+        rows = []
+        for txn in transactions:
+            txn_date = parse_date(txn.get("date"))
+            rows.append(
+                (
+                    txn_date.toordinal() if txn_date else 0,
+                    txn.get("id") or 0,
+                    {
+                        "id": txn.get("id"),
+                        "date": to_iso_date(txn.get("date")),
+                        "type": enum_value(txn.get("transactionType") or txn.get("type")),
+                        "amount": txn.get("amount"),
+                        "runningBalance": txn.get("runningBalance"),
+                        "reversed": bool(txn.get("reversed", False)),
+                    },
+                )
+            )
+        # Ascending keys for bisect; queries walk them backwards to return newest first.
+        rows.sort(key=lambda row: (row[0], row[1]))
+        self._ordinals = [row[0] for row in rows]
+        self._keys = [(row[0], row[1]) for row in rows]
+        self._rows = [row[2] for row in rows]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def query(
+        self,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        transaction_type: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return matching transactions, newest first, and a cursor for the next page."""
+        low = bisect_left(self._ordinals, from_date.toordinal()) if from_date else 0
+        high = bisect_right(self._ordinals, to_date.toordinal()) if to_date else len(self._ordinals)
+        if cursor:
+            high = min(high, bisect_left(self._keys, decode_cursor(cursor)))
+
+        wanted_type = transaction_type.lower() if transaction_type else None
+        results: List[Dict[str, Any]] = []
+        position = high
+        while position > low and len(results) < limit:
+            position -= 1
+            row = self._rows[position]
+            amount = row["amount"] or 0
+            if wanted_type and wanted_type not in str(row["type"]).lower():
+                continue
+            if min_amount is not None and amount < min_amount:
+                continue
+            if max_amount is not None and amount > max_amount:
+                continue
+            results.append(row)
+
+        return {
+            "transactions": results,
+            "nextCursor": "%d.%d" % self._keys[position] if position > low else None,
+            "totalTransactions": len(self._rows),
+        }
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Optional, Tuple, Type
+from pydantic import ValidationError
+from schemas.common import FineractRequest
+from utils.metrics import registry
+
+registry.describe("mifos_preflight_rejections_total", "counter", "Write payloads rejected locally before any request")
+
+
+def field_errors(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Pydantic error items as ``{"field", "message"}``, with fields under their Fineract names."""
+    return [
+        {
+            "field": ".".join(str(part) for part in item["loc"]) or None,
+            "message": item["msg"].removeprefix("Value error, "),
+        }
+        for item in items
+    ]
+
+
+def check_payload(model: Type[FineractRequest], data: Any, partial: bool = False) -> Tuple[Any, List[Dict[str, Any]]]:
+    """Validate ``data`` against ``model``; returns the payload to send and the field errors.
+
+    With ``partial`` (updates), absent fields are not required and ``data`` is
+    sent as given once the fields present are valid.
+    """
+    try:
+        return model.model_validate(data).payload(), []
+    except ValidationError as e:
+        items = [item for item in e.errors() if not (partial and item["type"] == "missing")]
+        return data, field_errors(items)
+
+
+def preflight(model: Type[FineractRequest], data: Any, partial: bool = False) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Check a write payload before any network call.
+
+    Returns the payload to send, or an error dict (status 400) naming every
+    invalid field so the caller can fix them all at once.
+    """
+    payload, errors = check_payload(model, data, partial)
+    if not errors:
+        return payload, None
+    registry.inc("mifos_preflight_rejections_total", (("schema", model.__name__),))
+    summary = "; ".join(f"{item['field']}: {item['message']}" if item["field"] else item["message"] for item in errors)
+    return None, {
+        "error": True,
+        "status_code": 400,
+        "message": f"Invalid {model.__name__}, nothing was sent: {summary}",
+        "errors": errors,
+    }